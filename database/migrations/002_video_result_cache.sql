@@ -0,0 +1,9 @@
+-- ForensiVision Video Result Cache
+-- Migration: 002_video_result_cache
+-- Created: 2026-10-18
+
+-- Lookup index for the whole-video result cache: finds the most recent
+-- completed analysis with a given result_cache_key option.
+CREATE INDEX idx_analyses_result_cache_key
+    ON analyses ((options->>'result_cache_key'), processing_completed_at DESC)
+    WHERE status = 'completed';
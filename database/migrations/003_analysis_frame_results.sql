@@ -0,0 +1,17 @@
+-- ForensiVision Columnar Frame Results
+-- Migration: 003_analysis_frame_results
+-- Created: 2026-10-18
+
+-- Per-frame video results, stored as parallel arrays in fixed time windows
+-- instead of a JSON list inside analysis_results.video_analysis. Range
+-- queries read only the windows overlapping the requested interval.
+CREATE TABLE analysis_frame_results (
+    analysis_id UUID NOT NULL REFERENCES analyses(id) ON DELETE CASCADE,
+    window_index INTEGER NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    timestamps REAL[] NOT NULL,
+    ai_probabilities REAL[] NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (analysis_id, window_index)
+);
@@ -0,0 +1,15 @@
+-- ForensiVision Long-Video Checkpoints
+-- Migration: 004_analysis_checkpoints
+-- Created: 2026-10-18
+
+-- Progress of long-video analyses processed in fixed timeline segments.
+-- Each completed segment's frame windows (analysis_frame_results) and this
+-- row are committed together, so a redelivered job resumes after the last
+-- completed segment instead of starting over. The row is removed once the
+-- final result is stored.
+CREATE TABLE analysis_checkpoints (
+    analysis_id UUID PRIMARY KEY REFERENCES analyses(id) ON DELETE CASCADE,
+    segments_completed INTEGER NOT NULL DEFAULT 0,
+    state JSONB NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
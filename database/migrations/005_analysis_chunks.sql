@@ -0,0 +1,40 @@
+-- ForensiVision Sharded Video Analysis
+-- Migration: 005_analysis_chunks
+-- Created: 2026-10-18
+
+-- Join record for a video job split into time-range chunks. Each chunk
+-- worker bumps completed_chunks when it finishes, and the coordinator clears
+-- audio_pending once it has scored the audio track; whichever brings the
+-- join to completion runs the final aggregation.
+CREATE TABLE analysis_fanouts (
+    analysis_id UUID PRIMARY KEY REFERENCES analyses(id) ON DELETE CASCADE,
+    total_chunks INTEGER NOT NULL,
+    completed_chunks INTEGER NOT NULL DEFAULT 0,
+    video_info JSONB NOT NULL,
+    audio_pending BOOLEAN NOT NULL DEFAULT FALSE,
+    audio_analysis JSONB,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    finalized_at TIMESTAMP WITH TIME ZONE
+);
+
+-- One row per chunk sub-job. issued_at is when the chunk was last
+-- published, so chunks that sit unfinished past the straggler timeout can be
+-- re-issued to another worker; the first completion wins.
+CREATE TABLE analysis_chunks (
+    analysis_id UUID NOT NULL REFERENCES analyses(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL,
+    start_seconds REAL NOT NULL,
+    end_seconds REAL NOT NULL,
+    max_frames INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',  -- pending, processing, completed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id VARCHAR(100),
+    face_tracking JSONB,
+    issued_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    completed_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (analysis_id, chunk_index)
+);
+
+CREATE INDEX idx_analysis_chunks_unfinished ON analysis_chunks(issued_at)
+    WHERE status <> 'completed';
@@ -0,0 +1,13 @@
+-- ForensiVision Analyses Listing Index
+-- Migration: 006_analyses_listing_index
+-- Created: 2026-10-18
+
+-- Keyset pagination for GET /v1/results: pages walk (created_at, id)
+-- downwards within a user, and the included columns are everything the
+-- listing shows, so each page is an index-only scan however deep it is.
+CREATE INDEX idx_analyses_user_created
+    ON analyses (user_id, created_at DESC, id DESC)
+    INCLUDE (type, status, file_name);
+
+-- Covered by the leading column of idx_analyses_user_created
+DROP INDEX IF EXISTS idx_analyses_user;
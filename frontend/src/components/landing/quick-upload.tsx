@@ -13,7 +13,9 @@ import {
   extractYouTubeId,
   submitDemoVideoAnalysis,
   getDemoAnalysisStatus,
+  streamDemoAnalysisStatus,
   DemoAnalysisError,
+  DemoVideoAnalysisResponse,
   DemoVideoStage,
   getDemoStageLabel,
   mapBackendStageToDemoStage,
@@ -84,16 +86,24 @@ export function QuickUpload() {
     progress: 0,
   });
   const pollIntervalRef = useRef<NodeJS.Timeout | null>(null);
+  const closeStreamRef = useRef<(() => void) | null>(null);
 
   const { status: detectorStatus, detect, loadModel } = useAIDetector();
 
-  // Cleanup polling on unmount
+  const stopTracking = () => {
+    if (closeStreamRef.current) {
+      closeStreamRef.current();
+      closeStreamRef.current = null;
+    }
+    if (pollIntervalRef.current) {
+      clearInterval(pollIntervalRef.current);
+      pollIntervalRef.current = null;
+    }
+  };
+
+  // Cleanup status stream and polling on unmount
   useEffect(() => {
-    return () => {
-      if (pollIntervalRef.current) {
-        clearInterval(pollIntervalRef.current);
-      }
-    };
+    return stopTracking;
   }, []);
 
   const onDrop = useCallback(async (acceptedFiles: File[]) => {
@@ -178,65 +188,66 @@ export function QuickUpload() {
 
       setVideoProgress({ stage: 'downloading', progress: 5 });
 
-      // Poll for progress every 500ms
-      pollIntervalRef.current = setInterval(async () => {
-        try {
-          const statusResponse = await getDemoAnalysisStatus(analysisId);
-          const attrs = statusResponse.data.attributes;
-
-          // Map backend stage to frontend stage
-          const stage = mapBackendStageToDemoStage(attrs.current_stage, attrs.status);
-          setVideoProgress({
-            stage,
-            progress: attrs.progress,
-          });
-
-          // Check if completed
-          if (attrs.status === 'completed' && attrs.results) {
-            // Clear polling
-            if (pollIntervalRef.current) {
-              clearInterval(pollIntervalRef.current);
-              pollIntervalRef.current = null;
-            }
-
-            const videoAnalysis = attrs.results.video_analysis;
-            const analysisResult: AnalysisResult = {
-              verdict: attrs.results.verdict,
-              confidence: attrs.results.confidence,
-              summary: attrs.results.summary,
-              isVideo: true,
-              frameResults: videoAnalysis?.frame_results,
-              framesAnalyzed: videoAnalysis?.frames_analyzed,
-            };
-
-            setResult(analysisResult);
-            setState('complete');
-            setVideoProgress({ stage: 'complete', progress: 100 });
-          }
+      const handleStatus = (statusResponse: DemoVideoAnalysisResponse) => {
+        const attrs = statusResponse.data.attributes;
+
+        // Map backend stage to frontend stage
+        const stage = mapBackendStageToDemoStage(attrs.current_stage, attrs.status);
+        setVideoProgress({
+          stage,
+          progress: attrs.progress,
+        });
+
+        // Check if completed
+        if (attrs.status === 'completed' && attrs.results) {
+          stopTracking();
+
+          const videoAnalysis = attrs.results.video_analysis;
+          const analysisResult: AnalysisResult = {
+            verdict: attrs.results.verdict,
+            confidence: attrs.results.confidence,
+            summary: attrs.results.summary,
+            isVideo: true,
+            frameResults: videoAnalysis?.frame_results,
+            framesAnalyzed: videoAnalysis?.frames_analyzed,
+          };
+
+          setResult(analysisResult);
+          setState('complete');
+          setVideoProgress({ stage: 'complete', progress: 100 });
+        }
 
-          // Check if failed
-          if (attrs.status === 'failed') {
-            if (pollIntervalRef.current) {
-              clearInterval(pollIntervalRef.current);
-              pollIntervalRef.current = null;
-            }
+        // Check if failed
+        if (attrs.status === 'failed') {
+          stopTracking();
 
-            setError(attrs.error?.message || 'Video analysis failed');
-            setState('error');
-            setVideoProgress({ stage: 'error', progress: 0 });
-          }
-        } catch (pollErr) {
-          console.error('Polling error:', pollErr);
-          // Don't clear interval on transient errors, just log
+          setError(attrs.error?.message || 'Video analysis failed');
+          setState('error');
+          setVideoProgress({ stage: 'error', progress: 0 });
         }
-      }, 500);
+      };
+
+      // Poll for progress every 500ms
+      const startPolling = () => {
+        pollIntervalRef.current = setInterval(async () => {
+          try {
+            handleStatus(await getDemoAnalysisStatus(analysisId));
+          } catch (pollErr) {
+            console.error('Polling error:', pollErr);
+            // Don't clear interval on transient errors, just log
+          }
+        }, 500);
+      };
+
+      // Stream progress, falling back to polling if streaming is unavailable
+      closeStreamRef.current = streamDemoAnalysisStatus(analysisId, handleStatus, () => {
+        closeStreamRef.current = null;
+        startPolling();
+      });
 
     } catch (err) {
       console.error('Video analysis failed:', err);
-      if (pollIntervalRef.current) {
-        clearInterval(pollIntervalRef.current);
-        pollIntervalRef.current = null;
-      }
+      stopTracking();
 
       if (err instanceof DemoAnalysisError) {
         if (err.code === 'RATE_LIMIT_EXCEEDED') {
@@ -255,11 +266,8 @@ export function QuickUpload() {
   };
 
   const reset = () => {
-    // Clear polling interval
-    if (pollIntervalRef.current) {
-      clearInterval(pollIntervalRef.current);
-      pollIntervalRef.current = null;
-    }
+    // Stop following the analysis
+    stopTracking();
 
     setState('idle');
     setFile(null);
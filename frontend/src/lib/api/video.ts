@@ -290,6 +290,44 @@ export async function getDemoAnalysisStatus(
   return response.json();
 }
 
+const TERMINAL_STATUSES = ['completed', 'failed', 'cancelled'];
+
+/**
+ * Stream a demo analysis's status as server-sent events.
+ *
+ * Calls onUpdate with each status document and closes the stream once the
+ * analysis finishes. Calls onError if the stream can't be established, so
+ * the caller can fall back to polling. Returns a function that closes it.
+ */
+export function streamDemoAnalysisStatus(
+  analysisId: string,
+  onUpdate: (response: DemoVideoAnalysisResponse) => void,
+  onError: () => void
+): () => void {
+  const source = new EventSource(`/api/v1/demo/analysis/${analysisId}/events`);
+
+  const handleEvent = (event: MessageEvent) => {
+    const response: DemoVideoAnalysisResponse = JSON.parse(event.data);
+    // The server ends the stream here; stop EventSource reconnecting
+    if (TERMINAL_STATUSES.includes(response.data.attributes.status)) {
+      source.close();
+    }
+    onUpdate(response);
+  };
+  for (const name of ['status', 'progress', 'result']) {
+    source.addEventListener(name, handleEvent as EventListener);
+  }
+
+  source.onerror = () => {
+    // EventSource retries dropped connections itself; CLOSED means it gave up
+    if (source.readyState === EventSource.CLOSED) {
+      onError();
+    }
+  };
+
+  return () => source.close();
+}
+
 export class DemoAnalysisError extends Error {
   code: string;
   retryAfterSeconds?: number;
@@ -1,11 +1,27 @@
+import asyncio
+import base64
+import json
+import logging
 from typing import Optional
 from uuid import UUID
 
 import httpx
+import jwt
 from fastapi import Depends, HTTPException, Header, status
 from pydantic import BaseModel
 
+from src.api.credential_cache import CredentialCache, credential_hash
+from src.core import queries
+from src.core.auth_client import get_auth_client
 from src.core.config import settings
+from src.core.database import get_db
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Must match APIKeyRevocationChannel in the auth service
+API_KEY_REVOCATION_CHANNEL = "auth:api_key_revocations"
+REVOCATION_RETRY_SECONDS = 1.0
 
 
 class UserContext(BaseModel):
@@ -16,6 +32,12 @@ class UserContext(BaseModel):
     tier: str
     organization_id: Optional[UUID] = None
     scopes: list[str] = []
+    api_key_id: Optional[UUID] = None  # Set when authenticated with an API key
+    rate_limit: Optional[int] = None  # The API key's requests per minute
+
+
+# Validated credentials, keyed by token hash
+credential_cache: CredentialCache[UserContext] = CredentialCache(UserContext)
 
 
 async def get_current_user(
@@ -24,7 +46,9 @@ async def get_current_user(
     """
     Validate authorization header and return user context.
 
-    This calls the auth service to validate the token/API key.
+    JWTs are verified locally and API keys are looked up by hash in the
+    database, so the auth service stays off the request path. With
+    auth_verify_locally off, both go to the auth service instead.
     """
     if not authorization:
         raise HTTPException(
@@ -52,73 +76,196 @@ async def get_current_user(
 
 
 async def _validate_jwt(token: str) -> UserContext:
-    """Validate JWT token with auth service."""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.auth_service_url}/v1/internal/validate",
-                json={"token": token},
-                timeout=5.0,
-            )
+    """Validate JWT token, locally or with the auth service."""
+    if settings.auth_verify_locally:
+        # Signature checks are cheaper than a cache lookup
+        return _verify_jwt(token)
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail={"code": "INVALID_TOKEN", "message": "Invalid or expired token"},
-                )
-
-            data = response.json()
-            claims = data.get("claims", {})
-
-            return UserContext(
-                user_id=UUID(claims["sub"]),
-                email=claims.get("email", ""),
-                tier=claims.get("tier", "free"),
-                organization_id=UUID(claims["org_id"]) if claims.get("org_id") else None,
-                scopes=claims.get("scope", "").split() if claims.get("scope") else [],
-            )
+    cached = await credential_cache.get(token)
+    if cached is not None:
+        return cached
 
-    except httpx.RequestError as e:
+    client = await get_auth_client()
+    try:
+        response = await client.post("/v1/internal/validate", json={"token": token})
+    except httpx.RequestError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={"code": "AUTH_UNAVAILABLE", "message": "Authentication service unavailable"},
         )
 
+    if response.status_code != 200:
+        raise _invalid_token()
 
-async def _validate_api_key(key: str) -> UserContext:
-    """Validate API key with auth service."""
+    data = response.json()
+    user = _user_from_claims(data.get("claims", {}))
+    await credential_cache.set(token, user, expires_at=_jwt_expiry(token))
+    return user
+
+
+def _verify_jwt(token: str) -> UserContext:
+    """Verify an access token's signature and claims with the shared secret."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.auth_service_url}/v1/internal/validate-api-key",
-                json={"key": key},
-                timeout=5.0,
-            )
+        claims = jwt.decode(
+            token,
+            settings.jwt_secret,
+            algorithms=["HS256"],
+            audience=settings.jwt_audience,
+            issuer=settings.jwt_issuer,
+            options={"require": ["exp", "sub"]},
+        )
+    except jwt.PyJWTError:
+        raise _invalid_token()
+
+    if claims.get("type") != "access":
+        raise _invalid_token()
+
+    try:
+        return _user_from_claims(claims)
+    except ValueError:
+        raise _invalid_token()
+
+
+def _user_from_claims(claims: dict) -> UserContext:
+    scopes = claims.get("scope") or []
+    return UserContext(
+        user_id=UUID(claims["sub"]),
+        email=claims.get("email", ""),
+        tier=claims.get("tier", "free"),
+        organization_id=UUID(claims["org_id"]) if claims.get("org_id") else None,
+        scopes=scopes.split() if isinstance(scopes, str) else scopes,
+    )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail={"code": "INVALID_API_KEY", "message": "Invalid API key"},
-                )
-
-            data = response.json()
-            api_key = data.get("api_key", {})
-            user = data.get("user", {})
-
-            return UserContext(
-                user_id=UUID(user["id"]),
-                email=user.get("email", ""),
-                tier=user.get("tier", "free"),
-                organization_id=UUID(user["organization_id"]) if user.get("organization_id") else None,
-                scopes=api_key.get("scopes", []),
-            )
 
-    except httpx.RequestError as e:
+async def _validate_api_key(key: str) -> UserContext:
+    """Validate API key against the api_keys table, or with the auth service."""
+    cached = await credential_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if settings.auth_verify_locally:
+        return await _lookup_api_key(key)
+
+    client = await get_auth_client()
+    try:
+        response = await client.post("/v1/internal/validate-api-key", json={"key": key})
+    except httpx.RequestError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={"code": "AUTH_UNAVAILABLE", "message": "Authentication service unavailable"},
         )
 
+    if response.status_code != 200:
+        raise _invalid_api_key()
+
+    data = response.json()
+    api_key = data.get("api_key", {})
+    user = data.get("user", {})
+
+    context = UserContext(
+        user_id=UUID(user["id"]),
+        email=user.get("email", ""),
+        tier=user.get("tier", "free"),
+        organization_id=UUID(user["organization_id"]) if user.get("organization_id") else None,
+        scopes=api_key.get("scopes", []),
+        api_key_id=UUID(api_key["id"]) if api_key.get("id") else None,
+        rate_limit=api_key.get("rate_limit"),
+    )
+    await credential_cache.set(key, context)
+    return context
+
+
+async def _lookup_api_key(key: str) -> UserContext:
+    """
+    Look up a live API key by hash and record its use.
+
+    The auth service stores keys as the hex SHA-256 of the full key, which
+    is also the credential cache key.
+    """
+    db = await get_db()
+    row = await db.fetchrow(
+        queries.LOOKUP_API_KEY,
+        credential_hash(key),
+    )
+    if row is None:
+        raise _invalid_api_key()
+
+    context = UserContext(
+        user_id=row["user_id"],
+        email=row["email"],
+        tier=row["tier"],
+        organization_id=row["organization_id"],
+        scopes=list(row["scopes"]),
+        api_key_id=row["id"],
+        rate_limit=row["rate_limit"],
+    )
+    expires_at = row["expires_at"].timestamp() if row["expires_at"] else None
+    await credential_cache.set(key, context, expires_at=expires_at)
+    return context
+
+
+def _invalid_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail={"code": "INVALID_TOKEN", "message": "Invalid or expired token"},
+    )
+
+
+def _invalid_api_key() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail={"code": "INVALID_API_KEY", "message": "Invalid API key"},
+    )
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the exp claim of a JWT without verifying it.
+
+    Only used to bound how long a token the auth service just accepted
+    stays cached.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+async def invalidate_credential(token: str) -> None:
+    """Drop a cached JWT or API key, e.g. after it's revoked."""
+    await credential_cache.invalidate(token)
+
+
+async def listen_for_revocations() -> None:
+    """
+    Drop cached API keys as the auth service revokes them.
+
+    The auth service publishes each revoked key's hash on
+    API_KEY_REVOCATION_CHANNEL. Messages sent while disconnected are lost,
+    so the local cache tier is cleared on every (re)subscribe.
+    """
+    while True:
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(API_KEY_REVOCATION_CHANNEL)
+            credential_cache.clear_local()
+            try:
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    await credential_cache.invalidate_hash(message["data"])
+                    logger.info("Dropped revoked API key from credential cache")
+            finally:
+                await pubsub.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Revocation listener disconnected: {e}")
+            await asyncio.sleep(REVOCATION_RETRY_SECONDS)
+
 
 def require_scope(required_scope: str):
     """Dependency to require a specific scope."""
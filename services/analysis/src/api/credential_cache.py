@@ -0,0 +1,142 @@
+"""Two-tier cache of validated credentials: an in-process LRU over Redis."""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Generic, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def credential_hash(token: str) -> str:
+    """Cache key for a credential, so raw tokens never reach Redis."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class CredentialCache(Generic[T]):
+    """
+    Caches validated credentials so most requests skip re-validation.
+
+    The local tier is an LRU of at most max_entries with a short per-entry
+    TTL, so a hit is a dict lookup. Misses fall through to Redis, shared by
+    all replicas, before the caller validates the credential itself and
+    stores the result. No entry outlives the credential's own expiry.
+
+    invalidate() drops an entry from this process and from Redis; other
+    replicas' local copies lapse within ttl_seconds.
+    """
+
+    REDIS_PREFIX = "auth:credential:"
+
+    def __init__(
+        self,
+        model: Type[T],
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        redis_ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            model: Pydantic model the cached credentials are stored as.
+            max_entries: Local tier capacity.
+            ttl_seconds: Local tier entry lifetime.
+            redis_ttl_seconds: Redis tier entry lifetime.
+        """
+        self.model = model
+        self.max_entries = max_entries or settings.auth_cache_max_entries
+        self.ttl_seconds = ttl_seconds or settings.auth_cache_ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds or settings.auth_cache_redis_ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, T]]" = OrderedDict()
+
+    async def get(self, token: str) -> Optional[T]:
+        """Return the cached credential for token, or None on a miss."""
+        key = credential_hash(token)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline()
+            pipe.get(self.REDIS_PREFIX + key)
+            pipe.pttl(self.REDIS_PREFIX + key)
+            data, pttl = await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Credential cache unavailable: {e}")
+            return None
+
+        if data is None:
+            return None
+
+        value = self.model.model_validate_json(data)
+        ttl = self.ttl_seconds if pttl < 0 else min(self.ttl_seconds, pttl / 1000)
+        self._put_local(key, value, ttl)
+        return value
+
+    async def set(self, token: str, value: T, expires_at: Optional[float] = None) -> None:
+        """
+        Cache a credential that was just validated.
+
+        Args:
+            token: The raw credential.
+            value: What it validated to.
+            expires_at: Unix time the credential itself expires, if known.
+        """
+        ttl, redis_ttl = self.ttl_seconds, self.redis_ttl_seconds
+        if expires_at is not None:
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                return
+            ttl, redis_ttl = min(ttl, remaining), min(redis_ttl, remaining)
+
+        key = credential_hash(token)
+        self._put_local(key, value, ttl)
+
+        try:
+            redis = await get_redis()
+            await redis.set(
+                self.REDIS_PREFIX + key,
+                value.model_dump_json(),
+                px=max(1, int(redis_ttl * 1000)),
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to store credential in cache: {e}")
+
+    async def invalidate(self, token: str) -> None:
+        """Drop a credential, e.g. after it's revoked."""
+        await self.invalidate_hash(credential_hash(token))
+
+    async def invalidate_hash(self, key: str) -> None:
+        """Drop a credential by its credential_hash()."""
+        self._entries.pop(key, None)
+        try:
+            redis = await get_redis()
+            await redis.delete(self.REDIS_PREFIX + key)
+        except RedisError as e:
+            logger.warning(f"Failed to invalidate cached credential: {e}")
+
+    def clear_local(self) -> None:
+        """Empty this process's tier, e.g. after missing invalidations."""
+        self._entries.clear()
+
+    def _put_local(self, key: str, value: T, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -1,17 +1,326 @@
-"""IP-based rate limiting for demo endpoints."""
+"""Redis-backed rate limiting for authenticated and demo endpoints."""
 
 import logging
-from typing import Optional
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
-from fastapi import HTTPException, Request, status
+from fastapi import Depends, HTTPException, Request, Response, status
+from redis.exceptions import RedisError
 
+from src.api.auth import UserContext, get_current_user
+from src.core.config import settings
 from src.core.redis import get_redis
 
 logger = logging.getLogger(__name__)
 
+# GCRA (generic cell rate algorithm) in one round trip. The key holds the
+# bucket's theoretical arrival time (TAT): the bucket is empty while the TAT
+# is burst emission intervals ahead of now. Grants up to cost tokens, after
+# first returning refund unspent tokens taken earlier.
+# KEYS: bucket
+# ARGV: emission_interval_ms, burst, cost, refund
+# Returns {granted, remaining, retry_after_ms, reset_after_ms}
+_GCRA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local refund = tonumber(ARGV[4])
+
+local tat = tonumber(redis.call('GET', KEYS[1]) or 0) - interval * refund
+if tat < now then
+    tat = now
+end
+
+local available = math.floor(burst - (tat - now) / interval)
+local granted = math.min(cost, available)
+if granted < 0 then
+    granted = 0
+end
+
+local new_tat = tat + interval * granted
+if (granted > 0 or refund > 0) and new_tat > now then
+    redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+end
+
+if cost > 0 and granted == 0 then
+    return {0, 0, tat + interval * (1 - burst) - now, tat - now}
+end
+return {granted, available - granted, 0, new_tat - now}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """limit requests per period_seconds, with bursts of up to burst requests."""
+
+    limit: int
+    period_seconds: int
+    burst: int
+
+    @property
+    def policy(self) -> str:
+        return f"{self.limit};w={self.period_seconds};burst={self.burst}"
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    rate_limit: RateLimit
+    remaining: int
+    retry_after_seconds: int
+    reset_at: int  # Unix time the bucket is full again
+
+    def headers(self) -> Dict[str, str]:
+        """Standard X-RateLimit-* headers, plus Retry-After when limited."""
+        headers = {
+            "X-RateLimit-Limit": str(self.rate_limit.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self.reset_at),
+            "X-RateLimit-Policy": self.rate_limit.policy,
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(self.retry_after_seconds)
+        return headers
+
+
+# Per-minute limits match the auth service's getRateLimitForTier; bursts
+# follow the documented tier table
+TIER_RATE_LIMITS: Dict[str, RateLimit] = {
+    "free": RateLimit(limit=20, period_seconds=60, burst=30),
+    "creator": RateLimit(limit=60, period_seconds=60, burst=100),
+    "professional": RateLimit(limit=300, period_seconds=60, burst=500),
+    "business": RateLimit(limit=1000, period_seconds=60, burst=2000),
+    "enterprise": RateLimit(limit=5000, period_seconds=60, burst=10000),
+}
+
 # Demo rate limits
-DEMO_RATE_LIMIT = 3  # requests per window
-DEMO_RATE_WINDOW = 3600  # 1 hour in seconds
+DEMO_RATE_LIMIT = RateLimit(limit=3, period_seconds=3600, burst=3)
+
+_gcra_script = None
+
+
+async def _take(key: str, rate_limit: RateLimit, cost: int, refund: int = 0) -> Tuple[int, ...]:
+    """Run the GCRA script; returns (granted, remaining, retry_after_ms, reset_after_ms)."""
+    global _gcra_script
+    redis = await get_redis()
+    if _gcra_script is None:
+        _gcra_script = redis.register_script(_GCRA)
+    interval_ms = rate_limit.period_seconds * 1000 / rate_limit.limit
+    result = await _gcra_script(keys=[key], args=[interval_ms, rate_limit.burst, cost, refund])
+    return tuple(int(value) for value in result)
+
+
+def _allow_on_error(rate_limit: RateLimit, error: Exception) -> RateLimitResult:
+    # Fail open: a Redis outage shouldn't take the API down with it
+    logger.warning(f"Rate limiter unavailable, allowing request: {error}")
+    return RateLimitResult(
+        allowed=True,
+        rate_limit=rate_limit,
+        remaining=rate_limit.burst,
+        retry_after_seconds=0,
+        reset_at=int(time.time()),
+    )
+
+
+async def check_rate_limit(key: str, rate_limit: RateLimit, cost: int = 1) -> RateLimitResult:
+    """
+    Count a request against a bucket in Redis and decide whether it's allowed.
+
+    Fails open if Redis is unavailable.
+
+    Args:
+        key: Redis key of the bucket.
+        rate_limit: The limit to apply.
+        cost: Requests to count; 0 only reports the bucket's state.
+    """
+    try:
+        granted, remaining, retry_after_ms, reset_after_ms = await _take(key, rate_limit, cost)
+    except RedisError as e:
+        return _allow_on_error(rate_limit, e)
+
+    return RateLimitResult(
+        allowed=granted >= cost,
+        rate_limit=rate_limit,
+        remaining=remaining,
+        retry_after_seconds=math.ceil(retry_after_ms / 1000),
+        reset_at=math.ceil(time.time() + reset_after_ms / 1000),
+    )
+
+
+@dataclass
+class _Slice:
+    """Tokens one process has taken from a client's Redis bucket."""
+
+    rate_limit: RateLimit
+    tokens: int  # Taken from Redis and not yet spent
+    size: int  # Tokens requested at the last sync
+    expires_at: float  # Monotonic time to sync again
+    remaining: int  # Redis-side remaining at the last sync, for headers
+    reset_at: int
+    denied: bool = False
+    retry_after_seconds: int = 0
+
+
+class HybridRateLimiter:
+    """
+    Decides most requests from locally held slices of each client's quota.
+
+    Each process takes a slice of tokens from the client's Redis GCRA
+    bucket and spends them locally, syncing again when the slice runs out
+    or after sync_seconds. A sync returns unspent tokens and takes a new
+    slice in the same round trip. Slices double while a client keeps
+    spending them before they expire and halve when it doesn't, so slow
+    pollers hold one token and busy clients rarely touch Redis. A denial
+    is also served locally until a token is due.
+
+    Tokens are taken from Redis before they're spent, so the global limit
+    is never exceeded. The error is one-sided: a client can be limited
+    early by at most max_slice tokens per API process, held unspent until
+    that process's next sync.
+    """
+
+    def __init__(
+        self,
+        sync_seconds: Optional[float] = None,
+        max_slice: Optional[int] = None,
+        max_clients: Optional[int] = None,
+    ):
+        self.sync_seconds = sync_seconds or settings.rate_limit_sync_seconds
+        self.max_slice = max_slice or settings.rate_limit_max_slice
+        self.max_clients = max_clients or settings.rate_limit_local_clients
+        self._slices: "OrderedDict[str, _Slice]" = OrderedDict()
+
+    async def check(self, key: str, rate_limit: RateLimit) -> RateLimitResult:
+        """Count one request against a client's bucket."""
+        now = time.monotonic()
+        state = self._slices.get(key)
+
+        if state is not None and state.rate_limit == rate_limit and now < state.expires_at:
+            self._slices.move_to_end(key)
+            if state.tokens > 0:
+                state.tokens -= 1
+                return self._result(state, allowed=True)
+            if state.denied:
+                return self._result(state, allowed=False)
+
+        return await self._sync(key, rate_limit, state, now)
+
+    async def _sync(
+        self, key: str, rate_limit: RateLimit, state: Optional[_Slice], now: float
+    ) -> RateLimitResult:
+        refund = state.tokens if state is not None and state.rate_limit == rate_limit else 0
+        size = self._next_size(rate_limit, state, now)
+
+        try:
+            granted, remaining, retry_after_ms, reset_after_ms = await _take(
+                key, rate_limit, size, refund
+            )
+        except RedisError as e:
+            self._slices.pop(key, None)
+            return _allow_on_error(rate_limit, e)
+
+        state = _Slice(
+            rate_limit=rate_limit,
+            tokens=max(0, granted - 1),
+            size=size,
+            expires_at=now + self.sync_seconds,
+            remaining=remaining,
+            reset_at=math.ceil(time.time() + reset_after_ms / 1000),
+        )
+        if granted == 0:
+            # Nothing to hand out until the next token is due
+            state.denied = True
+            state.retry_after_seconds = math.ceil(retry_after_ms / 1000)
+            state.expires_at = now + retry_after_ms / 1000
+
+        self._slices[key] = state
+        self._slices.move_to_end(key)
+        while len(self._slices) > self.max_clients:
+            # Unspent tokens of evicted clients return to Redis on their own TTL
+            self._slices.popitem(last=False)
+
+        return self._result(state, allowed=granted > 0)
+
+    def _next_size(self, rate_limit: RateLimit, state: Optional[_Slice], now: float) -> int:
+        ceiling = max(1, min(self.max_slice, rate_limit.burst // 4))
+        if state is None or state.rate_limit != rate_limit or state.denied:
+            return 1
+        if state.tokens == 0 and now < state.expires_at:
+            return min(ceiling, state.size * 2)  # Spent before expiry: busy client
+        return max(1, min(ceiling, state.size // 2))
+
+    @staticmethod
+    def _result(state: _Slice, allowed: bool) -> RateLimitResult:
+        return RateLimitResult(
+            allowed=allowed,
+            rate_limit=state.rate_limit,
+            remaining=state.remaining + state.tokens if allowed else 0,
+            retry_after_seconds=0 if allowed else state.retry_after_seconds,
+            reset_at=state.reset_at,
+        )
+
+
+# Shared by all authenticated routes in this process
+rate_limiter = HybridRateLimiter()
+
+
+def rate_limit_for_user(user: UserContext) -> RateLimit:
+    """
+    The limit that applies to a caller.
+
+    API keys carry their own per-minute limit (api_keys.rate_limit); the
+    burst scales with it in the tier's ratio.
+    """
+    tier_limit = TIER_RATE_LIMITS.get(user.tier, TIER_RATE_LIMITS["free"])
+    if user.rate_limit is None or user.rate_limit <= 0:
+        return tier_limit
+
+    burst = max(user.rate_limit, round(user.rate_limit * tier_limit.burst / tier_limit.limit))
+    return RateLimit(limit=user.rate_limit, period_seconds=60, burst=burst)
+
+
+def rate_limit_key(user: UserContext) -> str:
+    """Bucket key: per API key when one was used, else per user."""
+    if user.api_key_id is not None:
+        return f"rate_limit:api_key:{user.api_key_id}"
+    return f"rate_limit:user:{user.user_id}"
+
+
+async def get_rate_limited_user(
+    response: Response,
+    user: UserContext = Depends(get_current_user),
+) -> UserContext:
+    """
+    Authenticate the caller and enforce their rate limit.
+
+    Sets X-RateLimit-* headers on the response; raises HTTPException 429
+    with Retry-After when the limit is exceeded.
+    """
+    result = await rate_limiter.check(rate_limit_key(user), rate_limit_for_user(user))
+
+    if not result.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={
+                "code": "RATE_LIMIT_EXCEEDED",
+                "message": (
+                    f"Rate limit exceeded. Please retry after "
+                    f"{result.retry_after_seconds} seconds."
+                ),
+                "retry_after_seconds": result.retry_after_seconds,
+            },
+            headers=result.headers(),
+        )
+
+    response.headers.update(result.headers())
+    return user
 
 
 async def get_client_ip(request: Request) -> str:
@@ -34,51 +343,34 @@ async def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
-async def check_demo_rate_limit(client_ip: str) -> None:
+async def check_demo_rate_limit(client_ip: str, response: Optional[Response] = None) -> None:
     """
     Check if the client IP has exceeded the demo rate limit.
 
     Raises HTTPException 429 if rate limit is exceeded.
     """
-    redis = await get_redis()
-    key = f"rate_limit:demo:video:{client_ip}"
-
-    # Get current count
-    current = await redis.get(key)
-
-    if current is not None:
-        count = int(current)
-        if count >= DEMO_RATE_LIMIT:
-            # Get TTL for retry-after header
-            ttl = await redis.ttl(key)
-            minutes_remaining = max(1, (ttl + 59) // 60)  # Round up to nearest minute
-
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "code": "RATE_LIMIT_EXCEEDED",
-                    "message": f"Demo limit reached. Try again in {minutes_remaining} minutes",
-                    "retry_after_seconds": ttl,
-                },
-                headers={"Retry-After": str(ttl)},
-            )
+    result = await check_rate_limit(f"rate_limit:demo:video:{client_ip}", DEMO_RATE_LIMIT)
 
-    # Increment counter with expiry
-    pipe = redis.pipeline()
-    pipe.incr(key)
-    pipe.expire(key, DEMO_RATE_WINDOW)
-    await pipe.execute()
+    if not result.allowed:
+        minutes_remaining = max(1, (result.retry_after_seconds + 59) // 60)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={
+                "code": "RATE_LIMIT_EXCEEDED",
+                "message": f"Demo limit reached. Try again in {minutes_remaining} minutes",
+                "retry_after_seconds": result.retry_after_seconds,
+            },
+            headers=result.headers(),
+        )
 
+    if response is not None:
+        response.headers.update(result.headers())
     logger.info(f"Demo rate limit check passed for {client_ip}")
 
 
 async def get_demo_rate_limit_remaining(client_ip: str) -> int:
     """Get the number of demo requests remaining for an IP."""
-    redis = await get_redis()
-    key = f"rate_limit:demo:video:{client_ip}"
-
-    current = await redis.get(key)
-    if current is None:
-        return DEMO_RATE_LIMIT
-
-    return max(0, DEMO_RATE_LIMIT - int(current))
+    result = await check_rate_limit(
+        f"rate_limit:demo:video:{client_ip}", DEMO_RATE_LIMIT, cost=0
+    )
+    return result.remaining
@@ -1,10 +1,14 @@
-from typing import Optional
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from src.api.auth import get_current_user, UserContext
-from src.api.rate_limit import check_demo_rate_limit, get_client_ip
+from src.api.auth import UserContext
+from src.api.rate_limit import check_demo_rate_limit, get_client_ip, get_rate_limited_user
+from src.core.config import settings
 from src.models.analysis import (
     AnalysisResponse,
     AnalysisStatus,
@@ -14,18 +18,41 @@ from src.models.analysis import (
     DemoVideoAnalysisRequest,
     FileInfo,
     ImageAnalysisRequest,
+    QualityTier,
     VideoAnalysisRequest,
 )
+from src.services.analysis_events import analysis_events
 from src.services.analysis_service import analysis_service, DEMO_USER_ID
+from src.services.demo_admission import DemoAdmissionRejected, demo_admission
 from src.services.video_service import video_service, VideoValidationError
 
 router = APIRouter()
 
+# Statuses after which an analysis never changes again
+TERMINAL_STATUSES = {
+    AnalysisStatus.COMPLETED.value,
+    AnalysisStatus.FAILED.value,
+    AnalysisStatus.CANCELLED.value,
+}
+
+# Longest a status request may long-poll with ?wait=
+MAX_WAIT_SECONDS = 60
+
+# The subset of results the public demo returns
+DEMO_RESULT_FIELDS = (
+    "verdict",
+    "confidence",
+    "risk_level",
+    "summary",
+    "ensemble_score",
+    "video_analysis",
+)
+
 
 @router.post("/analyze/image", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
 async def analyze_image(
     request: ImageAnalysisRequest,
-    user: UserContext = Depends(get_current_user),
+    user: UserContext = Depends(get_rate_limited_user),
     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
     """
@@ -76,7 +103,7 @@ async def analyze_image(
 @router.post("/analyze/video", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
 async def analyze_video(
     request: VideoAnalysisRequest,
-    user: UserContext = Depends(get_current_user),
+    user: UserContext = Depends(get_rate_limited_user),
 ):
     """
     Analyze a video for deepfakes and AI manipulation.
@@ -90,24 +117,52 @@ async def analyze_video(
     - Temporal consistency analysis
     - Suspicious segment identification
 
+    Quality tiers (quality or options.quality):
+    - fast: 0.5 fps, up to 480p, reduced detector set, early exit
+    - standard (default): 1 fps, up to 720p, all detectors
+    - thorough: 2 fps, up to 1080p, all detectors
+
+    Long videos (options.long_video = true) are processed in checkpointed
+    segments, so a worker failure resumes from the last completed segment.
+
     Limits:
-    - Maximum video duration: 5 minutes
-    - Maximum resolution: 720p
+    - Maximum video duration: 5 minutes (2 hours with options.long_video)
     - Rate limit: 10 videos/hour/user
     """
+    options = dict(request.options or {})
+    try:
+        quality = QualityTier(request.quality or options.get("quality") or QualityTier.STANDARD)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": "INVALID_QUALITY",
+                "message": "quality must be one of: fast, standard, thorough",
+            },
+        )
+    options["quality"] = quality.value
+
     # Validate YouTube URL if source type is youtube
     source_type = request.source.get("type")
     if source_type == "youtube":
         youtube_url = request.source.get("url")
         try:
             video_id = video_service.validate_youtube_url(youtube_url)
+            # Reject unavailable or over-long videos before queueing
+            await video_service.validate_video(
+                video_id, long_video=bool(options.get("long_video"))
+            )
             # Normalize the URL for consistent storage
             normalized_url = video_service.get_youtube_url_from_id(video_id)
             request.source["url"] = normalized_url
             request.source["video_id"] = video_id
         except VideoValidationError as e:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=(
+                    status.HTTP_503_SERVICE_UNAVAILABLE
+                    if e.retryable
+                    else status.HTTP_400_BAD_REQUEST
+                ),
                 detail={"code": e.code, "message": e.message},
             )
 
@@ -119,7 +174,7 @@ async def analyze_video(
         user_id=user.user_id,
         organization_id=user.organization_id,
         source=request.source,
-        options=request.options,
+        options=options,
         webhook_url=webhook_url,
         priority=request.priority,
         metadata=request.metadata,
@@ -147,7 +202,7 @@ async def analyze_video(
 @router.post("/analyze/batch", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
 async def analyze_batch(
     request: BatchAnalysisRequest,
-    user: UserContext = Depends(get_current_user),
+    user: UserContext = Depends(get_rate_limited_user),
 ):
     """
     Submit multiple files for batch analysis.
@@ -167,6 +222,7 @@ async def analyze_batch(
         items=items,
         options=request.options,
         webhook_url=webhook_url,
+        priority=request.priority,
         metadata=request.metadata,
     )
 
@@ -195,80 +251,155 @@ async def analyze_batch(
 @router.get("/analysis/{analysis_id}", response_model=dict)
 async def get_analysis(
     analysis_id: UUID,
-    user: UserContext = Depends(get_current_user),
+    wait: Optional[int] = Query(
+        None,
+        ge=1,
+        le=MAX_WAIT_SECONDS,
+        description="Seconds to wait for a status or stage change",
+    ),
+    user: UserContext = Depends(get_rate_limited_user),
 ):
-    """Get the status and results of an analysis."""
-    analysis = await analysis_service.get_analysis(analysis_id, user.user_id)
+    """
+    Get the status and results of an analysis.
 
-    if not analysis:
+    With wait, long-polls: responds as soon as the status or stage differs
+    from when the request arrived, or with the current state after wait
+    seconds. Finished analyses respond immediately.
+    """
+    if wait:
+        snapshot = await _wait_for_status_change(analysis_id, user.user_id, wait)
+    else:
+        snapshot = await analysis_service.get_status_snapshot(analysis_id, user.user_id)
+
+    if not snapshot:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "NOT_FOUND", "message": "Analysis not found"},
+        )
+
+    return await _analysis_data(*snapshot)
+
+
+@router.get("/analysis/{analysis_id}/events")
+async def stream_analysis_events(
+    analysis_id: UUID,
+    request: Request,
+    user: UserContext = Depends(get_rate_limited_user),
+):
+    """
+    Stream an analysis's status as server-sent events.
+
+    Each event carries the same document as GET /v1/analysis/{id}. The
+    first event is the current state; after that, "status" events mark
+    status changes, "progress" events mark progress within a status, and a
+    completed analysis ends with a "result" event including its results.
+    The stream closes once the analysis completes, fails or is cancelled.
+    """
+    if not await analysis_service.get_status_snapshot(analysis_id, user.user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"code": "NOT_FOUND", "message": "Analysis not found"},
         )
 
+    return _event_stream_response(
+        _stream_status_events(request, analysis_id, user.user_id, _analysis_data)
+    )
+
+
+async def _analysis_data(analysis: dict, results: Optional[dict]) -> dict:
+    """Build the GET /v1/analysis/{id} document from a status snapshot."""
     response_data = {
-        "id": str(analysis.id),
-        "type": f"{analysis.type.value}_analysis",
+        "id": analysis["id"],
+        "type": f"{analysis['type']}_analysis",
         "attributes": {
-            "status": analysis.status.value,
-            "progress": analysis.progress,
-            "current_stage": analysis.current_stage,
-            "created_at": analysis.created_at.isoformat(),
-            "updated_at": analysis.updated_at.isoformat(),
+            "status": analysis["status"],
+            "progress": analysis["progress"],
+            "current_stage": analysis["current_stage"],
+            "created_at": analysis["created_at"],
+            "updated_at": analysis["updated_at"],
         },
         "links": {
-            "self": f"/v1/analysis/{analysis.id}",
+            "self": f"/v1/analysis/{analysis['id']}",
         },
     }
 
     # Add file info if available
-    if analysis.file_name:
+    if analysis["file_name"]:
         response_data["attributes"]["file"] = {
-            "name": analysis.file_name,
-            "size_bytes": analysis.file_size_bytes,
-            "mime_type": analysis.file_mime_type,
+            "name": analysis["file_name"],
+            "size_bytes": analysis["file_size_bytes"],
+            "mime_type": analysis["file_mime_type"],
         }
 
     # Add results if completed
-    if analysis.status == AnalysisStatus.COMPLETED:
-        result = await analysis_service.get_analysis_result(analysis_id)
-        if result:
-            results_data = {
-                "verdict": result.verdict.value,
-                "confidence": result.confidence,
-                "risk_level": result.risk_level.value,
-                "summary": result.summary,
-                "detections": [d.model_dump() for d in result.detections],
-                "ensemble_score": result.ensemble_score,
-                "heatmap_url": result.heatmap_url,
-            }
-            # Include video_analysis for video types
-            if result.video_analysis:
-                results_data["video_analysis"] = result.video_analysis
-            response_data["attributes"]["results"] = results_data
-        response_data["attributes"]["completed_at"] = (
-            analysis.processing_completed_at.isoformat()
-            if analysis.processing_completed_at
-            else None
-        )
-        response_data["attributes"]["processing_time_ms"] = analysis.processing_time_ms
-        response_data["links"]["results"] = f"/v1/results/{analysis.id}"
-        response_data["links"]["export_pdf"] = f"/v1/results/{analysis.id}/export?format=pdf"
+    if analysis["status"] == AnalysisStatus.COMPLETED.value:
+        if results:
+            response_data["attributes"]["results"] = results
+        response_data["attributes"]["completed_at"] = analysis["processing_completed_at"]
+        response_data["attributes"]["processing_time_ms"] = analysis["processing_time_ms"]
+        response_data["links"]["results"] = f"/v1/results/{analysis['id']}"
+        response_data["links"]["export_pdf"] = f"/v1/results/{analysis['id']}/export?format=pdf"
 
     # Add error info if failed
-    if analysis.status == AnalysisStatus.FAILED:
+    if analysis["status"] == AnalysisStatus.FAILED.value:
         response_data["attributes"]["error"] = {
-            "code": analysis.error_code,
-            "message": analysis.error_message,
+            "code": analysis["error_code"],
+            "message": analysis["error_message"],
         }
 
     return {"data": response_data}
 
 
+@router.get("/analysis/{analysis_id}/frames", response_model=dict)
+async def get_analysis_frames(
+    analysis_id: UUID,
+    start: Optional[float] = Query(None, ge=0, description="Range start in seconds"),
+    end: Optional[float] = Query(None, ge=0, description="Range end in seconds"),
+    user: UserContext = Depends(get_rate_limited_user),
+):
+    """
+    Get per-frame AI probabilities for a video analysis.
+
+    Frames are returned as parallel timestamp/probability arrays. Use start
+    and end (seconds, inclusive) to fetch a slice of a long video.
+    """
+    if start is not None and end is not None and start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_RANGE", "message": "start must not be after end"},
+        )
+
+    analysis = await analysis_service.get_analysis(analysis_id, user.user_id)
+
+    if not analysis or analysis.type != AnalysisType.VIDEO:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "NOT_FOUND", "message": "Analysis not found"},
+        )
+
+    frame_results = await analysis_service.get_frame_results(analysis_id, start, end)
+
+    return {
+        "data": {
+            "id": str(analysis_id),
+            "type": "frame_results",
+            "attributes": {
+                "start": start,
+                "end": end,
+                "count": len(frame_results),
+                **frame_results.to_columns(),
+            },
+            "relationships": {
+                "analysis": {"id": str(analysis_id), "type": "analysis"},
+            },
+        },
+    }
+
+
 @router.post("/analysis/{analysis_id}/cancel", response_model=dict)
 async def cancel_analysis(
     analysis_id: UUID,
-    user: UserContext = Depends(get_current_user),
+    user: UserContext = Depends(get_rate_limited_user),
 ):
     """Cancel a pending or processing analysis."""
     success = await analysis_service.cancel_analysis(analysis_id, user.user_id)
@@ -287,7 +418,7 @@ async def cancel_analysis(
 
 @router.get("/results", response_model=dict)
 async def list_results(
-    user: UserContext = Depends(get_current_user),
+    user: UserContext = Depends(get_rate_limited_user),
     limit: int = 20,
     cursor: Optional[str] = None,
     status: Optional[str] = None,
@@ -297,13 +428,19 @@ async def list_results(
     status_enum = AnalysisStatus(status) if status else None
     type_enum = AnalysisType(type) if type else None
 
-    analyses = await analysis_service.list_analyses(
-        user_id=user.user_id,
-        limit=min(limit, 100),
-        cursor=cursor,
-        status=status_enum,
-        analysis_type=type_enum,
-    )
+    try:
+        analyses, next_cursor = await analysis_service.list_analyses(
+            user_id=user.user_id,
+            limit=max(1, min(limit, 100)),
+            cursor=cursor,
+            status=status_enum,
+            analysis_type=type_enum,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_CURSOR", "message": "Invalid pagination cursor"},
+        )
 
     items = []
     for analysis in analyses:
@@ -320,17 +457,10 @@ async def list_results(
 
         items.append(item)
 
-    # Generate next cursor
-    next_cursor = None
-    if len(analyses) == limit:
-        import base64
-
-        next_cursor = base64.b64encode(str(analyses[-1].id).encode()).decode()
-
     return {
         "data": items,
         "pagination": {
-            "has_more": len(analyses) == limit,
+            "has_more": next_cursor is not None,
             "next_cursor": next_cursor,
         },
         "meta": {
@@ -342,7 +472,7 @@ async def list_results(
 @router.get("/results/{analysis_id}", response_model=dict)
 async def get_result(
     analysis_id: UUID,
-    user: UserContext = Depends(get_current_user),
+    user: UserContext = Depends(get_rate_limited_user),
 ):
     """Get detailed results for a completed analysis."""
     analysis = await analysis_service.get_analysis(analysis_id, user.user_id)
@@ -383,6 +513,8 @@ async def get_result(
                 "ensemble_score": result.ensemble_score,
                 "heatmap_url": result.heatmap_url,
                 "metadata": result.metadata.model_dump() if result.metadata else None,
+                "face_tracking": result.face_tracking,
+                "audio_analysis": result.audio_analysis,
             },
             "relationships": {
                 "analysis": {"id": str(analysis_id), "type": "analysis"},
@@ -400,46 +532,71 @@ async def get_result(
 async def demo_analyze_video(
     request: DemoVideoAnalysisRequest,
     http_request: Request,
+    response: Response,
 ):
     """
     Analyze a YouTube video for AI-generated content (demo mode).
 
     No authentication required. Rate limited to 3 requests per hour per IP.
-    Maximum video duration: 20 seconds.
+    Maximum video duration: 20 seconds. When all demo slots are busy the job
+    waits in a bounded queue; a full queue returns 503 with Retry-After.
     """
     # Get client IP for rate limiting
     client_ip = await get_client_ip(http_request)
 
     # Check rate limit
-    await check_demo_rate_limit(client_ip)
+    await check_demo_rate_limit(client_ip, response)
 
     # Validate YouTube URL
     try:
         video_id = video_service.validate_youtube_url(request.youtube_url)
+        await video_service.validate_video(video_id, demo=True)
         normalized_url = video_service.get_youtube_url_from_id(video_id)
     except VideoValidationError as e:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=(
+                status.HTTP_503_SERVICE_UNAVAILABLE
+                if e.retryable
+                else status.HTTP_400_BAD_REQUEST
+            ),
             detail={"code": e.code, "message": e.message},
         )
 
-    # Create demo video analysis (duration validation happens in worker)
-    analysis = await analysis_service.create_demo_video_analysis(
-        youtube_url=normalized_url,
-        video_id=video_id,
-        client_ip=client_ip,
-    )
+    # Create demo video analysis
+    try:
+        analysis = await analysis_service.create_demo_video_analysis(
+            youtube_url=normalized_url,
+            video_id=video_id,
+            client_ip=client_ip,
+        )
+    except DemoAdmissionRejected as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": e.code,
+                "message": e.message,
+                "retry_after_seconds": e.retry_after_seconds,
+            },
+            headers={"Retry-After": str(e.retry_after_seconds)},
+        )
+
+    attributes = {
+        "status": analysis.status.value,
+        "progress": analysis.progress,
+        "current_stage": analysis.current_stage or "queued",
+        "created_at": analysis.created_at.isoformat(),
+    }
+    if analysis.status == AnalysisStatus.PENDING:
+        queue = await demo_admission.queue_status(analysis.id)
+        if queue:
+            attributes["queue_position"] = queue.position
+            attributes["estimated_start_at"] = queue.estimated_start_at.isoformat()
 
     return {
         "data": {
             "id": str(analysis.id),
             "type": "demo_video_analysis",
-            "attributes": {
-                "status": analysis.status.value,
-                "progress": analysis.progress,
-                "current_stage": analysis.current_stage or "queued",
-                "created_at": analysis.created_at.isoformat(),
-            },
+            "attributes": attributes,
             "links": {
                 "self": f"/v1/demo/analysis/{analysis.id}",
             },
@@ -448,59 +605,188 @@ async def demo_analyze_video(
 
 
 @router.get("/demo/analysis/{analysis_id}", response_model=dict)
-async def get_demo_analysis(analysis_id: UUID):
+async def get_demo_analysis(
+    analysis_id: UUID,
+    wait: Optional[int] = Query(
+        None,
+        ge=1,
+        le=MAX_WAIT_SECONDS,
+        description="Seconds to wait for a status or stage change",
+    ),
+):
     """
     Get the status and results of a demo analysis.
 
-    No authentication required. Only works for demo analyses.
+    No authentication required. Only works for demo analyses. Supports
+    long-polling with wait, like GET /v1/analysis/{id}.
     """
-    analysis = await analysis_service.get_demo_analysis(analysis_id)
+    if wait:
+        snapshot = await _wait_for_status_change(analysis_id, DEMO_USER_ID, wait)
+    else:
+        snapshot = await analysis_service.get_status_snapshot(analysis_id, DEMO_USER_ID)
 
-    if not analysis:
+    if not snapshot:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "NOT_FOUND", "message": "Analysis not found"},
+        )
+
+    return await _demo_analysis_data(*snapshot)
+
+
+@router.get("/demo/analysis/{analysis_id}/events")
+async def stream_demo_analysis_events(analysis_id: UUID, request: Request):
+    """
+    Stream a demo analysis's status as server-sent events.
+
+    No authentication required. Events follow GET /v1/analysis/{id}/events
+    and carry the same document as GET /v1/demo/analysis/{id}.
+    """
+    if not await analysis_service.get_status_snapshot(analysis_id, DEMO_USER_ID):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"code": "NOT_FOUND", "message": "Analysis not found"},
         )
 
+    return _event_stream_response(
+        _stream_status_events(request, analysis_id, DEMO_USER_ID, _demo_analysis_data)
+    )
+
+
+async def _demo_analysis_data(analysis: dict, results: Optional[dict]) -> dict:
+    """Build the GET /v1/demo/analysis/{id} document from a status snapshot."""
     response_data = {
-        "id": str(analysis.id),
+        "id": analysis["id"],
         "type": "demo_video_analysis",
         "attributes": {
-            "status": analysis.status.value,
-            "progress": analysis.progress,
-            "current_stage": analysis.current_stage,
-            "created_at": analysis.created_at.isoformat(),
-            "updated_at": analysis.updated_at.isoformat(),
+            "status": analysis["status"],
+            "progress": analysis["progress"],
+            "current_stage": analysis["current_stage"],
+            "created_at": analysis["created_at"],
+            "updated_at": analysis["updated_at"],
         },
     }
 
+    # Report where a waiting job stands in the global demo queue
+    if analysis["status"] == AnalysisStatus.PENDING.value:
+        queue = await demo_admission.queue_status(analysis["id"])
+        if queue:
+            response_data["attributes"]["current_stage"] = "queued"
+            response_data["attributes"]["queue_position"] = queue.position
+            response_data["attributes"]["estimated_start_at"] = queue.estimated_start_at.isoformat()
+
     # Add results if completed
-    if analysis.status == AnalysisStatus.COMPLETED:
-        result = await analysis_service.get_analysis_result(analysis_id)
-        if result:
-            results_data = {
-                "verdict": result.verdict.value,
-                "confidence": result.confidence,
-                "risk_level": result.risk_level.value,
-                "summary": result.summary,
-                "ensemble_score": result.ensemble_score,
+    if analysis["status"] == AnalysisStatus.COMPLETED.value:
+        if results:
+            response_data["attributes"]["results"] = {
+                field: results[field] for field in DEMO_RESULT_FIELDS if field in results
             }
-            # Include frame results for video analysis
-            if result.video_analysis:
-                results_data["video_analysis"] = result.video_analysis
-            response_data["attributes"]["results"] = results_data
-        response_data["attributes"]["completed_at"] = (
-            analysis.processing_completed_at.isoformat()
-            if analysis.processing_completed_at
-            else None
-        )
-        response_data["attributes"]["processing_time_ms"] = analysis.processing_time_ms
+        response_data["attributes"]["completed_at"] = analysis["processing_completed_at"]
+        response_data["attributes"]["processing_time_ms"] = analysis["processing_time_ms"]
 
     # Add error info if failed
-    if analysis.status == AnalysisStatus.FAILED:
+    if analysis["status"] == AnalysisStatus.FAILED.value:
         response_data["attributes"]["error"] = {
-            "code": analysis.error_code,
-            "message": analysis.error_message,
+            "code": analysis["error_code"],
+            "message": analysis["error_message"],
         }
 
     return {"data": response_data}
+
+
+# ============================================================================
+# Status Streaming
+# ============================================================================
+
+
+async def _wait_for_status_change(
+    analysis_id: UUID, owner_id: UUID, wait: int
+) -> Optional[Tuple[dict, Optional[dict]]]:
+    """Get a status snapshot once the status or stage changes, or after wait seconds."""
+    async with analysis_events.subscribe(analysis_id) as events:
+        # Subscribe before reading, so a change right after the read still wakes us
+        snapshot = await analysis_service.get_status_snapshot(analysis_id, owner_id)
+        if not snapshot or snapshot[0]["status"] in TERMINAL_STATUSES:
+            return snapshot
+
+        initial = latest = snapshot[0]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        while True:
+            try:
+                update = await asyncio.wait_for(events.get(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                return snapshot
+
+            if update is None or update["status"] == AnalysisStatus.COMPLETED.value:
+                # Resync after the hub reconnected, or pick up the results
+                snapshot = await analysis_service.get_status_snapshot(analysis_id, owner_id)
+                if not snapshot:
+                    return None
+            elif update["updated_at"] > latest["updated_at"]:
+                snapshot = (update, None)
+            else:
+                continue
+
+            latest = snapshot[0]
+            if (
+                latest["status"] != initial["status"]
+                or latest["current_stage"] != initial["current_stage"]
+            ):
+                return snapshot
+
+
+def _event_stream_response(events: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_status_events(
+    request: Request,
+    analysis_id: UUID,
+    owner_id: UUID,
+    build: Callable[[dict, Optional[dict]], Awaitable[dict]],
+) -> AsyncIterator[str]:
+    """Yield an analysis's status documents as SSE frames until it finishes."""
+    async with analysis_events.subscribe(analysis_id) as events:
+        # Read the current state only after subscribing, so no update can
+        # land between the two
+        snapshot = await analysis_service.get_status_snapshot(analysis_id, owner_id)
+        previous = None
+
+        while snapshot:
+            analysis, results = snapshot
+            # updated_at is an ISO timestamp in UTC, so it orders as a string
+            if previous is None or analysis["updated_at"] > previous["updated_at"]:
+                if analysis["status"] == AnalysisStatus.COMPLETED.value:
+                    event = "result"
+                elif previous is None or analysis["status"] != previous["status"]:
+                    event = "status"
+                else:
+                    event = "progress"
+                data = orjson.dumps(await build(analysis, results)).decode()
+                yield f"event: {event}\ndata: {data}\n\n"
+                previous = analysis
+
+            if analysis["status"] in TERMINAL_STATUSES:
+                return
+
+            while True:
+                try:
+                    update = await asyncio.wait_for(
+                        events.get(), settings.analysis_events_heartbeat_seconds
+                    )
+                    break
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+
+            if update is None or update["status"] == AnalysisStatus.COMPLETED.value:
+                # Resync after the hub reconnected, or pick up the results
+                snapshot = await analysis_service.get_status_snapshot(analysis_id, owner_id)
+            else:
+                snapshot = (update, None)
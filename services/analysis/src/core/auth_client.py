@@ -0,0 +1,52 @@
+import logging
+from typing import Optional
+
+import httpx
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def init_auth_client() -> None:
+    """Initialize the pooled auth service client."""
+    global _client
+    logger.info("Initializing auth service client...")
+
+    http2 = settings.auth_service_http2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("AUTH_SERVICE_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+            http2 = False
+
+    _client = httpx.AsyncClient(
+        base_url=settings.auth_service_url,
+        http2=http2,
+        timeout=settings.auth_service_timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.auth_service_max_connections,
+            max_keepalive_connections=settings.auth_service_keepalive_connections,
+            keepalive_expiry=settings.auth_service_keepalive_seconds,
+        ),
+    )
+    logger.info("Auth service client initialized")
+
+
+async def close_auth_client() -> None:
+    """Close the auth service client."""
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+        logger.info("Auth service client closed")
+
+
+async def get_auth_client() -> httpx.AsyncClient:
+    """Get the auth service client."""
+    if _client is None:
+        raise RuntimeError("Auth service client not initialized")
+    return _client
@@ -1,14 +1,96 @@
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import asyncpg
+import orjson
+from asyncpg.prepared_stmt import PreparedStatement
 
+from src.core import queries
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 _pool: Optional[asyncpg.Pool] = None
 
+# jsonb's binary wire format is a version byte followed by the JSON text
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    # Callers pass already-serialized documents as str
+    if isinstance(value, str):
+        return _JSONB_VERSION + value.encode()
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    return orjson.loads(data[1:])
+
+
+class Connection(asyncpg.Connection):
+    """
+    Connection that runs registered SQL through its own prepared statements.
+
+    The statements in queries.PREPARED are prepared once when the pool opens
+    the connection. fetch, fetchrow and fetchval with one of those strings
+    then skip the statement cache, and ad-hoc SQL can never evict them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prepared: Dict[str, PreparedStatement] = {}
+
+    async def prepare_registered(self) -> None:
+        """Prepare every registered statement on this connection."""
+        for query in queries.PREPARED:
+            self._prepared[query] = await self.prepare(query)
+
+    async def fetch(self, query: str, *args, timeout=None, record_class=None) -> list:
+        if query not in self._prepared or record_class is not None:
+            return await super().fetch(
+                query, *args, timeout=timeout, record_class=record_class
+            )
+        return await self._run_prepared(query, "fetch", *args, timeout=timeout)
+
+    async def fetchrow(self, query: str, *args, timeout=None, record_class=None):
+        if query not in self._prepared or record_class is not None:
+            return await super().fetchrow(
+                query, *args, timeout=timeout, record_class=record_class
+            )
+        return await self._run_prepared(query, "fetchrow", *args, timeout=timeout)
+
+    async def fetchval(self, query: str, *args, column=0, timeout=None) -> Any:
+        if query not in self._prepared:
+            return await super().fetchval(query, *args, column=column, timeout=timeout)
+        return await self._run_prepared(
+            query, "fetchval", *args, column=column, timeout=timeout
+        )
+
+    async def _run_prepared(self, query: str, method: str, *args, **kwargs) -> Any:
+        try:
+            return await getattr(self._prepared[query], method)(*args, **kwargs)
+        except asyncpg.exceptions.InvalidCachedStatementError:
+            # A migration changed a table under the statement; prepare it
+            # again and retry, unless the failure aborted a transaction
+            self._prepared[query] = await self.prepare(query)
+            if self.is_in_transaction():
+                raise
+            return await getattr(self._prepared[query], method)(*args, **kwargs)
+
+
+async def _init_connection(conn: Connection) -> None:
+    """Decode jsonb columns with orjson, then prepare the registered SQL."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+    # Statements bind codecs when prepared, so this comes after the codec
+    if settings.database_prepared_statements:
+        await conn.prepare_registered()
+
 
 async def init_db() -> None:
     """Initialize database connection pool."""
@@ -20,6 +102,11 @@ async def init_db() -> None:
         min_size=5,
         max_size=20,
         command_timeout=60,
+        # asyncpg's default cache size for other SQL; 0 disables server-side
+        # statements entirely
+        statement_cache_size=100 if settings.database_prepared_statements else 0,
+        connection_class=Connection,
+        init=_init_connection,
     )
     logger.info("Database connection pool initialized")
 
@@ -0,0 +1,87 @@
+# Registry of the SQL on hot paths, referenced by name.
+#
+# Every statement listed in PREPARED is prepared on each pooled connection
+# when it opens (see core.database.Connection), and calls passing the same
+# string run through it. Call sites must therefore use these constants
+# rather than keep their own copies of the SQL.
+
+# Args: analysis_id, status, progress, stage, error_code, error_message
+UPDATE_ANALYSIS_STATUS = """
+    UPDATE analyses
+    SET status = $2::analysis_status, progress = $3, current_stage = $4,
+        error_code = $5, error_message = $6,
+        processing_started_at = CASE WHEN $2 = 'processing' AND processing_started_at IS NULL THEN NOW() ELSE processing_started_at END,
+        processing_completed_at = CASE WHEN $2 IN ('completed', 'failed') THEN NOW() ELSE processing_completed_at END,
+        updated_at = NOW()
+    WHERE id = $1
+    RETURNING *
+"""
+
+# Args: analysis_id, file_name, file_size_bytes, file_mime_type,
+#       duration_seconds, resolution, fps
+UPDATE_ANALYSIS_FILE_INFO = """
+    UPDATE analyses
+    SET file_name = $2, file_size_bytes = $3, file_mime_type = $4,
+        duration_seconds = $5, resolution = $6, fps = $7,
+        updated_at = NOW()
+    WHERE id = $1
+    RETURNING *
+"""
+
+# Args: analysis_id, progress, current_stage
+UPDATE_ANALYSIS_PROGRESS = """
+    UPDATE analyses
+    SET progress = $2, current_stage = $3, updated_at = NOW()
+    WHERE id = $1
+    RETURNING *
+"""
+
+# Args: analysis_id, user_id, status
+CANCEL_ANALYSIS = """
+    UPDATE analyses
+    SET status = $3, updated_at = NOW()
+    WHERE id = $1 AND user_id = $2 AND status IN ('pending', 'processing')
+    RETURNING *
+"""
+
+# Args: analysis_id
+SELECT_ANALYSIS = "SELECT * FROM analyses WHERE id = $1"
+
+# Args: analysis_id, user_id
+SELECT_USER_ANALYSIS = "SELECT * FROM analyses WHERE id = $1 AND user_id = $2"
+
+# Args: analysis_id
+SELECT_ANALYSIS_RESULT = "SELECT * FROM analysis_results WHERE analysis_id = $1"
+
+# Args: analysis_id, start seconds or None, end seconds or None
+SELECT_FRAME_RESULTS = """
+    SELECT timestamps, ai_probabilities FROM analysis_frame_results
+    WHERE analysis_id = $1
+      AND ($2::real IS NULL OR end_ts >= $2)
+      AND ($3::real IS NULL OR start_ts <= $3)
+    ORDER BY window_index
+"""
+
+# Args: key_hash
+LOOKUP_API_KEY = """
+    UPDATE api_keys k SET last_used_at = NOW()
+    FROM users u
+    WHERE k.key_hash = $1 AND u.id = k.user_id
+        AND k.revoked_at IS NULL
+        AND (k.expires_at IS NULL OR k.expires_at > NOW())
+    RETURNING k.id, k.scopes, k.rate_limit, k.expires_at,
+        u.id AS user_id, u.email, u.tier, u.organization_id
+"""
+
+# Prepared on every pooled connection
+PREPARED = (
+    UPDATE_ANALYSIS_STATUS,
+    UPDATE_ANALYSIS_FILE_INFO,
+    UPDATE_ANALYSIS_PROGRESS,
+    CANCEL_ANALYSIS,
+    SELECT_ANALYSIS,
+    SELECT_USER_ANALYSIS,
+    SELECT_ANALYSIS_RESULT,
+    SELECT_FRAME_RESULTS,
+    LOOKUP_API_KEY,
+)
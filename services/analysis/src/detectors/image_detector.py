@@ -9,6 +9,9 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Detector names selectable via options["models"]
+DETECTORS = ("primary", "gan", "diffusion", "frequency")
+
 
 class ImageDetector:
     """
@@ -37,18 +40,23 @@ class ImageDetector:
         image = self._preprocess(image)
 
         detections = []
+        selected = self._select_detectors(options)
 
-        primary_result = await self._run_primary_classifier(image)
-        detections.append(primary_result)
+        if "primary" in selected:
+            primary_result = await self._run_primary_classifier(image)
+            detections.append(primary_result)
 
-        gan_result = await self._run_gan_detector(image)
-        detections.append(gan_result)
+        if "gan" in selected:
+            gan_result = await self._run_gan_detector(image)
+            detections.append(gan_result)
 
-        diffusion_result = await self._run_diffusion_detector(image)
-        detections.append(diffusion_result)
+        if "diffusion" in selected:
+            diffusion_result = await self._run_diffusion_detector(image)
+            detections.append(diffusion_result)
 
-        freq_result = await self._run_frequency_analysis(image)
-        detections.append(freq_result)
+        if "frequency" in selected:
+            freq_result = await self._run_frequency_analysis(image)
+            detections.append(freq_result)
 
         ensemble_score = self._calculate_ensemble_score(detections)
         verdict, risk_level = self._determine_verdict(ensemble_score)
@@ -63,6 +71,11 @@ class ImageDetector:
             "ensemble_score": ensemble_score,
         }
 
+    def _select_detectors(self, options: Dict[str, Any]) -> set:
+        """Resolve the detector subset requested via options["models"]."""
+        requested = set(options.get("models") or DETECTORS) & set(DETECTORS)
+        return requested or set(DETECTORS)
+
     def _preprocess(self, image: Image.Image) -> Image.Image:
         """Preprocess image for detection."""
         if image.mode != "RGB":
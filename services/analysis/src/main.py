@@ -1,10 +1,14 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from src.api.auth import listen_for_revocations
 from src.api.routes import router
+from src.core.auth_client import init_auth_client, close_auth_client
 from src.core.config import settings
 from src.core.database import init_db, close_db
 from src.core.redis import init_redis, close_redis
@@ -24,6 +28,22 @@ async def lifespan(app: FastAPI):
     # Initialize connections
     await init_db()
     await init_redis()
+    await init_auth_client()
+
+    # Drop cached API keys as the auth service revokes them
+    revocation_task = asyncio.create_task(listen_for_revocations())
+
+    # Fan analysis status events out to streaming clients
+    from src.services.analysis_events import analysis_events
+    events_task = asyncio.create_task(analysis_events.run())
+
+    # Reclaim scratch workspaces left behind by a previous crash
+    from src.services.video_analyzer import video_analyzer
+    video_analyzer.workspaces.reclaim_orphans()
+
+    # Frame scoring for in-process analyses runs in a separate process pool
+    from src.services.analysis_pool import analysis_pool
+    analysis_pool.start()
 
     # RabbitMQ is optional - only init if configured
     if settings.rabbitmq_url and settings.use_rabbitmq:
@@ -40,12 +60,16 @@ async def lifespan(app: FastAPI):
 
     # Cleanup
     logger.info("Shutting down Analysis Service...")
+    revocation_task.cancel()
+    events_task.cancel()
+    await analysis_pool.shutdown()
     if settings.rabbitmq_url and settings.use_rabbitmq:
         try:
             from src.core.rabbitmq import close_rabbitmq
             await close_rabbitmq()
         except Exception:
             pass
+    await close_auth_client()
     await close_redis()
     await close_db()
     logger.info("Analysis Service shutdown complete")
@@ -56,6 +80,7 @@ app = FastAPI(
     description="AI-generated content detection analysis orchestration service",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
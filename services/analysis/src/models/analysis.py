@@ -30,6 +30,13 @@ class VerdictType(str, Enum):
     MANIPULATED = "manipulated"
 
 
+class QualityTier(str, Enum):
+    """Named compute profiles, see src/video/profiles.py."""
+    FAST = "fast"
+    STANDARD = "standard"
+    THOROUGH = "thorough"
+
+
 class RiskLevel(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -56,6 +63,7 @@ class AnalysisOptions(BaseModel):
     include_heatmap: bool = False
     include_metadata: bool = True
     sync: bool = False  # For small files, return results synchronously
+    quality: QualityTier = QualityTier.STANDARD  # fast, standard, thorough
 
 
 class WebhookConfig(BaseModel):
@@ -72,10 +80,23 @@ class ImageAnalysisRequest(BaseModel):
 
 
 class VideoAnalysisRequest(BaseModel):
+    """
+    Request model for video analysis.
+
+    Recognized options:
+        quality: fast, standard or thorough (see QualityTier).
+        models: Detector models to run.
+        triage: Only analyze the first 30 seconds, for a quick verdict.
+        long_video: Checkpointed segment-by-segment mode for videos up to 2 hours.
+        audio: Set to false to skip audio analysis.
+        face_roi: Set to false to skip face-region detection.
+    """
+
     source: Dict[str, Any]
     options: Optional[Dict[str, Any]] = None
     webhook: Optional[WebhookConfig] = None
     priority: str = "normal"
+    quality: Optional[QualityTier] = None  # Overrides options["quality"]
     metadata: Optional[Dict[str, Any]] = None
 
 
@@ -89,12 +110,14 @@ class BatchItem(BaseModel):
     type: AnalysisType
     source: Dict[str, Any]
     options: Optional[Dict[str, Any]] = None
+    priority: Optional[str] = None  # Overrides the batch priority
 
 
 class BatchAnalysisRequest(BaseModel):
     items: List[BatchItem]
     options: Optional[Dict[str, Any]] = None
     webhook: Optional[WebhookConfig] = None
+    priority: str = "normal"
     metadata: Optional[Dict[str, Any]] = None
 
 
@@ -135,6 +158,8 @@ class AnalysisResult(BaseModel):
     heatmap_url: Optional[str] = None
     metadata: Optional[MetadataAnalysis] = None
     video_analysis: Optional[Dict[str, Any]] = None
+    face_tracking: Optional[List[Dict[str, Any]]] = None
+    audio_analysis: Optional[Dict[str, Any]] = None
 
 
 class AnalysisStage(BaseModel):
@@ -222,3 +247,13 @@ class AnalysisDB(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class AnalysisSummary(BaseModel):
+    """The columns of an analyses row that result listings show."""
+
+    id: UUID
+    type: AnalysisType
+    status: AnalysisStatus
+    file_name: Optional[str] = None
+    created_at: datetime
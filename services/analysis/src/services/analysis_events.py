@@ -0,0 +1,96 @@
+"""Per-process fan-out of analysis status events to streaming clients."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+from uuid import UUID
+
+import orjson
+
+from src.core.config import settings
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Every analysis's events channel (see status_store.events_channel)
+EVENTS_PATTERN = "analysis:*:events"
+
+EVENTS_RETRY_SECONDS = 1.0
+
+
+class AnalysisEventHub:
+    """
+    Delivers status rows published by StatusStore to streaming clients.
+
+    Each API process holds a single pattern subscription to every
+    analysis's events channel and hands each row to the queues of the
+    clients watching that analysis, so open streams don't cost a Redis
+    connection each.
+
+    Rows are full snapshots, so a slow client's queue drops its oldest
+    entry rather than blocking the hub. Messages published while the hub
+    is disconnected are lost; after reconnecting it puts None on every
+    queue to tell streams to re-read the analysis.
+    """
+
+    def __init__(self, queue_size: Optional[int] = None):
+        self.queue_size = queue_size or settings.analysis_events_queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    @asynccontextmanager
+    async def subscribe(self, analysis_id: UUID) -> AsyncIterator[asyncio.Queue]:
+        """
+        Watch an analysis for as long as the context is open.
+
+        Yields:
+            A queue of status rows, or None when the stream should resync.
+        """
+        key = str(analysis_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(key, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(key)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[key]
+
+    async def run(self) -> None:
+        """Receive events from Redis and dispatch them until cancelled."""
+        while True:
+            try:
+                redis = await get_redis()
+                pubsub = redis.pubsub()
+                await pubsub.psubscribe(EVENTS_PATTERN)
+                self._broadcast(None)
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] != "pmessage":
+                            continue
+                        analysis_id = message["channel"].split(":")[1]
+                        if analysis_id in self._subscribers:
+                            self._dispatch(analysis_id, orjson.loads(message["data"]))
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Analysis event hub disconnected: {e}")
+                await asyncio.sleep(EVENTS_RETRY_SECONDS)
+
+    def _dispatch(self, analysis_id: str, row: Optional[Dict[str, Any]]) -> None:
+        for queue in self._subscribers.get(analysis_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(row)
+
+    def _broadcast(self, row: Optional[Dict[str, Any]]) -> None:
+        for analysis_id in list(self._subscribers):
+            self._dispatch(analysis_id, row)
+
+
+# Singleton instance
+analysis_events = AnalysisEventHub()
@@ -0,0 +1,115 @@
+"""Supervised process pool for CPU-bound analysis off the API event loop."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Coroutine, Optional, Set
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker() -> None:
+    """Configure logging in a freshly spawned pool process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
+class AnalysisPool:
+    """
+    Runs CPU-bound analysis in a fixed-size pool of spawned processes.
+
+    The API event loop only awaits results, so request latency stays flat
+    under demo load. A pool process that crashes breaks its executor; the
+    pool swaps in a fresh one, and only the jobs in flight at the time fail.
+    Background jobs started with spawn() are tracked so shutdown can drain
+    them before connections close.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+    ):
+        self.max_workers = max_workers or settings.analysis_pool_workers
+        self.max_tasks_per_child = (
+            max_tasks_per_child or settings.analysis_pool_max_tasks_per_child
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Create the process pool."""
+        if self._executor is None:
+            self._executor = self._new_executor()
+            logger.info(f"Analysis pool started with {self.max_workers} processes")
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a picklable module-level function in a pool process.
+
+        Raises:
+            BrokenProcessPool: If a pool process died while the call was
+                in flight. The pool is replaced before this is raised.
+        """
+        if self._executor is None:
+            self.start()
+
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # Every call in flight sees the same broken executor; replace it once
+            if self._executor is executor:
+                logger.error("Analysis pool process died; replacing the pool")
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._new_executor()
+            raise
+
+    def spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Start a background analysis job and track it until it finishes."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Drain background jobs, then stop the pool processes.
+
+        Jobs still running after timeout seconds are cancelled.
+        """
+        timeout = settings.analysis_pool_shutdown_seconds if timeout is None else timeout
+
+        if self._tasks:
+            logger.info(f"Waiting for {len(self._tasks)} analysis job(s) to finish")
+            _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"Cancelled {len(pending)} unfinished analysis job(s)")
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Analysis pool stopped")
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn, not fork: the API process has a running event loop and threads
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            max_tasks_per_child=self.max_tasks_per_child,
+        )
+
+
+# Singleton instance
+analysis_pool = AnalysisPool()
@@ -1,10 +1,12 @@
-import asyncio
+import base64
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
+from src.core import queries
 from src.core.config import settings
 from src.core.database import get_db
 from src.core.redis import get_redis
@@ -12,11 +14,21 @@ from src.models.analysis import (
     AnalysisDB,
     AnalysisResult,
     AnalysisStatus,
+    AnalysisSummary,
     AnalysisType,
     BatchAnalysisResponse,
     BatchProgress,
+    Detection,
     FileInfo,
+    RiskLevel,
+    VerdictType,
 )
+from src.services.analysis_pool import analysis_pool
+from src.services.demo_admission import demo_admission
+from src.services.result_cache import result_cache_key, video_result_cache
+from src.services.status_store import status_row, status_store
+from src.video.frame_results import FrameResults
+from src.video.profiles import get_profile
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +37,35 @@ DEMO_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
 
 # Demo constraints
 DEMO_MAX_DURATION = 20  # seconds
+DEMO_MAX_FRAMES = 20
 DEMO_RESULT_TTL = 3600  # 1 hour in seconds
 
+# Triage jobs only look at the opening of the video. The worker reads the
+# window from options["max_seconds"], which only this service sets.
+TRIAGE_MAX_SECONDS = 30
+
+# Queue priority for each request priority level
+PRIORITY_VALUES = {"low": 3, "normal": 5, "high": 8, "critical": 10}
+
+
+def encode_list_cursor(created_at: datetime, analysis_id: UUID) -> str:
+    """Opaque pagination cursor for the position after (created_at, id)."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{analysis_id}".encode()).decode()
+
+
+def decode_list_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor from encode_list_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        created_at, analysis_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(analysis_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 
 class AnalysisService:
     """Service for managing analysis jobs."""
@@ -49,7 +88,7 @@ class AnalysisService:
                 return existing
 
         analysis_id = uuid4()
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
 
         # Determine file key based on source type
         file_key = None
@@ -104,16 +143,39 @@ class AnalysisService:
     ) -> AnalysisDB:
         """Create a new video analysis job."""
         analysis_id = uuid4()
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
+        options = dict(options or {})
+        options.pop("max_seconds", None)
+        if options.get("triage"):
+            options["max_seconds"] = TRIAGE_MAX_SECONDS
 
-        priority_value = {"low": 3, "normal": 5, "high": 8, "critical": 10}.get(priority, 5)
+        priority_value = PRIORITY_VALUES.get(priority, 5)
 
         file_key = None
-        if source.get("type") == "url":
+        if source.get("type") in ("url", "youtube"):
             file_key = source.get("url")
         elif source.get("type") == "upload":
             file_key = source.get("upload_id")
 
+        # Reuse the results of an identical YouTube analysis when available
+        if source.get("video_id"):
+            options["result_cache_key"] = result_cache_key(
+                source["video_id"], self._video_sampling_config(options)
+            )
+            cached = await self._create_from_result_cache(
+                options["result_cache_key"],
+                analysis_id=analysis_id,
+                user_id=user_id,
+                organization_id=organization_id,
+                priority=priority_value,
+                options=options,
+                webhook_url=webhook_url,
+                external_id=metadata.get("external_id") if metadata else None,
+                metadata=metadata or {},
+            )
+            if cached:
+                return cached
+
         db = await get_db()
         row = await db.fetchrow(
             """
@@ -131,7 +193,7 @@ class AnalysisService:
             AnalysisStatus.PENDING.value,
             priority_value,
             file_key,
-            json.dumps(options or {}),
+            json.dumps(options),
             webhook_url,
             metadata.get("external_id") if metadata else None,
             json.dumps(metadata or {}),
@@ -155,11 +217,15 @@ class AnalysisService:
         """
         Create a demo video analysis job (no auth required).
 
-        Uses DEMO_USER_ID and publishes to the demo queue.
-        Duration validation happens in the worker.
+        Uses DEMO_USER_ID and runs in the API's analysis pool once the
+        global demo admission controller gives it a slot.
+        Duration is validated at submission by VideoService.validate_video.
+
+        Raises:
+            DemoAdmissionRejected: If the demo queue is full.
         """
         analysis_id = uuid4()
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
 
         source = {
             "type": "youtube",
@@ -173,34 +239,77 @@ class AnalysisService:
             "max_duration": DEMO_MAX_DURATION,
         }
 
-        db = await get_db()
-        row = await db.fetchrow(
-            """
-            INSERT INTO analyses (
-                id, user_id, organization_id, type, status, priority,
-                file_key, options, webhook_url, external_id,
-                metadata, created_at, updated_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
-            RETURNING *
-            """,
-            analysis_id,
-            DEMO_USER_ID,
-            None,  # No organization for demo
-            AnalysisType.VIDEO.value,
-            AnalysisStatus.PENDING.value,
-            5,  # Normal priority
-            youtube_url,
-            json.dumps({"demo": True, "max_duration": DEMO_MAX_DURATION}),
-            None,  # No webhook for demo
-            None,
-            json.dumps(metadata),
-            now,
-            now,
+        options = {
+            "demo": True,
+            "max_duration": DEMO_MAX_DURATION,
+            "result_cache_key": result_cache_key(
+                video_id, self._video_sampling_config({}, demo=True)
+            ),
+        }
+
+        # Popular demo videos complete instantly without running the pipeline
+        cached = await self._create_from_result_cache(
+            options["result_cache_key"],
+            analysis_id=analysis_id,
+            user_id=DEMO_USER_ID,
+            organization_id=None,
+            priority=5,
+            options=options,
+            webhook_url=None,
+            external_id=None,
+            metadata=metadata,
         )
+        if cached:
+            await self._mark_demo_analysis(analysis_id)
+            return cached
+
+        # Take a slot or queue place before the job exists, so a full queue
+        # rejects cleanly
+        await demo_admission.enqueue(analysis_id)
+
+        db = await get_db()
+        try:
+            row = await db.fetchrow(
+                """
+                INSERT INTO analyses (
+                    id, user_id, organization_id, type, status, priority,
+                    file_key, options, webhook_url, external_id,
+                    metadata, created_at, updated_at
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
+                RETURNING *
+                """,
+                analysis_id,
+                DEMO_USER_ID,
+                None,  # No organization for demo
+                AnalysisType.VIDEO.value,
+                AnalysisStatus.PENDING.value,
+                5,  # Normal priority
+                youtube_url,
+                json.dumps(options),
+                None,  # No webhook for demo
+                None,
+                json.dumps(metadata),
+                now,
+                now,
+            )
+        except Exception:
+            await demo_admission.discard(analysis_id)
+            raise
 
         analysis = self._row_to_analysis(row)
 
-        # Set TTL for auto-cleanup in Redis
+        await self._mark_demo_analysis(analysis_id)
+
+        logger.info(f"Created demo video analysis {analysis_id} for IP {client_ip}")
+
+        # Process video in the background; frame scoring runs in the analysis pool
+        from src.services.video_analyzer import video_analyzer
+        analysis_pool.spawn(video_analyzer.analyze_demo_video(analysis_id, youtube_url))
+
+        return analysis
+
+    async def _mark_demo_analysis(self, analysis_id: UUID) -> None:
+        """Set TTL for auto-cleanup of a demo analysis in Redis."""
         redis = await get_redis()
         await redis.setex(
             f"demo_analysis:{analysis_id}",
@@ -208,21 +317,54 @@ class AnalysisService:
             "1",
         )
 
-        logger.info(f"Created demo video analysis {analysis_id} for IP {client_ip}")
-
-        # Process video synchronously in background task
-        from src.services.video_analyzer import video_analyzer
-        asyncio.create_task(video_analyzer.analyze_demo_video(analysis_id, youtube_url))
+    def _video_sampling_config(
+        self, options: Dict[str, Any], demo: bool = False
+    ) -> Dict[str, Any]:
+        """Describe how the pipeline will sample a video, for result caching."""
+        profile = get_profile(options.get("quality"))
+        sampling = asdict(profile)
+        sampling["models"] = sorted(profile.detector_options(options)["models"])
+        sampling["face_roi"] = bool(options.get("face_roi", True))
+        if options.get("audio") is False:
+            sampling["audio"] = False
+        if options.get("long_video"):
+            # Segmented runs sample differently (no early exit, per-segment budgets)
+            sampling["long_video"] = True
+
+        if demo:
+            sampling["max_frames"] = min(DEMO_MAX_FRAMES, profile.max_frames)
+            sampling["max_seconds"] = DEMO_MAX_DURATION
+        else:
+            sampling["max_seconds"] = options.get("max_seconds")
+        return sampling
+
+    async def _create_from_result_cache(
+        self, cache_key: str, **clone_kwargs: Any
+    ) -> Optional[AnalysisDB]:
+        """Clone a cached completed analysis, or return None on a miss."""
+        try:
+            row = None
+            # A second pass falls back to the table once a stale pointer
+            # (whose source analysis was deleted) has been dropped
+            for _ in range(2):
+                source_id = await video_result_cache.lookup(cache_key)
+                if source_id is None:
+                    return None
+                row = await video_result_cache.clone(source_id, **clone_kwargs)
+                if row is not None:
+                    break
+                await video_result_cache.forget(cache_key)
+        except Exception as e:
+            logger.warning(f"Result cache lookup failed for {cache_key}: {e}")
+            return None
 
-        return analysis
+        return self._row_to_analysis(row) if row else None
 
     async def get_demo_analysis(self, analysis_id: UUID) -> Optional[AnalysisDB]:
         """Get a demo analysis by ID (no user_id check, but must be demo user)."""
         db = await get_db()
         row = await db.fetchrow(
-            """
-            SELECT * FROM analyses WHERE id = $1 AND user_id = $2
-            """,
+            queries.SELECT_USER_ANALYSIS,
             analysis_id,
             DEMO_USER_ID,
         )
@@ -240,52 +382,120 @@ class AnalysisService:
         items: List[Dict[str, Any]],
         options: Optional[Dict[str, Any]] = None,
         webhook_url: Optional[str] = None,
+        priority: str = "normal",
         metadata: Optional[Dict[str, Any]] = None,
     ) -> BatchAnalysisResponse:
-        """Create a batch analysis job."""
-        batch_id = uuid4()
-        now = datetime.utcnow()
-
-        db = await get_db()
+        """
+        Create a batch analysis job.
 
-        # Create batch record
-        await db.execute(
-            """
-            INSERT INTO batch_analyses (
-                id, user_id, organization_id, status, total_items,
-                options, webhook_url, external_id, metadata, created_at, updated_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-            """,
-            batch_id,
-            user_id,
-            organization_id,
-            AnalysisStatus.PENDING.value,
-            len(items),
-            json.dumps(options or {}),
-            webhook_url,
-            metadata.get("external_id") if metadata else None,
-            json.dumps(metadata or {}),
-            now,
-            now,
-        )
+        The batch, an analyses row per item and the batch items are written
+        in one transaction, with the rows bulk-loaded through COPY, so
+        creation takes a fixed number of round trips and a failure leaves
+        nothing behind. A single batch message carries every item's job;
+        the worker's batch consumer publishes each to its type's queue.
+        """
+        batch_id = uuid4()
+        now = datetime.now(timezone.utc)
+        batch_priority = PRIORITY_VALUES.get(priority, 5)
 
-        # Create batch items
+        analysis_records = []
+        item_records = []
+        queued_items = []
         for idx, item in enumerate(items):
-            item_id = uuid4()
-            await db.execute(
-                """
-                INSERT INTO batch_items (id, batch_id, item_index, external_id, status, created_at, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-                """,
-                item_id,
-                batch_id,
-                idx,
-                item.get("id"),
-                AnalysisStatus.PENDING.value,
-                now,
-                now,
+            analysis_id = uuid4()
+            source = item.get("source") or {}
+            file_key = None
+            if source.get("type") in ("url", "youtube"):
+                file_key = source.get("url")
+            elif source.get("type") == "upload":
+                file_key = source.get("upload_id")
+            item_type = AnalysisType(item["type"]).value
+            item_priority = PRIORITY_VALUES.get(item.get("priority"), batch_priority)
+            item_options = {**(options or {}), **(item.get("options") or {})}
+
+            analysis_records.append(
+                (
+                    analysis_id,
+                    user_id,
+                    organization_id,
+                    item_type,
+                    AnalysisStatus.PENDING.value,
+                    item_priority,
+                    file_key,
+                    json.dumps(item_options),
+                    item.get("id"),
+                    json.dumps({"batch_id": str(batch_id)}),
+                    now,
+                    now,
+                )
+            )
+            item_records.append(
+                (
+                    uuid4(),
+                    batch_id,
+                    analysis_id,
+                    idx,
+                    item.get("id"),
+                    AnalysisStatus.PENDING.value,
+                    now,
+                    now,
+                )
+            )
+            # Same shape as _publish_analysis_job, plus the queue priority
+            queued_items.append(
+                {
+                    "analysis_id": str(analysis_id),
+                    "user_id": str(user_id),
+                    "organization_id": str(organization_id) if organization_id else None,
+                    "type": item_type,
+                    "file_key": file_key,
+                    "options": item_options,
+                    "priority": item_priority,
+                }
             )
 
+        db = await get_db()
+        async with db.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    INSERT INTO batch_analyses (
+                        id, user_id, organization_id, status, total_items,
+                        options, webhook_url, external_id, metadata, created_at, updated_at
+                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+                    """,
+                    batch_id,
+                    user_id,
+                    organization_id,
+                    AnalysisStatus.PENDING.value,
+                    len(items),
+                    json.dumps(options or {}),
+                    webhook_url,
+                    metadata.get("external_id") if metadata else None,
+                    json.dumps(metadata or {}),
+                    now,
+                    now,
+                )
+
+                await conn.copy_records_to_table(
+                    "analyses",
+                    records=analysis_records,
+                    columns=(
+                        "id", "user_id", "organization_id", "type", "status", "priority",
+                        "file_key", "options", "external_id", "metadata",
+                        "created_at", "updated_at",
+                    ),
+                )
+
+                await conn.copy_records_to_table(
+                    "batch_items",
+                    records=item_records,
+                    columns=(
+                        "id", "batch_id", "analysis_id", "item_index", "external_id",
+                        "status", "created_at", "updated_at",
+                    ),
+                )
+
         # Publish batch job to queue (only if RabbitMQ is enabled)
         if settings.use_rabbitmq:
             from src.core.rabbitmq import publish_message
@@ -294,11 +504,13 @@ class AnalysisService:
                     "batch_id": str(batch_id),
                     "user_id": str(user_id),
                     "organization_id": str(organization_id) if organization_id else None,
-                    "items": items,
+                    "items": queued_items,
                     "options": options,
                 }
             )
-            await publish_message(settings.queue_batch_analysis, message.encode(), priority=5)
+            await publish_message(
+                settings.queue_batch_analysis, message.encode(), priority=batch_priority
+            )
         else:
             logger.warning("Batch analysis requires RabbitMQ - job queued but won't process")
 
@@ -319,9 +531,7 @@ class AnalysisService:
         """Get an analysis by ID."""
         db = await get_db()
         row = await db.fetchrow(
-            """
-            SELECT * FROM analyses WHERE id = $1 AND user_id = $2
-            """,
+            queries.SELECT_USER_ANALYSIS,
             analysis_id,
             user_id,
         )
@@ -331,35 +541,118 @@ class AnalysisService:
 
         return self._row_to_analysis(row)
 
+    async def get_status_snapshot(
+        self, analysis_id: UUID, user_id: UUID
+    ) -> Optional[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Get an analysis's status row and, once completed, its results.
+
+        Served from the Redis read model; a miss is rebuilt from Postgres
+        and republished.
+
+        Returns:
+            (row, results) as JSON-safe dicts, or None if not found.
+        """
+        snapshot = await status_store.get(analysis_id)
+        if snapshot is None:
+            db = await get_db()
+            row = await db.fetchrow(queries.SELECT_ANALYSIS, analysis_id)
+            if not row:
+                return None
+            await status_store.publish(row)
+            snapshot = (status_row(row), None)
+
+        view, results = snapshot
+        if view["user_id"] != str(user_id):
+            return None
+
+        if view["status"] == AnalysisStatus.COMPLETED.value and results is None:
+            result = await self.get_analysis_result(analysis_id)
+            if result:
+                results = self._results_view(result)
+                await status_store.set_results(analysis_id, results)
+
+        return view, results
+
+    def _results_view(self, result: AnalysisResult) -> Dict[str, Any]:
+        """Serialize results the way GET /v1/analysis/{id} returns them."""
+        results = {
+            "verdict": result.verdict.value,
+            "confidence": result.confidence,
+            "risk_level": result.risk_level.value,
+            "summary": result.summary,
+            "detections": [d.model_dump(mode="json") for d in result.detections],
+            "ensemble_score": result.ensemble_score,
+            "heatmap_url": result.heatmap_url,
+        }
+        # Include video_analysis for video types
+        if result.video_analysis:
+            results["video_analysis"] = result.video_analysis
+        if result.face_tracking:
+            results["face_tracking"] = result.face_tracking
+        if result.audio_analysis:
+            results["audio_analysis"] = result.audio_analysis
+        return results
+
     async def get_analysis_result(self, analysis_id: UUID) -> Optional[AnalysisResult]:
         """Get analysis results."""
         db = await get_db()
         row = await db.fetchrow(
-            """
-            SELECT * FROM analysis_results WHERE analysis_id = $1
-            """,
+            queries.SELECT_ANALYSIS_RESULT,
             analysis_id,
         )
 
         if not row:
             return None
 
-        # Parse video_analysis if present
-        video_analysis = None
-        if row.get("video_analysis"):
-            video_analysis = json.loads(row["video_analysis"]) if isinstance(row["video_analysis"], str) else row["video_analysis"]
+        # jsonb columns arrive decoded (see core.database)
+        video_analysis = row["video_analysis"]
+
+        # Per-frame results live in analysis_frame_results; older rows
+        # still carry them inline
+        if video_analysis is not None and "frame_results" not in video_analysis:
+            frame_results = await self.get_frame_results(analysis_id)
+            video_analysis["frame_results"] = frame_results.to_dicts()
 
-        return AnalysisResult(
-            verdict=row["verdict"],
+        # Rows come from our own writers, so skip re-validating them
+        return AnalysisResult.model_construct(
+            verdict=VerdictType(row["verdict"]),
             confidence=float(row["confidence"]),
-            risk_level=row["risk_level"],
+            risk_level=RiskLevel(row["risk_level"]),
             summary=row["summary"],
-            detections=json.loads(row["detections"]) if row["detections"] else [],
+            detections=[
+                Detection.model_construct(
+                    model=d["model"],
+                    verdict=VerdictType(d["verdict"]),
+                    confidence=d["confidence"],
+                    details=d.get("details"),
+                )
+                for d in row["detections"] or []
+            ],
             ensemble_score=float(row["ensemble_score"]) if row["ensemble_score"] else None,
             heatmap_url=row["heatmap_url"],
+            metadata=None,
             video_analysis=video_analysis,
+            face_tracking=row["face_tracking"] or None,
+            audio_analysis=row["audio_analysis"] or None,
         )
 
+    async def get_frame_results(
+        self,
+        analysis_id: UUID,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> FrameResults:
+        """Get per-frame results, optionally limited to a time range in seconds."""
+        db = await get_db()
+        rows = await db.fetch(
+            queries.SELECT_FRAME_RESULTS,
+            analysis_id,
+            start,
+            end,
+        )
+        return FrameResults.from_windows(rows).slice_time(start, end)
+
     async def list_analyses(
         self,
         user_id: UUID,
@@ -367,11 +660,22 @@ class AnalysisService:
         cursor: Optional[str] = None,
         status: Optional[AnalysisStatus] = None,
         analysis_type: Optional[AnalysisType] = None,
-    ) -> List[AnalysisDB]:
-        """List analyses for a user with pagination."""
+    ) -> Tuple[List[AnalysisSummary], Optional[str]]:
+        """
+        List a user's analyses, newest first, with keyset pagination.
+
+        Pages continue strictly after the cursor's (created_at, id), which
+        idx_analyses_user_created serves as an index-only scan.
+
+        Returns:
+            The page and the cursor for the next one, or None on the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
         db = await get_db()
 
-        query = "SELECT * FROM analyses WHERE user_id = $1"
+        query = "SELECT id, type, status, file_name, created_at FROM analyses WHERE user_id = $1"
         params: List[Any] = [user_id]
         param_idx = 2
 
@@ -386,36 +690,44 @@ class AnalysisService:
             param_idx += 1
 
         if cursor:
-            # Decode cursor (base64 encoded id)
-            import base64
-
-            cursor_id = UUID(base64.b64decode(cursor).decode())
-            query += f" AND id < ${param_idx}"
-            params.append(cursor_id)
-            param_idx += 1
+            cursor_created_at, cursor_id = decode_list_cursor(cursor)
+            query += f" AND (created_at, id) < (${param_idx}, ${param_idx + 1})"
+            params.extend([cursor_created_at, cursor_id])
+            param_idx += 2
 
-        query += f" ORDER BY created_at DESC LIMIT ${param_idx}"
-        params.append(limit)
+        # One extra row tells whether there is a next page
+        query += f" ORDER BY created_at DESC, id DESC LIMIT ${param_idx}"
+        params.append(limit + 1)
 
         rows = await db.fetch(query, *params)
-        return [self._row_to_analysis(row) for row in rows]
+        analyses = [
+            AnalysisSummary.model_construct(
+                id=row["id"],
+                type=AnalysisType(row["type"]),
+                status=AnalysisStatus(row["status"]),
+                file_name=row["file_name"],
+                created_at=row["created_at"],
+            )
+            for row in rows[:limit]
+        ]
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_list_cursor(analyses[-1].created_at, analyses[-1].id)
+        return analyses, next_cursor
 
     async def cancel_analysis(self, analysis_id: UUID, user_id: UUID) -> bool:
         """Cancel a pending or processing analysis."""
         db = await get_db()
-        result = await db.execute(
-            """
-            UPDATE analyses
-            SET status = $3, updated_at = $4
-            WHERE id = $1 AND user_id = $2 AND status IN ('pending', 'processing')
-            """,
+        row = await db.fetchrow(
+            queries.CANCEL_ANALYSIS,
             analysis_id,
             user_id,
             AnalysisStatus.CANCELLED.value,
-            datetime.utcnow(),
         )
 
-        return "UPDATE 1" in result
+        await status_store.publish(row)
+        return row is not None
 
     async def update_progress(
         self,
@@ -425,25 +737,14 @@ class AnalysisService:
     ) -> None:
         """Update analysis progress (called by workers)."""
         db = await get_db()
-        await db.execute(
-            """
-            UPDATE analyses
-            SET progress = $2, current_stage = $3, updated_at = $4
-            WHERE id = $1
-            """,
+        row = await db.fetchrow(
+            queries.UPDATE_ANALYSIS_PROGRESS,
             analysis_id,
             progress,
             current_stage,
-            datetime.utcnow(),
         )
 
-        # Also cache in Redis for fast access
-        redis = await get_redis()
-        await redis.hset(
-            f"analysis:{analysis_id}:progress",
-            mapping={"progress": progress, "stage": current_stage or ""},
-        )
-        await redis.expire(f"analysis:{analysis_id}:progress", 3600)
+        await status_store.publish(row)
 
     async def _get_by_idempotency_key(self, key: str) -> Optional[AnalysisDB]:
         """Get analysis by idempotency key."""
@@ -486,8 +787,8 @@ class AnalysisService:
         logger.info(f"Published analysis job {analysis.id} to {queue}")
 
     def _row_to_analysis(self, row) -> AnalysisDB:
-        """Convert database row to AnalysisDB model."""
-        return AnalysisDB(
+        """Convert database row to AnalysisDB model, trusting it without validation."""
+        return AnalysisDB.model_construct(
             id=row["id"],
             user_id=row["user_id"],
             organization_id=row["organization_id"],
@@ -507,11 +808,11 @@ class AnalysisService:
             processing_started_at=row["processing_started_at"],
             processing_completed_at=row["processing_completed_at"],
             processing_time_ms=row["processing_time_ms"],
-            options=json.loads(row["options"]) if row["options"] else {},
+            options=row["options"] or {},
             webhook_url=row["webhook_url"],
             external_id=row["external_id"],
             idempotency_key=row["idempotency_key"],
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            metadata=row["metadata"] or {},
             error_code=row["error_code"],
             error_message=row["error_message"],
             retry_count=row["retry_count"] or 0,
@@ -0,0 +1,289 @@
+"""Global admission control for demo video analyses, shared across API replicas."""
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from src.core.config import settings
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_KEY = "demo_admission:active"  # ZSET analysis_id -> lease expiry (ms)
+QUEUE_KEY = "demo_admission:queue"  # ZSET analysis_id -> FIFO sequence
+WAITING_KEY = "demo_admission:waiting"  # ZSET analysis_id -> queued lease expiry (ms)
+SEQUENCE_KEY = "demo_admission:sequence"
+AVG_SECONDS_KEY = "demo_admission:avg_job_seconds"
+
+# Shared prologue: read the server clock and drop entries whose owners
+# stopped renewing (e.g. an API process that crashed)
+_PURGE = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', now)
+for _, id in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], id)
+end
+redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', now)
+"""
+
+# KEYS: active, queue, waiting, sequence
+# ARGV: analysis_id, lease_ms, max_active, max_queued
+# Returns 0 if admitted, the 1-based queue position, or -1 if the queue is full
+_ENQUEUE = _PURGE + """
+local active = redis.call('ZCARD', KEYS[1])
+local queued = redis.call('ZCARD', KEYS[2])
+if queued == 0 and active < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), ARGV[1])
+    return 0
+end
+if queued >= tonumber(ARGV[4]) then
+    return -1
+end
+redis.call('ZADD', KEYS[2], redis.call('INCR', KEYS[4]), ARGV[1])
+redis.call('ZADD', KEYS[3], now + tonumber(ARGV[2]), ARGV[1])
+return queued + 1
+"""
+
+# KEYS: active, queue, waiting
+# ARGV: analysis_id, lease_ms, max_active
+# Returns 0 if admitted, the 1-based queue position, or -1 if the entry expired
+_TRY_ADMIT = _PURGE + """
+local lease = now + tonumber(ARGV[2])
+if redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+    redis.call('ZADD', KEYS[1], lease, ARGV[1])
+    return 0
+end
+local rank = redis.call('ZRANK', KEYS[2], ARGV[1])
+if not rank then
+    return -1
+end
+if redis.call('ZCARD', KEYS[1]) + rank < tonumber(ARGV[3]) then
+    redis.call('ZREM', KEYS[2], ARGV[1])
+    redis.call('ZREM', KEYS[3], ARGV[1])
+    redis.call('ZADD', KEYS[1], lease, ARGV[1])
+    return 0
+end
+redis.call('ZADD', KEYS[3], lease, ARGV[1])
+return rank + 1
+"""
+
+# KEYS: active
+# ARGV: analysis_id, lease_ms
+# Returns 1 if the slot was extended, 0 if it already lapsed
+_RENEW = """
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+    return 0
+end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), ARGV[1])
+return 1
+"""
+
+# KEYS: active, queue, waiting, avg_seconds
+# ARGV: analysis_id, job_seconds (0 if the job never ran)
+_RELEASE = """
+local seconds = tonumber(ARGV[2])
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 1 and seconds > 0 then
+    local avg = tonumber(redis.call('GET', KEYS[4]) or ARGV[2])
+    redis.call('SET', KEYS[4], tostring(avg * 0.8 + seconds * 0.2))
+end
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('ZREM', KEYS[3], ARGV[1])
+return 1
+"""
+
+
+class DemoAdmissionRejected(Exception):
+    """Raised when a demo job can't be admitted or queued."""
+
+    def __init__(self, code: str, message: str, retry_after_seconds: int):
+        self.code = code
+        self.message = message
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(message)
+
+
+@dataclass
+class QueueStatus:
+    """Where a waiting demo job stands in the admission queue."""
+
+    position: int
+    estimated_start_at: datetime
+
+
+@dataclass
+class DemoLease:
+    """An admitted demo job's slot, renewed in the background until released."""
+
+    analysis_id: UUID
+    started_at: float = field(default_factory=time.monotonic)
+    renewer: Optional[asyncio.Task] = None
+
+
+class DemoAdmissionController:
+    """
+    Bounds how many demo analyses run at once across all API replicas.
+
+    At most demo_max_active jobs hold a slot; up to demo_max_queued more
+    wait in a FIFO queue, and anything beyond that is rejected so callers
+    can retry later. Slots and queue places are leases that their owning
+    process renews; if it dies, the lease lapses and the next job moves up.
+    All state lives in Redis and every transition is a single Lua script,
+    so replicas can't over-admit.
+
+    Demo jobs run in the API's own analysis pool and never enter the paid
+    RabbitMQ queues, so this cap is what bounds their share of capacity.
+    """
+
+    def __init__(
+        self,
+        max_active: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+    ):
+        self.max_active = max_active or settings.demo_max_active
+        self.max_queued = max_queued or settings.demo_max_queued
+        self.lease_ms = int((lease_seconds or settings.demo_lease_seconds) * 1000)
+        self.poll_interval = settings.demo_poll_interval_seconds
+
+    async def enqueue(self, analysis_id: UUID) -> int:
+        """
+        Take a slot or a queue place for a new demo job.
+
+        Returns:
+            0 if the job was admitted straight away, else its queue position.
+
+        Raises:
+            DemoAdmissionRejected: If the queue is full.
+        """
+        redis = await get_redis()
+        result = int(
+            await redis.eval(
+                _ENQUEUE,
+                4,
+                ACTIVE_KEY, QUEUE_KEY, WAITING_KEY, SEQUENCE_KEY,
+                str(analysis_id), self.lease_ms, self.max_active, self.max_queued,
+            )
+        )
+
+        if result < 0:
+            retry_after = max(1, math.ceil(await self._avg_job_seconds()))
+            logger.warning(f"Demo queue full ({self.max_queued}); rejecting {analysis_id}")
+            raise DemoAdmissionRejected(
+                code="DEMO_AT_CAPACITY",
+                message="The demo is at capacity. Please try again shortly",
+                retry_after_seconds=retry_after,
+            )
+
+        if result > 0:
+            logger.info(f"Demo analysis {analysis_id} queued at position {result}")
+        return result
+
+    async def acquire(self, analysis_id: UUID) -> DemoLease:
+        """
+        Wait until an enqueued job reaches the front and holds a slot.
+
+        Raises:
+            DemoAdmissionRejected: If the job's queue place lapsed.
+        """
+        redis = await get_redis()
+        try:
+            while True:
+                result = int(
+                    await redis.eval(
+                        _TRY_ADMIT,
+                        3,
+                        ACTIVE_KEY, QUEUE_KEY, WAITING_KEY,
+                        str(analysis_id), self.lease_ms, self.max_active,
+                    )
+                )
+                if result == 0:
+                    break
+                if result < 0:
+                    raise DemoAdmissionRejected(
+                        code="SERVER_BUSY",
+                        message="The demo queue timed out. Please try again",
+                        retry_after_seconds=max(1, math.ceil(await self._avg_job_seconds())),
+                    )
+                await asyncio.sleep(self.poll_interval)
+        except BaseException:
+            # Give the place up now rather than when its lease lapses
+            await self._release(analysis_id, 0)
+            raise
+
+        lease = DemoLease(analysis_id=analysis_id)
+        lease.renewer = asyncio.create_task(self._renew(lease))
+        return lease
+
+    async def release(self, lease: DemoLease) -> None:
+        """Free a slot and fold the job's runtime into the start estimate."""
+        if lease.renewer:
+            lease.renewer.cancel()
+        await self._release(lease.analysis_id, time.monotonic() - lease.started_at)
+
+    async def discard(self, analysis_id: UUID) -> None:
+        """Drop a job's slot or queue place without recording a runtime."""
+        await self._release(analysis_id, 0)
+
+    async def queue_status(self, analysis_id: UUID) -> Optional[QueueStatus]:
+        """
+        Get a waiting job's queue position and estimated start time.
+
+        Returns:
+            None if the job isn't queued (it's running, finished or unknown).
+        """
+        redis = await get_redis()
+        pipe = redis.pipeline()
+        pipe.zrank(QUEUE_KEY, str(analysis_id))
+        pipe.get(AVG_SECONDS_KEY)
+        rank, avg = await pipe.execute()
+        if rank is None:
+            return None
+
+        avg_seconds = float(avg) if avg else settings.demo_expected_job_seconds
+        # Each wave of max_active jobs ahead of this one takes about one job's runtime
+        waves = rank // self.max_active + 1
+        return QueueStatus(
+            position=rank + 1,
+            estimated_start_at=datetime.now(timezone.utc) + timedelta(seconds=waves * avg_seconds),
+        )
+
+    async def _renew(self, lease: DemoLease) -> None:
+        redis = await get_redis()
+        interval = self.lease_ms / 3000
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await redis.eval(
+                    _RENEW, 1, ACTIVE_KEY, str(lease.analysis_id), self.lease_ms
+                )
+                if not int(renewed):
+                    logger.warning(f"Demo slot for {lease.analysis_id} lapsed while running")
+            except Exception as e:
+                logger.warning(f"Failed to renew demo slot for {lease.analysis_id}: {e}")
+
+    async def _release(self, analysis_id: UUID, job_seconds: float) -> None:
+        redis = await get_redis()
+        await redis.eval(
+            _RELEASE,
+            4,
+            ACTIVE_KEY, QUEUE_KEY, WAITING_KEY, AVG_SECONDS_KEY,
+            str(analysis_id), job_seconds,
+        )
+
+    async def _avg_job_seconds(self) -> float:
+        redis = await get_redis()
+        avg = await redis.get(AVG_SECONDS_KEY)
+        return float(avg) if avg else settings.demo_expected_job_seconds
+
+
+# Singleton instance
+demo_admission = DemoAdmissionController()
@@ -0,0 +1,122 @@
+"""CPU-bound frame scoring for in-process video analysis, run in pool processes."""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from src.detectors.image_detector import ImageDetector
+from src.video.face_tracker import FaceObservation, FaceTracker, FaceTrackResults
+from src.video.frame_extractor import ExtractedFrame, FrameExtractor
+from src.video.frame_results import FrameResults
+from src.video.profiles import QualityProfile, get_profile
+
+logger = logging.getLogger(__name__)
+
+
+class FrameScorer:
+    """Decodes a downloaded video, tracks faces and scores each frame."""
+
+    FACE_MARGIN = 0.2
+
+    def __init__(self):
+        self.image_detector = ImageDetector()
+        self.frame_extractor = FrameExtractor(frames_per_second=1)
+
+    async def score(
+        self, video_path: str, profile: QualityProfile, max_frames: int
+    ) -> Tuple[FrameResults, FaceTrackResults]:
+        """
+        Extract and analyze frames, stopping early when the profile allows it.
+
+        Detectors run on tracked face crops when a frame has faces, and on
+        the whole frame otherwise.
+        """
+        frames = await self.frame_extractor.extract(
+            video_path,
+            max_frames=max_frames,
+            frames_per_second=profile.frames_per_second,
+            max_dimension=profile.decode_max_dimension,
+        )
+
+        results = FrameResults(capacity=len(frames))
+        face_results = FaceTrackResults()
+        detector_options = profile.detector_options({})
+        tracker = FaceTracker()
+
+        for i, frame in enumerate(frames):
+            faces = tracker.update(frame.image)
+            ai_probability = await self._analyze_frame_regions(
+                frame, faces, detector_options, face_results
+            )
+            results.append(frame.timestamp, ai_probability)
+
+            if profile.should_exit_early(len(results), results.mean_probability()):
+                logger.info(f"Early exit after {i + 1}/{len(frames)} frames")
+                break
+
+        return results, face_results
+
+    async def _analyze_frame_regions(
+        self,
+        frame: ExtractedFrame,
+        faces: List[FaceObservation],
+        detector_options: dict,
+        face_results: FaceTrackResults,
+    ) -> float:
+        """Score a frame from its face crops, falling back to the whole frame."""
+        frame_pixels = frame.image.shape[0] * frame.image.shape[1]
+
+        if not faces:
+            frame_bytes = self.frame_extractor.frame_to_bytes(frame, format="png")
+            detection_result = await self.image_detector.detect(frame_bytes, detector_options)
+            face_results.record_frame(frame_pixels, frame_pixels, had_faces=False)
+            return self._extract_ai_probability(detection_result)
+
+        probabilities = []
+        detector_pixels = 0
+        for face in faces:
+            region = face.box.expanded(self.FACE_MARGIN, frame.image.shape)
+            crop = ExtractedFrame(
+                timestamp=frame.timestamp,
+                frame_number=frame.frame_number,
+                image=region.crop(frame.image),
+            )
+            crop_bytes = self.frame_extractor.frame_to_bytes(crop, format="png")
+            detection_result = await self.image_detector.detect(crop_bytes, detector_options)
+
+            ai_probability = self._extract_ai_probability(detection_result)
+            face_results.add(face.track_id, frame.timestamp, face.box, ai_probability)
+            probabilities.append(ai_probability)
+            detector_pixels += region.area
+
+        face_results.record_frame(frame_pixels, detector_pixels, had_faces=True)
+        return max(probabilities)
+
+    def _extract_ai_probability(self, detection_result: dict) -> float:
+        """Extract AI probability from detection result."""
+        if detection_result.get("ensemble_score") is not None:
+            return detection_result["ensemble_score"]
+
+        confidence = detection_result.get("confidence", 0.5)
+        verdict = detection_result.get("verdict", "inconclusive")
+
+        if verdict in ("ai_generated", "likely_ai"):
+            return confidence
+        elif verdict in ("authentic", "likely_authentic"):
+            return 1 - confidence
+        else:
+            return 0.5
+
+
+# Built on first use, so detectors load once per pool process
+_scorer: Optional[FrameScorer] = None
+
+
+def score_video(
+    video_path: str, quality: Optional[str], max_frames: int
+) -> Tuple[FrameResults, FaceTrackResults]:
+    """Pool entry point: score a downloaded video in the calling process."""
+    global _scorer
+    if _scorer is None:
+        _scorer = FrameScorer()
+    return asyncio.run(_scorer.score(video_path, get_profile(quality), max_frames))
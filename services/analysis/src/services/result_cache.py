@@ -0,0 +1,182 @@
+"""Whole-video result cache keyed by YouTube video ID and pipeline config."""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from src.core.database import get_db
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever detectors, sampling or aggregation change in a way that
+# alters results, so stale entries stop matching
+PIPELINE_VERSION = "video-frames-v3"
+
+RESULT_CACHE_TTL = 24 * 3600  # 24 hours
+
+
+def result_cache_key(video_id: str, sampling: Dict[str, Any]) -> str:
+    """
+    Build the cache key for a video analysis.
+
+    Args:
+        video_id: The YouTube video ID.
+        sampling: The sampling configuration the pipeline will run with.
+
+    Returns:
+        A stable key combining video ID, sampling config and pipeline version.
+    """
+    config = json.dumps(
+        {"sampling": sampling, "pipeline": PIPELINE_VERSION},
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(config.encode()).hexdigest()[:16]
+    return f"{video_id}:{digest}"
+
+
+class VideoResultCache:
+    """Finds completed analyses with the same cache key and clones them."""
+
+    async def lookup(self, cache_key: str) -> Optional[UUID]:
+        """
+        Find a completed analysis whose results can be reused.
+
+        Checks Redis first and falls back to the analyses table.
+
+        Returns:
+            The source analysis ID, or None on a miss.
+        """
+        redis = await get_redis()
+        redis_key = f"video_result:{cache_key}"
+
+        cached = await redis.get(redis_key)
+        if cached:
+            return UUID(cached)
+
+        db = await get_db()
+        source_id = await db.fetchval(
+            """
+            SELECT a.id FROM analyses a
+            JOIN analysis_results r ON r.analysis_id = a.id
+            WHERE a.options->>'result_cache_key' = $1 AND a.status = 'completed'
+            ORDER BY a.processing_completed_at DESC
+            LIMIT 1
+            """,
+            cache_key,
+        )
+        if source_id is None:
+            return None
+
+        await redis.setex(redis_key, RESULT_CACHE_TTL, str(source_id))
+        return source_id
+
+    async def forget(self, cache_key: str) -> None:
+        """Drop the Redis pointer for a cache key whose source is gone."""
+        redis = await get_redis()
+        await redis.delete(f"video_result:{cache_key}")
+
+    async def clone(
+        self,
+        source_id: UUID,
+        analysis_id: UUID,
+        user_id: UUID,
+        organization_id: Optional[UUID],
+        priority: int,
+        options: Dict[str, Any],
+        webhook_url: Optional[str],
+        external_id: Optional[str],
+        metadata: Dict[str, Any],
+    ):
+        """
+        Clone a completed analysis and its results into a new analysis row.
+
+        Returns:
+            The new analyses row, or None if the source disappeared.
+        """
+        now = datetime.now(timezone.utc)
+        db = await get_db()
+
+        async with db.acquire() as conn:
+            async with conn.transaction():
+                row = await conn.fetchrow(
+                    """
+                    INSERT INTO analyses (
+                        id, user_id, organization_id, type, status, priority,
+                        file_key, file_name, file_size_bytes, file_mime_type, file_hash,
+                        duration_seconds, resolution, fps, progress,
+                        processing_started_at, processing_completed_at, processing_time_ms,
+                        options, webhook_url, external_id, metadata, created_at, updated_at
+                    )
+                    SELECT
+                        $1, $2, $3, type, 'completed', $4,
+                        file_key, file_name, file_size_bytes, file_mime_type, file_hash,
+                        duration_seconds, resolution, fps, 100,
+                        $5, $5, 0,
+                        $6, $7, $8, $9, $5, $5
+                    FROM analyses WHERE id = $10
+                    RETURNING *
+                    """,
+                    analysis_id,
+                    user_id,
+                    organization_id,
+                    priority,
+                    now,
+                    json.dumps(options),
+                    webhook_url,
+                    external_id,
+                    json.dumps(metadata),
+                    source_id,
+                )
+                if row is None:
+                    return None
+
+                await conn.execute(
+                    """
+                    INSERT INTO analysis_results (
+                        id, analysis_id, verdict, confidence, risk_level, summary,
+                        ensemble_score, detections, heatmap_url, visualization_urls,
+                        metadata_analysis, video_analysis, audio_analysis,
+                        temporal_analysis, face_tracking, manipulation_segments,
+                        c2pa_verified, c2pa_data, watermark_detected, watermark_type,
+                        created_at
+                    )
+                    SELECT
+                        gen_random_uuid(), $1, verdict, confidence, risk_level, summary,
+                        ensemble_score, detections, heatmap_url, visualization_urls,
+                        metadata_analysis, video_analysis, audio_analysis,
+                        temporal_analysis, face_tracking, manipulation_segments,
+                        c2pa_verified, c2pa_data, watermark_detected, watermark_type,
+                        $2
+                    FROM analysis_results WHERE analysis_id = $3
+                    """,
+                    analysis_id,
+                    now,
+                    source_id,
+                )
+
+                await conn.execute(
+                    """
+                    INSERT INTO analysis_frame_results (
+                        analysis_id, window_index, start_ts, end_ts,
+                        timestamps, ai_probabilities, created_at
+                    )
+                    SELECT
+                        $1, window_index, start_ts, end_ts,
+                        timestamps, ai_probabilities, $2
+                    FROM analysis_frame_results WHERE analysis_id = $3
+                    """,
+                    analysis_id,
+                    now,
+                    source_id,
+                )
+
+        logger.info(f"Served analysis {analysis_id} from result cache (source {source_id})")
+        return row
+
+
+# Singleton instance
+video_result_cache = VideoResultCache()
@@ -0,0 +1,146 @@
+"""Redis read model of analysis status for polling clients."""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Columns of the analyses row the status endpoint serves. The ml-worker
+# keeps an identical copy of this module's write side.
+STATUS_FIELDS = (
+    "id",
+    "user_id",
+    "type",
+    "status",
+    "progress",
+    "current_stage",
+    "error_code",
+    "error_message",
+    "file_name",
+    "file_size_bytes",
+    "file_mime_type",
+    "created_at",
+    "updated_at",
+    "processing_completed_at",
+    "processing_time_ms",
+)
+
+# Writes carry the row's updated_at as a version, so a slow writer can't
+# roll the document back past a newer one. Accepted rows are also published
+# on the analysis's events channel for streaming clients.
+# KEYS: status, events
+# ARGV: version, row json, ttl seconds
+_PUBLISH = """
+local current = redis.call('HGET', KEYS[1], 'version')
+if current and tonumber(current) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'version', ARGV[1], 'row', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('PUBLISH', KEYS[2], ARGV[2])
+return 1
+"""
+
+
+def status_key(analysis_id: Any) -> str:
+    return f"analysis:{analysis_id}:status"
+
+
+def events_channel(analysis_id: Any) -> str:
+    return f"analysis:{analysis_id}:events"
+
+
+def status_row(row: Any) -> Dict[str, Any]:
+    """JSON-safe projection of an analyses row onto STATUS_FIELDS."""
+    view = {}
+    for field in STATUS_FIELDS:
+        value = row[field]
+        if isinstance(value, UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        view[field] = value
+    return view
+
+
+def row_version(row: Any) -> int:
+    """The row's updated_at in microseconds since the epoch."""
+    updated_at = row["updated_at"]
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return int(updated_at.timestamp() * 1_000_000)
+
+
+class StatusStore:
+    """
+    Holds each analysis's status row, and its results once completed, in Redis.
+
+    Everything that updates an analysis publishes the row its UPDATE
+    returned, so the document tracks Postgres without the status endpoint
+    querying it and streaming clients get the row pushed to them.
+    Documents expire after status_cache_ttl_seconds without writes and are
+    rebuilt from Postgres on the next read. Postgres stays the source of
+    truth: Redis errors are logged and reads fall back.
+    """
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds or settings.status_cache_ttl_seconds
+        self._script = None
+
+    async def publish(self, row: Any) -> None:
+        """Publish an analyses row (e.g. from UPDATE ... RETURNING *)."""
+        if row is None:
+            return
+        try:
+            redis = await get_redis()
+            if self._script is None:
+                self._script = redis.register_script(_PUBLISH)
+            await self._script(
+                keys=[status_key(row["id"]), events_channel(row["id"])],
+                args=[row_version(row), orjson.dumps(status_row(row)), self.ttl_seconds],
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to publish status of analysis {row['id']}: {e}")
+
+    async def get(
+        self, analysis_id: UUID
+    ) -> Optional[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Get the cached status row and results of an analysis.
+
+        Returns:
+            (row, results) with results None until cached, or None on a miss.
+        """
+        try:
+            redis = await get_redis()
+            row, results = await redis.hmget(status_key(analysis_id), "row", "results")
+        except RedisError as e:
+            logger.warning(f"Status read model unavailable: {e}")
+            return None
+
+        if row is None:
+            return None
+        return orjson.loads(row), orjson.loads(results) if results else None
+
+    async def set_results(self, analysis_id: UUID, results: Dict[str, Any]) -> None:
+        """Cache the serialized results of a completed analysis."""
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline()
+            pipe.hset(status_key(analysis_id), "results", orjson.dumps(results))
+            pipe.expire(status_key(analysis_id), self.ttl_seconds)
+            await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to cache results of analysis {analysis_id}: {e}")
+
+
+# Singleton instance
+status_store = StatusStore()
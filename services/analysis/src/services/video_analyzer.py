@@ -3,18 +3,22 @@
 import asyncio
 import json
 import logging
-import os
-import shutil
-import tempfile
-from dataclasses import dataclass
-from datetime import datetime
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Optional
 from uuid import UUID
 
+from src.core import queries
+from src.core.config import settings
 from src.core.database import get_db
-from src.detectors.image_detector import ImageDetector
+from src.services.analysis_pool import analysis_pool
+from src.services.demo_admission import DemoAdmissionRejected, DemoLease, demo_admission
+from src.services.frame_scorer import score_video
+from src.services.status_store import status_store
 from src.video.downloader import VideoDownloader, VideoInfo, DownloadError
-from src.video.frame_extractor import FrameExtractor, ExtractedFrame
+from src.video.face_tracker import FaceTrackResults
+from src.video.frame_results import FRAME_WINDOW_SECONDS, FrameResults, SuspiciousSegment
+from src.video.profiles import QualityProfile, get_profile
+from src.video.workspace import Workspace, WorkspaceManager, WorkspaceQuotaExceeded
 
 logger = logging.getLogger(__name__)
 
@@ -23,23 +27,6 @@ DEMO_MAX_DURATION = 20
 DEMO_MAX_FRAMES = 20
 
 
-@dataclass
-class FrameAnalysisResult:
-    """Result of analyzing a single frame."""
-    timestamp: float
-    ai_probability: float
-    verdict: str
-    confidence: float
-
-
-@dataclass
-class SuspiciousSegment:
-    """A segment of video with high AI probability."""
-    start: float
-    end: float
-    avg_ai_probability: float
-
-
 class VideoAnalyzer:
     """Synchronous video analyzer that processes videos directly."""
 
@@ -47,66 +34,99 @@ class VideoAnalyzer:
     SEGMENT_GAP_THRESHOLD = 3.0
 
     def __init__(self):
-        self.image_detector = ImageDetector()
-        self.frame_extractor = FrameExtractor(frames_per_second=1)
+        self.workspaces = WorkspaceManager(
+            root=settings.scratch_dir,
+            quota_bytes=settings.scratch_quota_bytes,
+            wait_seconds=settings.scratch_wait_seconds,
+        )
 
     async def analyze_demo_video(
         self,
         analysis_id: UUID,
         youtube_url: str,
+        quality: Optional[str] = None,
     ) -> None:
         """
         Analyze a demo video synchronously.
 
+        Download and database work run here; decoding and detection run
+        in the analysis pool so they never block the API event loop.
         Updates database with progress and stores results.
         """
-        temp_dir = None
-        video_path = None
+        workspace: Optional[Workspace] = None
+        lease: Optional[DemoLease] = None
+        profile = get_profile(quality)
 
         try:
-            temp_dir = tempfile.mkdtemp(prefix="demo_video_")
+            # Wait for a global demo slot; immediate unless demos are at capacity
+            lease = await demo_admission.acquire(analysis_id)
             logger.info(f"Starting demo video analysis: {analysis_id}")
 
+            # Reserve scratch space, waiting briefly for other demos to finish
+            downloader = VideoDownloader(max_duration=DEMO_MAX_DURATION)
+            workspace = await self.workspaces.acquire(
+                downloader.estimate_download_bytes(DEMO_MAX_DURATION, profile.max_resolution),
+                prefix="demo_video",
+            )
+
             # Update status: downloading
             await self._update_status(analysis_id, "processing", 5, "downloading")
 
             # Download video
-            downloader = VideoDownloader(temp_dir=temp_dir, max_duration=DEMO_MAX_DURATION)
-            video_info = await downloader.download(youtube_url)
+            downloader = VideoDownloader(max_duration=DEMO_MAX_DURATION, workspace=workspace)
+            video_info = await downloader.download(
+                youtube_url,
+                max_seconds=DEMO_MAX_DURATION,
+                max_resolution=profile.max_resolution,
+            )
             video_path = video_info.file_path
 
             # Update file info
             await self._update_file_info(analysis_id, video_info)
 
-            # Update status: extracting frames
-            await self._update_status(analysis_id, "processing", 20, "extracting")
-
-            # Extract frames
-            frames = await self.frame_extractor.extract(
-                video_path,
-                max_frames=DEMO_MAX_FRAMES,
-            )
-
             # Update status: analyzing
             await self._update_status(analysis_id, "processing", 30, "analyzing")
 
-            # Analyze frames
-            frame_results = await self._analyze_frames(analysis_id, frames)
+            # Extract, track and score frames in a pool process
+            frame_results, face_results = await analysis_pool.run(
+                score_video,
+                video_path,
+                profile.name,
+                min(DEMO_MAX_FRAMES, profile.max_frames),
+            )
 
             # Aggregate and store results
             await self._update_status(analysis_id, "processing", 90, "complete")
-            await self._aggregate_and_store_results(analysis_id, video_info, frame_results)
+            await self._aggregate_and_store_results(
+                analysis_id, video_info, frame_results, face_results, profile
+            )
 
             # Mark as completed
             await self._update_status(analysis_id, "completed", 100, None)
             logger.info(f"Completed demo video analysis: {analysis_id}")
 
-        except DownloadError as e:
+        except (DownloadError, WorkspaceQuotaExceeded, DemoAdmissionRejected) as e:
             logger.error(f"Download error: {e.code} - {e.message}")
             await self._update_status(
                 analysis_id, "failed", 0, None,
                 error_code=e.code, error_message=e.message
             )
+        except BrokenProcessPool:
+            logger.error(f"Analysis pool process died while scoring {analysis_id}")
+            await self._update_status(
+                analysis_id, "failed", 0, None,
+                error_code="PROCESSING_ERROR",
+                error_message="Video analysis was interrupted. Please try again",
+            )
+        except asyncio.CancelledError:
+            # Shutdown cancelled the job; don't leave it stuck in processing
+            logger.warning(f"Demo video analysis {analysis_id} cancelled by shutdown")
+            await self._update_status(
+                analysis_id, "failed", 0, None,
+                error_code="SERVICE_SHUTDOWN",
+                error_message="The service restarted during analysis. Please try again",
+            )
+            raise
         except Exception as e:
             logger.error(f"Failed to process video: {e}", exc_info=True)
             await self._update_status(
@@ -114,74 +134,26 @@ class VideoAnalyzer:
                 error_code="PROCESSING_ERROR", error_message=str(e)
             )
         finally:
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    shutil.rmtree(temp_dir)
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup temp dir: {e}")
-
-    async def _analyze_frames(
-        self,
-        analysis_id: UUID,
-        frames: List[ExtractedFrame],
-    ) -> List[FrameAnalysisResult]:
-        """Analyze each frame."""
-        results: List[FrameAnalysisResult] = []
-        total_frames = len(frames)
-
-        for i, frame in enumerate(frames):
-            frame_bytes = self.frame_extractor.frame_to_bytes(frame, format="png")
-            detection_result = await self.image_detector.detect(frame_bytes, {})
-            ai_probability = self._extract_ai_probability(detection_result)
-
-            results.append(
-                FrameAnalysisResult(
-                    timestamp=frame.timestamp,
-                    ai_probability=ai_probability,
-                    verdict=detection_result["verdict"],
-                    confidence=detection_result["confidence"],
-                )
-            )
-
-            # Update progress
-            progress = 30 + int((i / total_frames) * 60)
-            await self._update_status(
-                analysis_id, "processing", progress,
-                f"analyzing ({i + 1}/{total_frames})"
-            )
-
-        return results
-
-    def _extract_ai_probability(self, detection_result: dict) -> float:
-        """Extract AI probability from detection result."""
-        if detection_result.get("ensemble_score") is not None:
-            return detection_result["ensemble_score"]
-
-        confidence = detection_result.get("confidence", 0.5)
-        verdict = detection_result.get("verdict", "inconclusive")
-
-        if verdict in ("ai_generated", "likely_ai"):
-            return confidence
-        elif verdict in ("authentic", "likely_authentic"):
-            return 1 - confidence
-        else:
-            return 0.5
+            if workspace:
+                await self.workspaces.release(workspace)
+            if lease:
+                await demo_admission.release(lease)
 
     async def _aggregate_and_store_results(
         self,
         analysis_id: UUID,
         video_info: VideoInfo,
-        frame_results: List[FrameAnalysisResult],
+        frame_results: FrameResults,
+        face_results: FaceTrackResults,
+        profile: QualityProfile,
     ) -> None:
         """Aggregate results and store in database."""
-        if frame_results:
-            avg_ai_prob = sum(r.ai_probability for r in frame_results) / len(frame_results)
-            max_ai_prob = max(r.ai_probability for r in frame_results)
-        else:
-            avg_ai_prob = 0.0
-            max_ai_prob = 0.0
+        avg_ai_prob = frame_results.mean_probability()
+        max_ai_prob = frame_results.max_probability()
 
-        suspicious_segments = self._find_suspicious_segments(frame_results)
+        suspicious_segments = frame_results.find_segments(
+            self.SUSPICIOUS_THRESHOLD, self.SEGMENT_GAP_THRESHOLD
+        )
         verdict, confidence, risk_level = self._determine_verdict(
             avg_ai_prob, max_ai_prob, suspicious_segments
         )
@@ -190,13 +162,9 @@ class VideoAnalyzer:
             "youtube_id": video_info.video_id,
             "youtube_title": video_info.title,
             "frames_analyzed": len(frame_results),
-            "frame_results": [
-                {
-                    "timestamp": r.timestamp,
-                    "ai_probability": round(r.ai_probability, 3),
-                }
-                for r in frame_results
-            ],
+            "quality": profile.name,
+            "face_roi": face_results.summary(len(frame_results)),
+            "timings": video_info.timings,
             "suspicious_segments": [
                 {
                     "start": seg.start,
@@ -218,39 +186,8 @@ class VideoAnalyzer:
             risk_level=risk_level,
             summary=summary,
             video_analysis=video_analysis,
-        )
-
-    def _find_suspicious_segments(
-        self, frame_results: List[FrameAnalysisResult]
-    ) -> List[SuspiciousSegment]:
-        """Find contiguous segments with high AI probability."""
-        segments: List[SuspiciousSegment] = []
-        current_segment_frames: List[FrameAnalysisResult] = []
-
-        for result in frame_results:
-            if result.ai_probability >= self.SUSPICIOUS_THRESHOLD:
-                if current_segment_frames:
-                    gap = result.timestamp - current_segment_frames[-1].timestamp
-                    if gap > self.SEGMENT_GAP_THRESHOLD:
-                        segments.append(self._create_segment(current_segment_frames))
-                        current_segment_frames = []
-                current_segment_frames.append(result)
-            else:
-                if current_segment_frames:
-                    segments.append(self._create_segment(current_segment_frames))
-                    current_segment_frames = []
-
-        if current_segment_frames:
-            segments.append(self._create_segment(current_segment_frames))
-
-        return segments
-
-    def _create_segment(self, frames: List[FrameAnalysisResult]) -> SuspiciousSegment:
-        """Create a suspicious segment."""
-        return SuspiciousSegment(
-            start=frames[0].timestamp,
-            end=frames[-1].timestamp,
-            avg_ai_probability=sum(f.ai_probability for f in frames) / len(frames),
+            frame_results=frame_results,
+            face_tracking=face_results.to_json(),
         )
 
     def _determine_verdict(
@@ -274,15 +211,13 @@ class VideoAnalyzer:
     def _generate_summary(
         self,
         video_info: VideoInfo,
-        frame_results: List[FrameAnalysisResult],
+        frame_results: FrameResults,
         suspicious_segments: List[SuspiciousSegment],
         verdict: str,
     ) -> str:
         """Generate summary."""
         total_frames = len(frame_results)
-        suspicious_frames = sum(
-            1 for r in frame_results if r.ai_probability >= self.SUSPICIOUS_THRESHOLD
-        )
+        suspicious_frames = frame_results.count_at_or_above(self.SUSPICIOUS_THRESHOLD)
 
         if verdict == "ai_generated":
             summary = "This video shows strong indicators of AI-generated content. "
@@ -316,16 +251,8 @@ class VideoAnalyzer:
     ) -> None:
         """Update analysis status in database."""
         db = await get_db()
-        await db.execute(
-            """
-            UPDATE analyses
-            SET status = $2::analysis_status, progress = $3, current_stage = $4,
-                error_code = $5, error_message = $6,
-                processing_started_at = CASE WHEN $2 = 'processing' AND processing_started_at IS NULL THEN NOW() ELSE processing_started_at END,
-                processing_completed_at = CASE WHEN $2 IN ('completed', 'failed') THEN NOW() ELSE processing_completed_at END,
-                updated_at = NOW()
-            WHERE id = $1
-            """,
+        row = await db.fetchrow(
+            queries.UPDATE_ANALYSIS_STATUS,
             analysis_id,
             status,
             progress,
@@ -333,26 +260,22 @@ class VideoAnalyzer:
             error_code,
             error_message,
         )
+        await status_store.publish(row)
 
     async def _update_file_info(self, analysis_id: UUID, video_info: VideoInfo) -> None:
         """Update file info in database."""
         db = await get_db()
-        await db.execute(
-            """
-            UPDATE analyses
-            SET file_name = $2, file_size_bytes = $3, file_mime_type = $4,
-                duration_seconds = $5, resolution = $6, fps = $7,
-                updated_at = NOW()
-            WHERE id = $1
-            """,
+        row = await db.fetchrow(
+            queries.UPDATE_ANALYSIS_FILE_INFO,
             analysis_id,
             video_info.title,
             video_info.file_size_bytes,
-            "video/mp4",
+            video_info.mime_type,
             video_info.duration_seconds,
             video_info.resolution,
             video_info.fps,
         )
+        await status_store.publish(row)
 
     async def _store_result(
         self,
@@ -362,8 +285,10 @@ class VideoAnalyzer:
         risk_level: str,
         summary: str,
         video_analysis: dict,
+        frame_results: FrameResults,
+        face_tracking: List[dict],
     ) -> None:
-        """Store analysis result."""
+        """Store analysis result and per-frame windows."""
         detections = [
             {
                 "model": "video_frame_analyzer",
@@ -377,24 +302,42 @@ class VideoAnalyzer:
         ]
 
         db = await get_db()
-        await db.execute(
-            """
-            INSERT INTO analysis_results (
-                id, analysis_id, verdict, confidence, risk_level, summary,
-                detections, ensemble_score, video_analysis, created_at
-            ) VALUES (
-                gen_random_uuid(), $1, $2, $3, $4, $5, $6, $7, $8, NOW()
-            )
-            """,
-            analysis_id,
-            verdict,
-            confidence,
-            risk_level,
-            summary,
-            json.dumps(detections),
-            confidence,
-            json.dumps(video_analysis),
-        )
+        async with db.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(
+                    """
+                    INSERT INTO analysis_frame_results (
+                        analysis_id, window_index, start_ts, end_ts, timestamps, ai_probabilities
+                    ) VALUES ($1, $2, $3, $4, $5, $6)
+                    ON CONFLICT (analysis_id, window_index) DO UPDATE
+                    SET start_ts = EXCLUDED.start_ts, end_ts = EXCLUDED.end_ts,
+                        timestamps = EXCLUDED.timestamps,
+                        ai_probabilities = EXCLUDED.ai_probabilities
+                    """,
+                    [
+                        (analysis_id, *window)
+                        for window in frame_results.windows(FRAME_WINDOW_SECONDS)
+                    ],
+                )
+                await conn.execute(
+                    """
+                    INSERT INTO analysis_results (
+                        id, analysis_id, verdict, confidence, risk_level, summary,
+                        detections, ensemble_score, video_analysis, face_tracking, created_at
+                    ) VALUES (
+                        gen_random_uuid(), $1, $2, $3, $4, $5, $6, $7, $8, $9, NOW()
+                    )
+                    """,
+                    analysis_id,
+                    verdict,
+                    confidence,
+                    risk_level,
+                    summary,
+                    json.dumps(detections),
+                    confidence,
+                    json.dumps(video_analysis),
+                    json.dumps(face_tracking),
+                )
 
 
 # Singleton instance
@@ -1,19 +1,28 @@
 """Video analysis service for YouTube URL processing."""
 
+import json
 import logging
 import re
-from typing import Optional
+from typing import Any, Dict, Optional
 from urllib.parse import parse_qs, urlparse
 
+from src.core.redis import get_redis
+from src.video.downloader import DownloadError, VideoDownloader
+
 logger = logging.getLogger(__name__)
 
+# Video metadata cache
+VIDEO_INFO_TTL = 6 * 3600  # 6 hours
+VIDEO_INFO_UNAVAILABLE_TTL = 300  # Re-check unavailable videos after 5 minutes
+
 
 class VideoValidationError(Exception):
     """Raised when video validation fails."""
 
-    def __init__(self, code: str, message: str):
+    def __init__(self, code: str, message: str, retryable: bool = False):
         self.code = code
         self.message = message
+        self.retryable = retryable
         super().__init__(message)
 
 
@@ -31,6 +40,7 @@ class VideoService:
     # Limits
     MAX_DURATION_SECONDS = 300  # 5 minutes
     DEMO_MAX_DURATION_SECONDS = 20  # 20 seconds for demo
+    LONG_VIDEO_MAX_DURATION_SECONDS = 2 * 60 * 60  # 2 hours, checkpointed long-video mode
     MAX_FILE_SIZE_MB = 500
     MAX_RESOLUTION = 720  # 720p
 
@@ -104,18 +114,97 @@ class VideoService:
             "extract_flat": False,
         }
 
-    def validate_duration(self, duration_seconds: float, demo: bool = False) -> None:
+    async def get_video_metadata(self, video_id: str) -> Dict[str, Any]:
+        """
+        Get cached video metadata, probing YouTube only on a cache miss.
+
+        Args:
+            video_id: The YouTube video ID.
+
+        Returns:
+            Compact metadata dict with an "available" flag.
+
+        Raises:
+            VideoValidationError: If YouTube could not be reached (retryable).
+        """
+        redis = await get_redis()
+        key = f"video_info:{video_id}"
+
+        cached = await redis.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        try:
+            info = await VideoDownloader().probe(self.get_youtube_url_from_id(video_id))
+        except DownloadError as e:
+            # Transient failures are not cached, so the next request re-probes
+            if e.retryable:
+                raise VideoValidationError(code=e.code, message=e.message, retryable=True)
+            metadata = {"id": video_id, "available": False}
+            await redis.setex(key, VIDEO_INFO_UNAVAILABLE_TTL, json.dumps(metadata))
+            return metadata
+
+        metadata = {
+            "id": info.get("id", video_id),
+            "available": True,
+            "title": info.get("title"),
+            "duration": info.get("duration") or 0,
+            "height": info.get("height"),
+            "fps": info.get("fps"),
+            "is_live": bool(info.get("is_live")),
+        }
+        await redis.setex(key, VIDEO_INFO_TTL, json.dumps(metadata))
+        return metadata
+
+    async def validate_video(
+        self, video_id: str, demo: bool = False, long_video: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate availability and duration of a YouTube video at submission.
+
+        Args:
+            video_id: The YouTube video ID.
+            demo: Whether this is a demo analysis (stricter limits).
+            long_video: Whether the job runs in checkpointed long-video mode.
+
+        Returns:
+            The cached video metadata.
+
+        Raises:
+            VideoValidationError: If the video is unavailable or too long, or
+                retryable if YouTube could not be reached.
+        """
+        metadata = await self.get_video_metadata(video_id)
+
+        if not metadata.get("available") or metadata.get("is_live"):
+            raise VideoValidationError(
+                code="VIDEO_UNAVAILABLE",
+                message="This video is unavailable or private",
+            )
+
+        self.validate_duration(metadata.get("duration") or 0, demo=demo, long_video=long_video)
+        return metadata
+
+    def validate_duration(
+        self, duration_seconds: float, demo: bool = False, long_video: bool = False
+    ) -> None:
         """
         Validate video duration against limits.
 
         Args:
             duration_seconds: The video duration in seconds.
             demo: Whether this is a demo analysis (stricter limits).
+            long_video: Whether the job runs in checkpointed long-video mode.
 
         Raises:
             VideoValidationError: If duration exceeds the limit.
         """
-        max_duration = self.DEMO_MAX_DURATION_SECONDS if demo else self.MAX_DURATION_SECONDS
+        if demo:
+            max_duration = self.DEMO_MAX_DURATION_SECONDS
+        elif long_video:
+            max_duration = self.LONG_VIDEO_MAX_DURATION_SECONDS
+        else:
+            max_duration = self.MAX_DURATION_SECONDS
 
         if duration_seconds > max_duration:
             if demo:
@@ -123,6 +212,15 @@ class VideoService:
                     code="VIDEO_TOO_LONG",
                     message=f"Video must be {max_duration} seconds or less",
                 )
+            elif not long_video and duration_seconds <= self.LONG_VIDEO_MAX_DURATION_SECONDS:
+                raise VideoValidationError(
+                    code="VIDEO_TOO_LONG",
+                    message=(
+                        f"Video exceeds maximum duration of {max_duration // 60} minutes. "
+                        "Set options.long_video to analyze videos up to "
+                        f"{self.LONG_VIDEO_MAX_DURATION_SECONDS // 3600} hours"
+                    ),
+                )
             else:
                 raise VideoValidationError(
                     code="VIDEO_TOO_LONG",
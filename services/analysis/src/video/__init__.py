@@ -2,6 +2,8 @@
 
 from src.video.downloader import VideoDownloader, VideoInfo, DownloadError
 from src.video.frame_extractor import FrameExtractor, ExtractedFrame
+from src.video.profiles import QualityProfile, get_profile
+from src.video.workspace import Workspace, WorkspaceManager, WorkspaceQuotaExceeded
 
 __all__ = [
     "VideoDownloader",
@@ -9,4 +11,9 @@ __all__ = [
     "DownloadError",
     "FrameExtractor",
     "ExtractedFrame",
+    "QualityProfile",
+    "get_profile",
+    "Workspace",
+    "WorkspaceManager",
+    "WorkspaceQuotaExceeded",
 ]
@@ -0,0 +1,288 @@
+"""Face detection and cheap cross-frame tracking for region-of-interest analysis."""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FaceBox:
+    """An axis-aligned face bounding box in frame pixel coordinates."""
+
+    x: int
+    y: int
+    w: int
+    h: int
+
+    @property
+    def area(self) -> int:
+        return self.w * self.h
+
+    def iou(self, other: "FaceBox") -> float:
+        """Intersection over union with another box."""
+        ix = max(0, min(self.x + self.w, other.x + other.w) - max(self.x, other.x))
+        iy = max(0, min(self.y + self.h, other.y + other.h) - max(self.y, other.y))
+        intersection = ix * iy
+        union = self.area + other.area - intersection
+        return intersection / union if union > 0 else 0.0
+
+    def expanded(self, margin: float, frame_shape: Tuple[int, ...]) -> "FaceBox":
+        """Grow the box by margin (fraction of its size), clamped to the frame."""
+        frame_h, frame_w = frame_shape[:2]
+        dx, dy = int(self.w * margin), int(self.h * margin)
+        x0, y0 = max(0, self.x - dx), max(0, self.y - dy)
+        x1 = min(frame_w, self.x + self.w + dx)
+        y1 = min(frame_h, self.y + self.h + dy)
+        return FaceBox(x0, y0, x1 - x0, y1 - y0)
+
+    def crop(self, image: np.ndarray) -> np.ndarray:
+        return image[self.y : self.y + self.h, self.x : self.x + self.w]
+
+
+@dataclass
+class FaceObservation:
+    """A tracked face in a single frame."""
+
+    track_id: int
+    box: FaceBox
+
+
+@dataclass
+class _Track:
+    track_id: int
+    box: FaceBox
+    template: np.ndarray  # Grayscale face patch from the last detection
+    missed: int = 0
+
+
+class FaceTracker:
+    """
+    Finds faces on every Nth frame and tracks them in between.
+
+    Detection uses OpenCV's Haar cascade on a downscaled grayscale frame.
+    Between detections each track is followed by normalized template
+    matching in a small search window around its last position, which costs
+    a fraction of a detection pass. Detections are associated with existing
+    tracks by IoU so track IDs stay stable across the video.
+
+    A tracker instance holds state for one video; create one per job.
+    """
+
+    DETECT_EVERY_N_FRAMES = 5
+    DETECT_MAX_DIMENSION = 480  # Detection runs on frames downscaled to this
+    MIN_FACE_FRACTION = 0.08  # Ignore faces smaller than this share of the short side
+    IOU_THRESHOLD = 0.3  # Detection-to-track association
+    MATCH_THRESHOLD = 0.55  # Template match score below which a track is lost
+    SEARCH_MARGIN = 0.5  # Search window around a track, as a fraction of its size
+    MAX_MISSED_DETECTIONS = 1  # Detection passes a track may go unconfirmed
+
+    def __init__(self, detect_every: int = DETECT_EVERY_N_FRAMES, first_track_id: int = 1):
+        """
+        Initialize the tracker.
+
+        Args:
+            detect_every: Run the face detector on every Nth frame.
+            first_track_id: ID for the first new track. Resumed jobs pass the
+                saved next_track_id so IDs don't collide with earlier tracks.
+        """
+        self.detect_every = max(1, detect_every)
+        self._cascade = cv2.CascadeClassifier(
+            cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+        )
+        self._tracks: List[_Track] = []
+        self._next_track_id = first_track_id
+        self._frame_index = 0
+
+    @property
+    def next_track_id(self) -> int:
+        return self._next_track_id
+
+    def update(self, image: np.ndarray) -> List[FaceObservation]:
+        """
+        Advance the tracker by one frame.
+
+        Args:
+            image: BGR frame.
+
+        Returns:
+            Faces visible in this frame, with stable track IDs.
+        """
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+        if self._frame_index % self.detect_every == 0:
+            self._associate(gray, self._detect(gray))
+        else:
+            self._follow(gray)
+
+        self._frame_index += 1
+        return [FaceObservation(track.track_id, track.box) for track in self._tracks]
+
+    def _detect(self, gray: np.ndarray) -> List[FaceBox]:
+        """Run the cascade on a downscaled frame and map boxes back."""
+        height, width = gray.shape[:2]
+        scale = min(1.0, self.DETECT_MAX_DIMENSION / max(height, width))
+        small = gray if scale == 1.0 else cv2.resize(
+            gray, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA
+        )
+
+        min_side = max(24, int(min(small.shape[:2]) * self.MIN_FACE_FRACTION))
+        faces = self._cascade.detectMultiScale(
+            small, scaleFactor=1.1, minNeighbors=5, minSize=(min_side, min_side)
+        )
+
+        return [
+            FaceBox(int(x / scale), int(y / scale), int(w / scale), int(h / scale))
+            for (x, y, w, h) in faces
+        ]
+
+    def _associate(self, gray: np.ndarray, detections: List[FaceBox]) -> None:
+        """Match detections to tracks by IoU, start new tracks, retire stale ones."""
+        unmatched = list(range(len(detections)))
+        for track in self._tracks:
+            best, best_iou = None, self.IOU_THRESHOLD
+            for i in unmatched:
+                overlap = track.box.iou(detections[i])
+                if overlap > best_iou:
+                    best, best_iou = i, overlap
+
+            if best is None:
+                track.missed += 1
+                continue
+
+            unmatched.remove(best)
+            track.box = detections[best]
+            track.template = detections[best].crop(gray).copy()
+            track.missed = 0
+
+        self._tracks = [t for t in self._tracks if t.missed <= self.MAX_MISSED_DETECTIONS]
+
+        for i in unmatched:
+            box = detections[i]
+            self._tracks.append(_Track(self._next_track_id, box, box.crop(gray).copy()))
+            self._next_track_id += 1
+
+    def _follow(self, gray: np.ndarray) -> None:
+        """Move each track to its best template match near its last position."""
+        survivors = []
+        for track in self._tracks:
+            region = track.box.expanded(self.SEARCH_MARGIN, gray.shape)
+            search = region.crop(gray)
+            th, tw = track.template.shape[:2]
+            if search.shape[0] < th or search.shape[1] < tw:
+                continue
+
+            scores = cv2.matchTemplate(search, track.template, cv2.TM_CCOEFF_NORMED)
+            _, score, _, (mx, my) = cv2.minMaxLoc(scores)
+            if score < self.MATCH_THRESHOLD:
+                continue
+
+            track.box = FaceBox(region.x + mx, region.y + my, tw, th)
+            survivors.append(track)
+
+        self._tracks = survivors
+
+
+@dataclass
+class _TrackResult:
+    timestamps: List[float] = field(default_factory=list)
+    boxes: List[List[int]] = field(default_factory=list)
+    ai_probabilities: List[float] = field(default_factory=list)
+
+
+class FaceTrackResults:
+    """Accumulates per-track detector output for analysis_results.face_tracking."""
+
+    def __init__(self):
+        self._tracks: Dict[int, _TrackResult] = {}
+        self.frames_with_faces = 0
+        self.detector_pixels = 0
+        self.frame_pixels = 0
+
+    def add(self, track_id: int, timestamp: float, box: FaceBox, ai_probability: float) -> None:
+        """Record the detector result for one face in one frame."""
+        track = self._tracks.setdefault(track_id, _TrackResult())
+        track.timestamps.append(round(timestamp, 3))
+        track.boxes.append([box.x, box.y, box.w, box.h])
+        track.ai_probabilities.append(round(ai_probability, 3))
+
+    def record_frame(self, frame_pixels: int, detector_pixels: int, had_faces: bool) -> None:
+        """Account for how many pixels the detectors saw for one frame."""
+        self.frame_pixels += frame_pixels
+        self.detector_pixels += detector_pixels
+        if had_faces:
+            self.frames_with_faces += 1
+
+    def merge(self, other: "FaceTrackResults") -> None:
+        """Fold in results for a disjoint set of tracks, e.g. from another chunk."""
+        self._tracks.update(other._tracks)
+        self.frames_with_faces += other.frames_with_faces
+        self.detector_pixels += other.detector_pixels
+        self.frame_pixels += other.frame_pixels
+
+    def to_json(self) -> List[Dict[str, Any]]:
+        """Per-track summaries in the face_tracking column shape."""
+        tracks = []
+        for track_id, track in sorted(self._tracks.items()):
+            probabilities = np.asarray(track.ai_probabilities, dtype=np.float32)
+            tracks.append(
+                {
+                    "track_id": track_id,
+                    "first_seen": track.timestamps[0],
+                    "last_seen": track.timestamps[-1],
+                    "frames": len(track.timestamps),
+                    "avg_ai_probability": round(float(probabilities.mean()), 3),
+                    "max_ai_probability": round(float(probabilities.max()), 3),
+                    "timestamps": track.timestamps,
+                    "boxes": track.boxes,
+                    "ai_probabilities": track.ai_probabilities,
+                }
+            )
+        return tracks
+
+    def to_state(self) -> Dict[str, Any]:
+        """Raw accumulator state, for checkpointing a partially analyzed video."""
+        return {
+            "tracks": {
+                str(track_id): {
+                    "timestamps": track.timestamps,
+                    "boxes": track.boxes,
+                    "ai_probabilities": track.ai_probabilities,
+                }
+                for track_id, track in self._tracks.items()
+            },
+            "frames_with_faces": self.frames_with_faces,
+            "detector_pixels": self.detector_pixels,
+            "frame_pixels": self.frame_pixels,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "FaceTrackResults":
+        """Restore an accumulator saved with to_state()."""
+        results = cls()
+        for track_id, track in state.get("tracks", {}).items():
+            results._tracks[int(track_id)] = _TrackResult(
+                timestamps=track["timestamps"],
+                boxes=track["boxes"],
+                ai_probabilities=track["ai_probabilities"],
+            )
+        results.frames_with_faces = state.get("frames_with_faces", 0)
+        results.detector_pixels = state.get("detector_pixels", 0)
+        results.frame_pixels = state.get("frame_pixels", 0)
+        return results
+
+    def summary(self, frames_analyzed: int) -> Dict[str, Any]:
+        """Aggregate ROI statistics for video_analysis."""
+        pixel_ratio: Optional[float] = None
+        if self.frame_pixels:
+            pixel_ratio = round(self.detector_pixels / self.frame_pixels, 4)
+        return {
+            "tracks": len(self._tracks),
+            "frames_with_faces": self.frames_with_faces,
+            "frames_analyzed": frames_analyzed,
+            "detector_pixel_ratio": pixel_ratio,
+        }
@@ -36,6 +36,8 @@ class FrameExtractor:
         video_path: str,
         max_frames: Optional[int] = None,
         progress_callback: Optional[Callable] = None,
+        frames_per_second: Optional[float] = None,
+        max_dimension: Optional[int] = None,
     ) -> List[ExtractedFrame]:
         """Extract frames from a video file."""
         max_frames = max_frames or self.MAX_FRAMES
@@ -47,6 +49,8 @@ class FrameExtractor:
             video_path,
             max_frames,
             progress_callback,
+            frames_per_second or self.frames_per_second,
+            max_dimension,
         )
 
     def _extract_sync(
@@ -54,6 +58,8 @@ class FrameExtractor:
         video_path: str,
         max_frames: int,
         progress_callback: Optional[Callable],
+        frames_per_second: float,
+        max_dimension: Optional[int],
     ) -> List[ExtractedFrame]:
         """Synchronous frame extraction."""
         if not os.path.exists(video_path):
@@ -72,12 +78,12 @@ class FrameExtractor:
                 f"Video: {total_frames} frames, {video_fps:.1f} fps, {duration:.1f}s duration"
             )
 
-            frame_interval = int(video_fps / self.frames_per_second)
+            frame_interval = int(video_fps / frames_per_second)
             if frame_interval < 1:
                 frame_interval = 1
 
             frames_to_extract = min(
-                int(duration * self.frames_per_second),
+                int(duration * frames_per_second),
                 max_frames,
             )
 
@@ -97,7 +103,7 @@ class FrameExtractor:
                         ExtractedFrame(
                             timestamp=timestamp,
                             frame_number=frame_number,
-                            image=frame.copy(),
+                            image=self._scale_image(frame, max_dimension),
                         )
                     )
                     extracted_count += 1
@@ -113,6 +119,20 @@ class FrameExtractor:
         finally:
             cap.release()
 
+    @staticmethod
+    def _scale_image(image: np.ndarray, max_dimension: Optional[int]) -> np.ndarray:
+        """Downscale a decoded frame to fit max_dimension, copying it either way."""
+        height, width = image.shape[:2]
+        if not max_dimension or max(height, width) <= max_dimension:
+            return image.copy()
+
+        scale = max_dimension / max(height, width)
+        return cv2.resize(
+            image,
+            (int(width * scale), int(height * scale)),
+            interpolation=cv2.INTER_AREA,
+        )
+
     def frame_to_bytes(
         self,
         frame: ExtractedFrame,
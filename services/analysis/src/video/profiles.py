@@ -0,0 +1,80 @@
+"""Named quality profiles trading analysis latency for thoroughness."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+# Detector names understood by ImageDetector
+ALL_DETECTORS = ("primary", "gan", "diffusion", "frequency")
+
+
+@dataclass(frozen=True)
+class QualityProfile:
+    """Compute budget for a video analysis."""
+
+    name: str
+    frames_per_second: float  # Sampling rate for frame extraction
+    max_frames: int  # Hard cap on frames analyzed
+    max_resolution: int  # Download height cap (e.g. 720 for 720p)
+    decode_max_dimension: int  # Frames are downscaled to this at decode time
+    detectors: Tuple[str, ...]  # Detector subset run on each frame
+    # Stop analyzing once at least early_exit_min_frames are in and the
+    # running mean AI probability falls outside [early_exit_low, early_exit_high]
+    early_exit_min_frames: Optional[int] = None
+    early_exit_low: float = 0.0
+    early_exit_high: float = 1.0
+
+    def detector_options(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the profile's detector subset unless the job names its own models."""
+        return {**options, "models": options.get("models") or list(self.detectors)}
+
+    def should_exit_early(self, frames_analyzed: int, mean_probability: float) -> bool:
+        """Check whether the running result is decisive enough to stop."""
+        if self.early_exit_min_frames is None or frames_analyzed < self.early_exit_min_frames:
+            return False
+        return mean_probability <= self.early_exit_low or mean_probability >= self.early_exit_high
+
+
+QUALITY_PROFILES: Dict[str, QualityProfile] = {
+    "fast": QualityProfile(
+        name="fast",
+        frames_per_second=0.5,
+        max_frames=60,
+        max_resolution=480,
+        decode_max_dimension=512,
+        detectors=("primary", "frequency"),
+        early_exit_min_frames=10,
+        early_exit_low=0.15,
+        early_exit_high=0.85,
+    ),
+    "standard": QualityProfile(
+        name="standard",
+        frames_per_second=1,
+        max_frames=300,
+        max_resolution=720,
+        decode_max_dimension=1024,
+        detectors=ALL_DETECTORS,
+    ),
+    "thorough": QualityProfile(
+        name="thorough",
+        frames_per_second=2,
+        max_frames=600,
+        max_resolution=1080,
+        decode_max_dimension=1024,
+        detectors=ALL_DETECTORS,
+    ),
+}
+
+DEFAULT_QUALITY = "standard"
+
+
+def get_profile(quality: Optional[str] = None) -> QualityProfile:
+    """
+    Look up a quality profile by name.
+
+    Args:
+        quality: Profile name. Unknown or missing names use the default.
+
+    Returns:
+        The matching QualityProfile.
+    """
+    return QUALITY_PROFILES.get(quality or DEFAULT_QUALITY, QUALITY_PROFILES[DEFAULT_QUALITY])
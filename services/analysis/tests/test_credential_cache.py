@@ -0,0 +1,104 @@
+"""Tests for the two-tier credential cache's TTL and size bounds."""
+
+import time
+
+import fakeredis
+import pytest
+from pydantic import BaseModel
+
+from src.api import credential_cache
+from src.api.credential_cache import CredentialCache, credential_hash
+
+
+class Credential(BaseModel):
+    user_id: str
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(credential_cache, "get_redis", get_redis)
+    return client
+
+
+def make_cache(**kwargs) -> CredentialCache[Credential]:
+    options = {"max_entries": 100, "ttl_seconds": 30, "redis_ttl_seconds": 120}
+    options.update(kwargs)
+    return CredentialCache(Credential, **options)
+
+
+def local_expiry(cache: CredentialCache, token: str) -> float:
+    """Seconds until the local entry for token lapses."""
+    expires_at, _ = cache._entries[credential_hash(token)]
+    return expires_at - time.monotonic()
+
+
+async def test_set_then_get_hits_locally(redis):
+    cache = make_cache()
+
+    await cache.set("token", Credential(user_id="u1"))
+
+    assert await cache.get("token") == Credential(user_id="u1")
+    assert 29 < local_expiry(cache, "token") <= 30
+    assert 119_000 < await redis.pttl(cache.REDIS_PREFIX + credential_hash("token")) <= 120_000
+
+
+async def test_entries_never_outlive_the_credential(redis):
+    cache = make_cache()
+
+    await cache.set("token", Credential(user_id="u1"), expires_at=time.time() + 5)
+
+    assert local_expiry(cache, "token") <= 5
+    assert await redis.pttl(cache.REDIS_PREFIX + credential_hash("token")) <= 5000
+
+
+async def test_expired_credentials_are_not_cached(redis):
+    cache = make_cache()
+
+    await cache.set("token", Credential(user_id="u1"), expires_at=time.time() - 1)
+
+    assert await cache.get("token") is None
+    assert await redis.exists(cache.REDIS_PREFIX + credential_hash("token")) == 0
+
+
+async def test_redis_hit_is_bounded_by_the_remaining_redis_ttl(redis):
+    writer, reader = make_cache(), make_cache()
+    await writer.set("token", Credential(user_id="u1"))
+    await redis.pexpire(writer.REDIS_PREFIX + credential_hash("token"), 2000)
+
+    assert await reader.get("token") == Credential(user_id="u1")
+    assert local_expiry(reader, "token") <= 2
+
+
+async def test_lapsed_local_entry_falls_through_to_redis(redis):
+    cache = make_cache()
+    await cache.set("token", Credential(user_id="u1"))
+    key = credential_hash("token")
+    cache._entries[key] = (time.monotonic() - 1, Credential(user_id="stale"))
+
+    assert await cache.get("token") == Credential(user_id="u1")
+
+
+async def test_local_tier_evicts_least_recently_used(redis):
+    cache = make_cache(max_entries=2)
+    await cache.set("a", Credential(user_id="a"))
+    await cache.set("b", Credential(user_id="b"))
+    await cache.get("a")
+
+    await cache.set("c", Credential(user_id="c"))
+
+    assert set(cache._entries) == {credential_hash("a"), credential_hash("c")}
+
+
+async def test_invalidate_drops_both_tiers(redis):
+    cache = make_cache()
+    await cache.set("token", Credential(user_id="u1"))
+
+    await cache.invalidate("token")
+
+    assert credential_hash("token") not in cache._entries
+    assert await cache.get("token") is None
@@ -0,0 +1,141 @@
+"""Tests for the demo admission scripts and controller."""
+
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from src.services import demo_admission
+from src.services.demo_admission import (
+    ACTIVE_KEY,
+    AVG_SECONDS_KEY,
+    QUEUE_KEY,
+    DemoAdmissionController,
+    DemoAdmissionRejected,
+)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(demo_admission, "get_redis", get_redis)
+    return client
+
+
+@pytest.fixture
+def controller(redis):
+    controller = DemoAdmissionController(max_active=2, max_queued=2, lease_seconds=30)
+    controller.poll_interval = 0.01
+    return controller
+
+
+async def test_admits_up_to_max_active_then_queues_then_rejects(controller):
+    ids = [uuid4() for _ in range(5)]
+
+    assert [await controller.enqueue(id_) for id_ in ids[:4]] == [0, 0, 1, 2]
+
+    with pytest.raises(DemoAdmissionRejected) as exc:
+        await controller.enqueue(ids[4])
+    assert exc.value.code == "DEMO_AT_CAPACITY"
+    assert exc.value.retry_after_seconds >= 1
+
+
+async def test_new_jobs_queue_behind_waiting_jobs(controller, redis):
+    first, second, waiting, late = (uuid4() for _ in range(4))
+    for id_ in (first, second, waiting):
+        await controller.enqueue(id_)
+
+    await controller.discard(first)
+
+    # A slot is free, but the waiting job is owed it
+    assert await controller.enqueue(late) == 2
+    assert await redis.zrange(QUEUE_KEY, 0, -1) == [str(waiting), str(late)]
+
+
+async def test_acquire_admits_the_head_of_the_queue_when_a_slot_frees(controller, redis):
+    first, second, waiting = (uuid4() for _ in range(3))
+    for id_ in (first, second, waiting):
+        await controller.enqueue(id_)
+
+    task = asyncio.create_task(controller.acquire(waiting))
+    await asyncio.sleep(0.05)
+    assert not task.done()
+
+    await controller.discard(first)
+    lease = await asyncio.wait_for(task, timeout=1)
+
+    assert await redis.zscore(ACTIVE_KEY, str(waiting)) is not None
+    assert await redis.zcard(QUEUE_KEY) == 0
+    await controller.release(lease)
+
+
+async def test_only_the_head_of_the_queue_is_admitted(controller, redis):
+    active, head, behind = (uuid4() for _ in range(3))
+    controller.max_active = 1
+    for id_ in (active, head, behind):
+        await controller.enqueue(id_)
+    await controller.discard(active)
+
+    result = await redis.eval(
+        demo_admission._TRY_ADMIT,
+        3,
+        ACTIVE_KEY, QUEUE_KEY, demo_admission.WAITING_KEY,
+        str(behind), controller.lease_ms, controller.max_active,
+    )
+
+    assert result == 2
+    assert await redis.zcard(ACTIVE_KEY) == 0
+
+
+async def test_lapsed_leases_are_purged(redis):
+    controller = DemoAdmissionController(max_active=1, max_queued=1, lease_seconds=0.05)
+    crashed, queued_then_gone, fresh = (uuid4() for _ in range(3))
+    await controller.enqueue(crashed)
+    await controller.enqueue(queued_then_gone)
+
+    await asyncio.sleep(0.1)
+
+    assert await controller.enqueue(fresh) == 0
+    assert await redis.zrange(ACTIVE_KEY, 0, -1) == [str(fresh)]
+    assert await redis.zcard(QUEUE_KEY) == 0
+
+
+async def test_acquire_rejects_a_lapsed_queue_place(redis):
+    controller = DemoAdmissionController(max_active=1, max_queued=1, lease_seconds=0.05)
+    await controller.enqueue(uuid4())
+    waiting = uuid4()
+    await controller.enqueue(waiting)
+    await asyncio.sleep(0.1)
+
+    with pytest.raises(DemoAdmissionRejected) as exc:
+        await controller.acquire(waiting)
+    assert exc.value.code == "SERVER_BUSY"
+
+
+async def test_queue_status_reports_position_and_estimate(controller, redis):
+    ids = [uuid4() for _ in range(4)]
+    for id_ in ids:
+        await controller.enqueue(id_)
+    await redis.set(AVG_SECONDS_KEY, 10)
+
+    assert await controller.queue_status(ids[0]) is None
+
+    status = await controller.queue_status(ids[3])
+    assert status.position == 2
+    assert status.estimated_start_at.tzinfo is not None
+
+
+async def test_release_folds_runtime_into_the_average(controller, redis):
+    analysis_id = uuid4()
+    await controller.enqueue(analysis_id)
+    await redis.set(AVG_SECONDS_KEY, 10)
+
+    await controller._release(analysis_id, 20)
+
+    assert float(await redis.get(AVG_SECONDS_KEY)) == pytest.approx(12)
+    assert await redis.zcard(ACTIVE_KEY) == 0
@@ -0,0 +1,120 @@
+"""Tests for the downloader's mid-stream size abort and progress reporting."""
+
+import asyncio
+
+import pytest
+
+from src.video import downloader as downloader_module
+from src.video.downloader import VideoDownloader, _SizeLimitExceeded
+
+MB = 1024 * 1024
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(downloader_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    downloader = VideoDownloader(temp_dir=str(tmp_path))
+    downloader.MAX_FILE_SIZE_BYTES = 10 * MB
+    return downloader
+
+
+async def progress_hook(downloader, max_seconds=None):
+    reports = []
+
+    async def progress_callback(progress):
+        reports.append(progress)
+
+    options = downloader._download_options(
+        asyncio.get_running_loop(), progress_callback, max_seconds=max_seconds
+    )
+    return options["progress_hooks"][0], reports
+
+
+def downloading(downloaded, total):
+    return {"status": "downloading", "downloaded_bytes": downloaded, "total_bytes": total}
+
+
+async def settle():
+    # Let the callbacks handed to the loop run
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_aborts_once_fetched_bytes_pass_the_limit(downloader):
+    hook, _ = await progress_hook(downloader)
+
+    hook(downloading(5 * MB, None))
+    with pytest.raises(_SizeLimitExceeded):
+        hook(downloading(11 * MB, None))
+
+
+async def test_aborts_whole_downloads_whose_total_is_over_the_limit(downloader):
+    hook, _ = await progress_hook(downloader)
+
+    with pytest.raises(_SizeLimitExceeded):
+        hook(downloading(1 * MB, 50 * MB))
+
+
+async def test_ranged_downloads_ignore_the_full_stream_total(downloader):
+    hook, _ = await progress_hook(downloader, max_seconds=30)
+
+    hook(downloading(1 * MB, 50 * MB))
+    with pytest.raises(_SizeLimitExceeded):
+        hook(downloading(11 * MB, 50 * MB))
+
+
+async def test_progress_reports_are_throttled(downloader, clock):
+    hook, reports = await progress_hook(downloader)
+
+    hook(downloading(1 * MB, 10 * MB))
+    hook(downloading(1 * MB, 10 * MB))
+    clock.now = 0.5
+    hook(downloading(2 * MB, 10 * MB))
+    clock.now = 1.5
+    hook(downloading(3 * MB, 10 * MB))
+    await settle()
+
+    assert reports == [10, 30]
+
+
+async def test_completion_is_always_reported(downloader, clock):
+    hook, reports = await progress_hook(downloader)
+
+    hook(downloading(5 * MB, 10 * MB))
+    clock.now = 0.1
+    hook(downloading(10 * MB, 10 * MB))
+    hook(downloading(10 * MB, 10 * MB))
+    await settle()
+
+    assert reports == [50, 100]
+
+
+async def test_other_statuses_are_ignored(downloader):
+    hook, reports = await progress_hook(downloader)
+
+    hook({"status": "finished", "downloaded_bytes": 50 * MB, "total_bytes": 50 * MB})
+    await settle()
+
+    assert reports == []
+
+
+def test_estimate_covers_only_the_requested_range(downloader):
+    whole = downloader.estimate_download_bytes()
+    leading = downloader.estimate_download_bytes(max_seconds=5)
+
+    assert leading < whole <= downloader.MAX_FILE_SIZE_BYTES
+    assert leading == int(5 * VideoDownloader.BYTES_PER_SECOND_AT_720P)
@@ -0,0 +1,87 @@
+"""Tests for associating face detections with tracks across frames."""
+
+import numpy as np
+import pytest
+
+from src.video.face_tracker import FaceBox, FaceTracker
+
+
+def run(tracker, detections_per_frame):
+    """Feed blank frames, with _detect returning the given boxes for each."""
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    pending = list(detections_per_frame)
+    tracker._detect = lambda gray: pending.pop(0)
+    return [
+        {obs.track_id: obs.box for obs in tracker.update(frame)}
+        for _ in detections_per_frame
+    ]
+
+
+@pytest.fixture
+def tracker():
+    return FaceTracker(detect_every=1)
+
+
+A = FaceBox(10, 10, 50, 50)
+B = FaceBox(200, 100, 40, 40)
+
+
+def test_new_detections_start_tracks(tracker):
+    (frame,) = run(tracker, [[A, B]])
+
+    assert frame == {1: A, 2: B}
+    assert tracker.next_track_id == 3
+
+
+def test_overlapping_detections_keep_their_track_ids(tracker):
+    moved_a, moved_b = FaceBox(14, 12, 50, 50), FaceBox(196, 104, 40, 40)
+
+    frames = run(tracker, [[A, B], [moved_b, moved_a]])
+
+    assert frames[1] == {1: moved_a, 2: moved_b}
+
+
+def test_distant_detection_starts_a_new_track(tracker):
+    far = FaceBox(120, 150, 50, 50)
+
+    frames = run(tracker, [[A], [far]])
+
+    assert set(frames[1]) == {1, 2}
+    assert frames[1][2] == far
+
+
+def test_missed_track_survives_one_pass_then_retires(tracker):
+    frames = run(tracker, [[A, B], [A], [A]])
+
+    assert set(frames[1]) == {1, 2}
+    assert set(frames[2]) == {1}
+
+
+def test_retired_ids_are_not_reused(tracker):
+    frames = run(tracker, [[A, B], [A], [A], [A, B]])
+
+    assert set(frames[3]) == {1, 3}
+
+
+def test_each_detection_matches_one_track(tracker):
+    # Both tracks overlap the single detection; only the first claims it
+    near_a = FaceBox(12, 12, 50, 50)
+
+    frames = run(tracker, [[A, near_a], [A]])
+
+    assert frames[1][1] == A
+    assert 2 in frames[1]  # Unconfirmed, kept for one more detection pass
+
+
+def test_first_track_id_offsets_new_tracks():
+    tracker = FaceTracker(detect_every=1, first_track_id=101)
+
+    (frame,) = run(tracker, [[A, B]])
+
+    assert set(frame) == {101, 102}
+
+
+def test_iou():
+    assert A.iou(A) == 1.0
+    assert A.iou(B) == 0.0
+    assert A.iou(FaceBox(35, 10, 50, 50)) == pytest.approx(25 * 50 / (2 * 2500 - 25 * 50))
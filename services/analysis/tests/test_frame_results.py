@@ -0,0 +1,102 @@
+"""Tests that vectorized segment finding matches the per-frame loop it replaced."""
+
+import numpy as np
+import pytest
+
+from src.video.frame_results import FrameResults, SuspiciousSegment
+
+THRESHOLD = 0.7
+MAX_GAP = 2.0
+
+
+def reference_segments(timestamps, probabilities, threshold, max_gap):
+    """The original frame-by-frame implementation."""
+    segments, current = [], []
+
+    def close():
+        segments.append(
+            SuspiciousSegment(
+                start=current[0][0],
+                end=current[-1][0],
+                avg_ai_probability=sum(p for _, p in current) / len(current),
+            )
+        )
+
+    for timestamp, probability in zip(timestamps, probabilities):
+        if probability >= threshold:
+            if current and timestamp - current[-1][0] > max_gap:
+                close()
+                current = []
+            current.append((timestamp, probability))
+        elif current:
+            close()
+            current = []
+    if current:
+        close()
+    return segments
+
+
+def assert_same_segments(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a.start == pytest.approx(e.start)
+        assert a.end == pytest.approx(e.end)
+        assert a.avg_ai_probability == pytest.approx(e.avg_ai_probability, rel=1e-6)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_reference_on_random_videos(seed):
+    rng = np.random.default_rng(seed)
+    size = int(rng.integers(1, 400))
+    # Mostly one frame a second, with occasional long gaps (e.g. dropped frames)
+    steps = np.where(rng.random(size) < 0.1, rng.uniform(2.5, 10, size), 1.0)
+    timestamps = np.cumsum(steps).astype(np.float32).tolist()
+    probabilities = rng.random(size).tolist()
+
+    results = FrameResults.from_arrays(timestamps, probabilities)
+
+    assert_same_segments(
+        results.find_segments(THRESHOLD, MAX_GAP),
+        reference_segments(timestamps, probabilities, THRESHOLD, MAX_GAP),
+    )
+
+
+@pytest.mark.parametrize(
+    "probabilities",
+    [
+        [],
+        [0.1, 0.2, 0.3],
+        [0.9, 0.9, 0.9],
+        [0.7, 0.1, 0.7],
+        [0.9, 0.2, 0.8, 0.95, 0.1],
+    ],
+)
+def test_matches_reference_on_edge_cases(probabilities):
+    timestamps = [float(i) for i in range(len(probabilities))]
+    results = FrameResults.from_arrays(timestamps, probabilities)
+
+    assert_same_segments(
+        results.find_segments(THRESHOLD, MAX_GAP),
+        reference_segments(timestamps, probabilities, THRESHOLD, MAX_GAP),
+    )
+
+
+def test_gap_splits_a_run_of_suspicious_frames():
+    results = FrameResults.from_arrays([0, 1, 5, 6], [0.9, 0.9, 0.9, 0.9])
+
+    segments = results.find_segments(THRESHOLD, MAX_GAP)
+
+    assert [(s.start, s.end) for s in segments] == [(0, 1), (5, 6)]
+
+
+def test_appended_frames_match_bulk_built_frames():
+    timestamps, probabilities = [0.0, 1.0, 2.0, 3.0, 4.0], [0.8, 0.9, 0.1, 0.75, 0.8]
+    appended = FrameResults(capacity=1)
+    for timestamp, probability in zip(timestamps, probabilities):
+        appended.append(timestamp, probability)
+
+    bulk = FrameResults.from_arrays(timestamps, probabilities)
+
+    assert_same_segments(
+        appended.find_segments(THRESHOLD, MAX_GAP), bulk.find_segments(THRESHOLD, MAX_GAP)
+    )
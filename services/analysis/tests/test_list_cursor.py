@@ -0,0 +1,46 @@
+"""Tests for the keyset pagination cursor of result listings."""
+
+import base64
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.services.analysis_service import decode_list_cursor, encode_list_cursor
+
+
+def _encode(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+def test_round_trip():
+    created_at = datetime(2026, 10, 18, 12, 30, 45, 123456, tzinfo=timezone.utc)
+    analysis_id = uuid4()
+
+    assert decode_list_cursor(encode_list_cursor(created_at, analysis_id)) == (
+        created_at,
+        analysis_id,
+    )
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_list_cursor(datetime.now(timezone.utc), uuid4())
+
+    assert not set(cursor) & set("+/ ")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not base64!",
+        _encode("2026-10-18T12:30:45+00:00"),
+        _encode(f"yesterday|{uuid4()}"),
+        _encode("2026-10-18T12:30:45+00:00|not-a-uuid"),
+        _encode(f"2026-10-18T12:30:45+00:00|{uuid4()}|extra"),
+        base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+    ],
+)
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_list_cursor(cursor)
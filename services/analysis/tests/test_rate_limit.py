@@ -0,0 +1,136 @@
+"""Tests for the GCRA script and the hybrid limiter's local slices."""
+
+import fakeredis
+import pytest
+
+from src.api import rate_limit
+from src.api.rate_limit import HybridRateLimiter, RateLimit, _Slice, check_rate_limit
+
+# One token per second, bursts of ten
+LIMIT = RateLimit(limit=60, period_seconds=60, burst=10)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(rate_limit, "get_redis", get_redis)
+    monkeypatch.setattr(rate_limit, "_gcra_script", None)
+    return client
+
+
+async def test_burst_is_granted_then_denied(redis):
+    results = [await check_rate_limit("bucket", LIMIT) for _ in range(LIMIT.burst + 1)]
+
+    assert all(result.allowed for result in results[:-1])
+    assert [result.remaining for result in results[:-1]] == list(range(LIMIT.burst - 1, -1, -1))
+
+    denied = results[-1]
+    assert not denied.allowed
+    assert denied.retry_after_seconds == 1
+    assert denied.headers()["Retry-After"] == "1"
+
+
+async def test_cost_zero_reports_without_consuming(redis):
+    await check_rate_limit("bucket", LIMIT)
+
+    first = await check_rate_limit("bucket", LIMIT, cost=0)
+    second = await check_rate_limit("bucket", LIMIT, cost=0)
+
+    assert first.allowed and second.allowed
+    assert first.remaining == second.remaining == LIMIT.burst - 1
+
+
+async def test_cost_zero_on_new_bucket_writes_nothing(redis):
+    await check_rate_limit("bucket", LIMIT, cost=0)
+
+    assert await redis.exists("bucket") == 0
+
+
+async def test_take_grants_at_most_what_is_available(redis):
+    granted, remaining, retry_after_ms, _ = await rate_limit._take("bucket", LIMIT, 4)
+    assert (granted, remaining, retry_after_ms) == (4, 6, 0)
+
+    granted, remaining, _, _ = await rate_limit._take("bucket", LIMIT, 15)
+    assert (granted, remaining) == (6, 0)
+
+
+async def test_take_refunds_unspent_tokens(redis):
+    await rate_limit._take("bucket", LIMIT, 4)
+
+    granted, remaining, _, _ = await rate_limit._take("bucket", LIMIT, 0, refund=3)
+
+    assert granted == 0
+    assert remaining == LIMIT.burst - 1
+
+
+async def test_bucket_expires_once_full_again(redis):
+    await rate_limit._take("bucket", LIMIT, 3)
+
+    ttl_ms = await redis.pttl("bucket")
+
+    assert 0 < ttl_ms <= 3000
+
+
+async def test_processes_never_exceed_the_shared_limit(redis):
+    limiters = [
+        HybridRateLimiter(sync_seconds=60, max_slice=4, max_clients=10) for _ in range(3)
+    ]
+
+    allowed = 0
+    for i in range(40):
+        result = await limiters[i % len(limiters)].check("client", LIMIT)
+        allowed += result.allowed
+
+    assert 0 < allowed <= LIMIT.burst
+
+
+class TestNextSize:
+    LIMIT = RateLimit(limit=600, period_seconds=60, burst=100)
+
+    @pytest.fixture
+    def limiter(self):
+        return HybridRateLimiter(sync_seconds=1, max_slice=8, max_clients=10)
+
+    def state(self, size, tokens, expires_at, rate_limit=LIMIT, denied=False):
+        return _Slice(
+            rate_limit=rate_limit,
+            tokens=tokens,
+            size=size,
+            expires_at=expires_at,
+            remaining=0,
+            reset_at=0,
+            denied=denied,
+        )
+
+    def test_new_client_starts_at_one(self, limiter):
+        assert limiter._next_size(self.LIMIT, None, now=0) == 1
+
+    def test_doubles_when_spent_before_expiry(self, limiter):
+        assert limiter._next_size(self.LIMIT, self.state(2, 0, expires_at=10), now=5) == 4
+
+    def test_capped_at_max_slice(self, limiter):
+        assert limiter._next_size(self.LIMIT, self.state(8, 0, expires_at=10), now=5) == 8
+
+    def test_capped_at_quarter_of_burst(self, limiter):
+        small = RateLimit(limit=60, period_seconds=60, burst=8)
+        state = self.state(2, 0, expires_at=10, rate_limit=small)
+
+        assert limiter._next_size(small, state, now=5) == 2
+
+    def test_halves_when_it_expires_unspent(self, limiter):
+        assert limiter._next_size(self.LIMIT, self.state(8, 3, expires_at=10), now=11) == 4
+        assert limiter._next_size(self.LIMIT, self.state(1, 1, expires_at=10), now=11) == 1
+
+    def test_resets_after_denial(self, limiter):
+        state = self.state(8, 0, expires_at=10, denied=True)
+
+        assert limiter._next_size(self.LIMIT, state, now=5) == 1
+
+    def test_resets_when_the_limit_changes(self, limiter):
+        other = RateLimit(limit=1200, period_seconds=60, burst=200)
+
+        assert limiter._next_size(other, self.state(8, 0, expires_at=10), now=5) == 1
@@ -0,0 +1,132 @@
+"""Tests for the Redis status read model and its version ordering."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import fakeredis
+import orjson
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.services import status_store as status_store_module
+from src.services.status_store import STATUS_FIELDS, StatusStore, events_channel, status_key
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(status_store_module, "get_redis", get_redis)
+    return client
+
+
+@pytest.fixture
+def store(redis):
+    return StatusStore(ttl_seconds=60)
+
+
+def make_row(analysis_id, updated_at=NOW, **values):
+    row = dict.fromkeys(STATUS_FIELDS)
+    row.update(
+        id=analysis_id,
+        user_id=uuid4(),
+        type="video",
+        status="processing",
+        progress=0,
+        created_at=NOW,
+        updated_at=updated_at,
+    )
+    row.update(values)
+    return row
+
+
+async def test_publish_then_get_round_trips_the_row(store):
+    analysis_id = uuid4()
+
+    await store.publish(make_row(analysis_id, progress=40, current_stage="analyzing"))
+
+    row, results = await store.get(analysis_id)
+    assert row["id"] == str(analysis_id)
+    assert row["progress"] == 40
+    assert row["updated_at"] == NOW.isoformat()
+    assert results is None
+
+
+async def test_newer_rows_replace_older_ones(store):
+    analysis_id = uuid4()
+
+    await store.publish(make_row(analysis_id, progress=40))
+    await store.publish(make_row(analysis_id, NOW + timedelta(microseconds=1), progress=50))
+
+    row, _ = await store.get(analysis_id)
+    assert row["progress"] == 50
+
+
+async def test_late_writes_never_roll_the_row_back(store):
+    analysis_id = uuid4()
+    await store.publish(make_row(analysis_id, NOW + timedelta(seconds=1), status="completed"))
+
+    await store.publish(make_row(analysis_id, NOW, status="processing"))
+    await store.publish(make_row(analysis_id, NOW + timedelta(seconds=1), status="processing"))
+
+    row, _ = await store.get(analysis_id)
+    assert row["status"] == "completed"
+
+
+async def test_naive_timestamps_are_read_as_utc(store):
+    analysis_id = uuid4()
+    await store.publish(make_row(analysis_id, NOW + timedelta(seconds=1), progress=60))
+
+    await store.publish(make_row(analysis_id, NOW.replace(tzinfo=None), progress=10))
+
+    row, _ = await store.get(analysis_id)
+    assert row["progress"] == 60
+
+
+async def test_accepted_rows_are_published_to_streams(store, redis):
+    analysis_id = uuid4()
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(events_channel(analysis_id))
+    await pubsub.get_message(timeout=1)
+
+    await store.publish(make_row(analysis_id, NOW + timedelta(seconds=1), progress=70))
+    await store.publish(make_row(analysis_id, NOW, progress=10))
+
+    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+    assert orjson.loads(message["data"])["progress"] == 70
+    assert await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1) is None
+    await pubsub.aclose()
+
+
+async def test_documents_expire_without_writes(store, redis):
+    analysis_id = uuid4()
+
+    await store.publish(make_row(analysis_id))
+
+    assert 0 < await redis.ttl(status_key(analysis_id)) <= 60
+
+
+async def test_results_survive_later_row_updates(store):
+    analysis_id = uuid4()
+    await store.publish(make_row(analysis_id, status="completed"))
+    await store.set_results(analysis_id, {"verdict": "authentic"})
+
+    await store.publish(make_row(analysis_id, NOW + timedelta(seconds=1), status="completed"))
+
+    _, results = await store.get(analysis_id)
+    assert results == {"verdict": "authentic"}
+
+
+async def test_redis_errors_fall_back_to_postgres(store, monkeypatch):
+    async def get_redis():
+        raise ConnectionError("redis is down")
+
+    monkeypatch.setattr(status_store_module, "get_redis", get_redis)
+
+    await store.publish(make_row(uuid4()))
+    assert await store.get(uuid4()) is None
@@ -0,0 +1,118 @@
+"""Tests for scratch quota admission and orphan reclaim."""
+
+import fcntl
+import json
+import os
+
+import pytest
+
+from src.video.workspace import WorkspaceManager, WorkspaceQuotaExceeded
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return WorkspaceManager(root=str(tmp_path), quota_bytes=100, wait_seconds=0.1)
+
+
+def leave_reservation(manager, name, reserve_bytes, instance=None):
+    """Write a reservation as another (possibly dead) process would."""
+    os.makedirs(os.path.join(manager.root, name))
+    reservation = {"pid": 1, "bytes": reserve_bytes}
+    if instance is not None:
+        reservation["instance"] = instance
+    with open(os.path.join(manager.reservations_dir, name), "w") as f:
+        json.dump(reservation, f)
+
+
+def register_instance(manager, instance, alive):
+    """Create another process's instance file, holding its lock if alive."""
+    instance_file = open(os.path.join(manager.instances_dir, instance), "w")
+    if alive:
+        fcntl.flock(instance_file, fcntl.LOCK_SH)
+        return instance_file
+    instance_file.close()
+    return None
+
+
+async def test_reservations_count_against_the_quota(manager):
+    first = await manager.acquire(60)
+
+    assert os.path.isdir(first.path)
+    assert manager.reserved_bytes() == 60
+    with pytest.raises(WorkspaceQuotaExceeded) as error:
+        await manager.acquire(50)
+    assert error.value.code == "SERVER_BUSY"
+
+    await manager.release(first)
+
+    second = await manager.acquire(50)
+    assert manager.reserved_bytes() == 50
+    assert not os.path.exists(first.path)
+    await manager.release(second)
+
+
+async def test_requests_over_the_whole_quota_fail_fast(manager):
+    with pytest.raises(WorkspaceQuotaExceeded) as error:
+        await manager.acquire(101)
+
+    assert error.value.code == "FILE_TOO_LARGE"
+
+
+async def test_workspace_context_releases_on_exit(manager):
+    async with manager.workspace(80) as workspace:
+        assert manager.reserved_bytes() == 80
+
+    assert manager.reserved_bytes() == 0
+    assert not os.path.exists(workspace.path)
+
+
+async def test_reservations_record_this_process_instance(manager):
+    workspace = await manager.acquire(10)
+
+    with open(os.path.join(manager.reservations_dir, workspace.name)) as f:
+        reservation = json.load(f)
+
+    assert reservation["instance"] in os.listdir(manager.instances_dir)
+    assert reservation["pid"] == os.getpid()
+
+
+async def test_admission_reclaims_dead_instances(manager):
+    register_instance(manager, "dead-host-1", alive=False)
+    leave_reservation(manager, "job-dead", 70, instance="dead-host-1")
+
+    workspace = await manager.acquire(60)
+
+    assert manager.reserved_bytes() == 60
+    assert not os.path.exists(os.path.join(manager.root, "job-dead"))
+    assert "dead-host-1" not in os.listdir(manager.instances_dir)
+    await manager.release(workspace)
+
+
+async def test_reused_pid_does_not_keep_a_reservation_alive(manager):
+    # Left by a previous process that was also PID 1 in its namespace
+    leave_reservation(manager, "job-old", 70, instance="previous-1")
+    leave_reservation(manager, "job-legacy", 20)
+
+    assert manager.reclaim_orphans() == 2
+    assert manager.reserved_bytes() == 0
+
+
+async def test_live_instances_keep_their_reservations(manager):
+    instance_file = register_instance(manager, "live-host-7", alive=True)
+    leave_reservation(manager, "job-live", 70, instance="live-host-7")
+    try:
+        with pytest.raises(WorkspaceQuotaExceeded):
+            await manager.acquire(60)
+        assert manager.reclaim_orphans() == 0
+        assert manager.reserved_bytes() == 70
+    finally:
+        instance_file.close()
+
+    assert manager.reclaim_orphans() == 1
+
+
+def test_reclaim_removes_directories_without_reservations(manager):
+    os.makedirs(os.path.join(manager.root, "job-half-created"))
+
+    assert manager.reclaim_orphans() == 1
+    assert not os.path.exists(os.path.join(manager.root, "job-half-created"))
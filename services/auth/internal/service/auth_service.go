@@ -28,6 +28,10 @@ var (
 	ErrUnauthorized       = errors.New("unauthorized")
 )
 
+// APIKeyRevocationChannel is the Redis pub/sub channel revoked API key hashes
+// are published on, so services verifying keys locally drop cached entries
+const APIKeyRevocationChannel = "auth:api_key_revocations"
+
 type AuthService struct {
 	userRepo   *repository.UserRepository
 	apiKeyRepo *repository.APIKeyRepository
@@ -231,7 +235,14 @@ func (s *AuthService) RevokeAPIKey(ctx context.Context, userID, keyID uuid.UUID)
 		return ErrUnauthorized
 	}
 
-	return s.apiKeyRepo.Revoke(ctx, keyID)
+	if err := s.apiKeyRepo.Revoke(ctx, keyID); err != nil {
+		return err
+	}
+
+	// Best effort: subscribers' caches also expire on their own TTL
+	s.redis.Publish(ctx, APIKeyRevocationChannel, apiKey.KeyHash)
+
+	return nil
 }
 
 // ListAPIKeys lists all API keys for a user
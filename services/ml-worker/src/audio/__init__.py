@@ -0,0 +1,10 @@
+"""Audio processing modules."""
+
+from src.audio.analyzer import AudioAnalyzer
+from src.audio.decoder import AudioDecoder, AudioDecodeError
+
+__all__ = [
+    "AudioAnalyzer",
+    "AudioDecoder",
+    "AudioDecodeError",
+]
@@ -0,0 +1,128 @@
+"""Chunked audio analysis producing analysis_results.audio_analysis."""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.audio.decoder import AudioDecoder
+from src.detectors.audio_detector import AudioDetector
+from src.video.frame_results import FrameResults
+
+logger = logging.getLogger(__name__)
+
+
+class AudioAnalyzer:
+    """Streams a file's audio track through the detector chunk by chunk."""
+
+    # Thresholds
+    SUSPICIOUS_THRESHOLD = 0.65  # Synthetic probability threshold for suspicious windows
+    SEGMENT_GAP_THRESHOLD = 2.0  # Max gap in seconds to merge suspicious windows
+
+    def __init__(
+        self,
+        detector: Optional[AudioDetector] = None,
+        decoder: Optional[AudioDecoder] = None,
+    ):
+        """
+        Initialize the audio analyzer.
+
+        Args:
+            detector: Window scorer. Defaults to a new AudioDetector.
+            decoder: Chunked decoder. Defaults to a new AudioDecoder.
+        """
+        self.detector = detector or AudioDetector()
+        self.decoder = decoder or AudioDecoder()
+
+    async def analyze(
+        self,
+        path: str,
+        progress_callback: Optional[Callable] = None,
+        duration_seconds: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Analyze the audio track of a media file.
+
+        Only one decoded chunk is held at a time; per-window scores
+        accumulate in a columnar FrameResults.
+
+        Args:
+            path: Path to an audio or video file.
+            progress_callback: Optional async callback taking 0-100.
+            duration_seconds: Expected duration, used for progress reporting.
+
+        Returns:
+            The audio_analysis dict, or None if the file has no audio track.
+
+        Raises:
+            AudioDecodeError: If the audio track cannot be decoded.
+        """
+        if not await self.decoder.has_audio(path):
+            return None
+
+        loop = asyncio.get_running_loop()
+        results = FrameResults()
+        feature_sums: Dict[str, float] = {}
+        decoded_seconds = 0.0
+
+        async for chunk in self.decoder.chunks(path):
+            timestamps, probabilities, features = await loop.run_in_executor(
+                None, self.detector.score, chunk, decoded_seconds
+            )
+            results.extend(FrameResults.from_arrays(timestamps, probabilities))
+            for name, values in features.items():
+                feature_sums[name] = feature_sums.get(name, 0.0) + float(values.sum())
+
+            decoded_seconds += len(chunk) / self.decoder.SAMPLE_RATE
+            if progress_callback and duration_seconds:
+                await progress_callback(min(100, int(decoded_seconds / duration_seconds * 100)))
+
+        return self._summarize(results, feature_sums, decoded_seconds)
+
+    def determine_verdict(self, audio_analysis: Dict[str, Any]) -> Tuple[str, float, str]:
+        """Determine (verdict, confidence, risk_level) for an audio-only analysis."""
+        avg = audio_analysis["avg_synthetic_probability"]
+        peak = audio_analysis["max_synthetic_probability"]
+        segments = audio_analysis["suspicious_segments"]
+
+        if avg >= 0.7 or (peak >= 0.9 and len(segments) > 2):
+            return "ai_generated", avg, "high"
+        elif avg >= 0.5 or (peak >= 0.75 and segments):
+            return "likely_ai", avg, "medium"
+        elif avg >= 0.35 or segments:
+            return "inconclusive", avg, "medium"
+        elif avg >= 0.2:
+            return "likely_authentic", 1 - avg, "low"
+        else:
+            return "authentic", 1 - avg, "low"
+
+    def _summarize(
+        self, results: FrameResults, feature_sums: Dict[str, float], decoded_seconds: float
+    ) -> Dict[str, Any]:
+        """Build the audio_analysis dict from per-window scores."""
+        window_seconds = self.detector.WINDOW_SECONDS
+        segments = results.find_segments(self.SUSPICIOUS_THRESHOLD, self.SEGMENT_GAP_THRESHOLD)
+        windows = results.to_columns()
+
+        return {
+            "duration_seconds": round(decoded_seconds, 3),
+            "window_seconds": window_seconds,
+            "windows_analyzed": len(results),
+            "avg_synthetic_probability": round(results.mean_probability(), 3),
+            "max_synthetic_probability": round(results.max_probability(), 3),
+            "suspicious_segments": [
+                {
+                    "start": seg.start,
+                    "end": seg.end + window_seconds,
+                    "avg_synthetic_probability": round(seg.avg_ai_probability, 3),
+                }
+                for seg in segments
+            ],
+            "features": {
+                name: round(total / len(results), 4) if len(results) else None
+                for name, total in feature_sums.items()
+            },
+            "windows": {
+                "timestamps": windows["timestamps"],
+                "synthetic_probabilities": windows["ai_probabilities"],
+            },
+        }
@@ -0,0 +1,95 @@
+"""Streaming audio decoding through an ffmpeg pipe."""
+
+import asyncio
+import logging
+from typing import AsyncIterator
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AudioDecodeError(Exception):
+    """Raised when an audio track cannot be decoded."""
+
+    def __init__(self, code: str, message: str):
+        self.code = code
+        self.message = message
+        super().__init__(message)
+
+
+class AudioDecoder:
+    """
+    Decodes the audio track of a media file in fixed-size chunks.
+
+    ffmpeg resamples to mono float32 PCM and writes it to a pipe; chunks
+    are read one at a time, so memory stays bounded by the chunk size
+    regardless of the file's duration. The pipe applies backpressure when
+    the consumer is slower than the decoder.
+    """
+
+    SAMPLE_RATE = 16000  # Hz, mono
+    CHUNK_SECONDS = 10  # Samples handed to the consumer per read
+
+    def __init__(self, chunk_seconds: float = CHUNK_SECONDS):
+        """
+        Initialize the decoder.
+
+        Args:
+            chunk_seconds: Length of each decoded chunk.
+        """
+        self.chunk_samples = int(chunk_seconds * self.SAMPLE_RATE)
+
+    async def has_audio(self, path: str) -> bool:
+        """Check whether a file has at least one audio stream."""
+        process = await asyncio.create_subprocess_exec(
+            "ffprobe", "-v", "error", "-select_streams", "a",
+            "-show_entries", "stream=index", "-of", "csv=p=0", path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+        return process.returncode == 0 and bool(stdout.strip())
+
+    async def chunks(self, path: str) -> AsyncIterator[np.ndarray]:
+        """
+        Yield the audio track as consecutive float32 chunks.
+
+        Every chunk but the last holds exactly chunk_samples samples.
+
+        Raises:
+            AudioDecodeError: If ffmpeg fails to decode the file.
+        """
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-v", "error", "-nostdin", "-i", path,
+            "-vn", "-ac", "1", "-ar", str(self.SAMPLE_RATE), "-f", "f32le", "-",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        chunk_bytes = self.chunk_samples * 4
+
+        try:
+            while True:
+                try:
+                    data = await process.stdout.readexactly(chunk_bytes)
+                except asyncio.IncompleteReadError as e:
+                    data = e.partial
+
+                # A short read only happens at end of stream
+                usable = len(data) - len(data) % 4
+                if usable:
+                    yield np.frombuffer(data[:usable], dtype=np.float32)
+                if len(data) < chunk_bytes:
+                    break
+
+            stderr = await process.stderr.read()
+            if await process.wait() != 0:
+                logger.error(f"ffmpeg failed to decode audio: {stderr.decode(errors='replace')}")
+                raise AudioDecodeError(
+                    code="AUDIO_DECODE_FAILED",
+                    message="Failed to decode the audio track",
+                )
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
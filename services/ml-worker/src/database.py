@@ -1,13 +1,67 @@
 import logging
-from typing import Any, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 
 import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
 
+from src import queries
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+class Connection(asyncpg.Connection):
+    """
+    Connection that runs registered SQL through its own prepared statements.
+
+    The statements in queries.PREPARED are prepared once when the pool opens
+    the connection. fetch, fetchrow and fetchval with one of those strings
+    then skip the statement cache, and ad-hoc SQL can never evict them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prepared: Dict[str, PreparedStatement] = {}
+
+    async def prepare_registered(self) -> None:
+        """Prepare every registered statement on this connection."""
+        for query in queries.PREPARED:
+            self._prepared[query] = await self.prepare(query)
+
+    async def fetch(self, query: str, *args, timeout=None, record_class=None) -> list:
+        if query not in self._prepared or record_class is not None:
+            return await super().fetch(
+                query, *args, timeout=timeout, record_class=record_class
+            )
+        return await self._run_prepared(query, "fetch", *args, timeout=timeout)
+
+    async def fetchrow(self, query: str, *args, timeout=None, record_class=None):
+        if query not in self._prepared or record_class is not None:
+            return await super().fetchrow(
+                query, *args, timeout=timeout, record_class=record_class
+            )
+        return await self._run_prepared(query, "fetchrow", *args, timeout=timeout)
+
+    async def fetchval(self, query: str, *args, column=0, timeout=None) -> Any:
+        if query not in self._prepared:
+            return await super().fetchval(query, *args, column=column, timeout=timeout)
+        return await self._run_prepared(
+            query, "fetchval", *args, column=column, timeout=timeout
+        )
+
+    async def _run_prepared(self, query: str, method: str, *args, **kwargs) -> Any:
+        try:
+            return await getattr(self._prepared[query], method)(*args, **kwargs)
+        except asyncpg.exceptions.InvalidCachedStatementError:
+            # A migration changed a table under the statement; prepare it
+            # again and retry, unless the failure aborted a transaction
+            self._prepared[query] = await self.prepare(query)
+            if self.is_in_transaction():
+                raise
+            return await getattr(self._prepared[query], method)(*args, **kwargs)
+
+
 class Database:
     """Async PostgreSQL database client."""
 
@@ -20,9 +74,19 @@ class Database:
             settings.database_url,
             min_size=2,
             max_size=10,
+            # asyncpg's default cache size for other SQL; 0 disables server-side
+            # statements entirely
+            statement_cache_size=100 if settings.database_prepared_statements else 0,
+            connection_class=Connection,
+            init=self._init_connection,
         )
         logger.info("Database connection pool created")
 
+    @staticmethod
+    async def _init_connection(conn: Connection) -> None:
+        if settings.database_prepared_statements:
+            await conn.prepare_registered()
+
     async def disconnect(self):
         """Close connection pool."""
         if self.pool:
@@ -48,3 +112,10 @@ class Database:
         """Fetch a single value."""
         async with self.pool.acquire() as conn:
             return await conn.fetchval(query, *args)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection with an open transaction."""
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
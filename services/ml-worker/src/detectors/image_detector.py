@@ -9,6 +9,9 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Detector names selectable via options["models"]
+DETECTORS = ("primary", "gan", "diffusion", "frequency")
+
 
 class ImageDetector:
     """
@@ -40,7 +43,7 @@ class ImageDetector:
 
         Args:
             image_data: Raw image bytes
-            options: Detection options
+            options: Detection options. "models" selects a detector subset.
 
         Returns:
             Detection result dictionary
@@ -51,24 +54,29 @@ class ImageDetector:
         # Preprocess
         image = self._preprocess(image)
 
-        # Run individual detectors
+        # Run individual detectors (all of them unless a subset is requested)
         detections = []
+        selected = self._select_detectors(options)
 
         # Primary classifier
-        primary_result = await self._run_primary_classifier(image)
-        detections.append(primary_result)
+        if "primary" in selected:
+            primary_result = await self._run_primary_classifier(image)
+            detections.append(primary_result)
 
         # GAN detector
-        gan_result = await self._run_gan_detector(image)
-        detections.append(gan_result)
+        if "gan" in selected:
+            gan_result = await self._run_gan_detector(image)
+            detections.append(gan_result)
 
         # Diffusion detector
-        diffusion_result = await self._run_diffusion_detector(image)
-        detections.append(diffusion_result)
+        if "diffusion" in selected:
+            diffusion_result = await self._run_diffusion_detector(image)
+            detections.append(diffusion_result)
 
         # Frequency analysis
-        freq_result = await self._run_frequency_analysis(image)
-        detections.append(freq_result)
+        if "frequency" in selected:
+            freq_result = await self._run_frequency_analysis(image)
+            detections.append(freq_result)
 
         # Calculate ensemble score
         ensemble_score = self._calculate_ensemble_score(detections)
@@ -88,6 +96,15 @@ class ImageDetector:
             "ensemble_score": ensemble_score,
         }
 
+    def _select_detectors(self, options: Dict[str, Any]) -> set:
+        """
+        Resolve the detector subset requested via options["models"].
+
+        Unknown names are ignored; an empty selection runs every detector.
+        """
+        requested = set(options.get("models") or DETECTORS) & set(DETECTORS)
+        return requested or set(DETECTORS)
+
     def _preprocess(self, image: Image.Image) -> Image.Image:
         """Preprocess image for detection."""
         # Convert to RGB if necessary
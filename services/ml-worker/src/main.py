@@ -8,10 +8,17 @@ from typing import Optional
 import aio_pika
 from aio_pika import IncomingMessage
 
+from src import queries
+from src.audio.analyzer import AudioAnalyzer
 from src.config import settings
 from src.detectors.image_detector import ImageDetector
 from src.storage import S3Storage
 from src.database import Database
+from src.media_cache import MediaCache
+from src.status_store import StatusStore
+from src.video.profiles import get_profile
+from src.video.workspace import WorkspaceManager
+from src.workers.audio_worker import AudioWorker
 from src.workers.video_worker import VideoWorker
 
 logging.basicConfig(
@@ -29,8 +36,14 @@ class MLWorker:
         self.channel: Optional[aio_pika.Channel] = None
         self.image_detector: Optional[ImageDetector] = None
         self.video_worker: Optional[VideoWorker] = None
+        self.audio_worker: Optional[AudioWorker] = None
         self.storage: Optional[S3Storage] = None
+        self.media_cache: Optional[MediaCache] = None
+        self.workspaces: Optional[WorkspaceManager] = None
+        self.long_workspaces: Optional[WorkspaceManager] = None
         self.db: Optional[Database] = None
+        self.status_store: Optional[StatusStore] = None
+        self.straggler_task: Optional[asyncio.Task] = None
         self.running = True
 
     async def start(self):
@@ -38,25 +51,65 @@ class MLWorker:
         logger.info(f"Starting ML Worker {settings.worker_id}...")
 
         # Initialize components
-        self.storage = S3Storage()
+        if settings.media_cache_enabled:
+            self.media_cache = MediaCache()
+        self.storage = S3Storage(cache=self.media_cache)
+        self.workspaces = WorkspaceManager(
+            root=settings.scratch_dir,
+            quota_bytes=settings.scratch_quota_bytes,
+            wait_seconds=settings.scratch_wait_seconds,
+        )
+        self.workspaces.reclaim_orphans()
+        self.long_workspaces = WorkspaceManager(
+            root=settings.long_video_scratch_dir,
+            quota_bytes=settings.long_video_scratch_quota_bytes,
+            wait_seconds=settings.scratch_wait_seconds,
+        )
+        self.long_workspaces.reclaim_orphans()
         self.db = Database()
         await self.db.connect()
+        self.status_store = StatusStore()
+        await self.status_store.connect()
 
         # Initialize detectors
         self.image_detector = ImageDetector()
 
-        # Initialize video worker
-        self.video_worker = VideoWorker(self.db, self.image_detector)
-
         # Connect to RabbitMQ
         self.connection = await aio_pika.connect_robust(settings.rabbitmq_url)
         self.channel = await self.connection.channel()
         await self.channel.set_qos(prefetch_count=settings.prefetch_count)
 
+        # Initialize video and audio workers (video publishes chunk sub-jobs
+        # on the channel; both share one audio analyzer)
+        audio_analyzer = AudioAnalyzer()
+        self.video_worker = VideoWorker(
+            self.db,
+            self.image_detector,
+            media_cache=self.media_cache,
+            workspaces=self.workspaces,
+            long_workspaces=self.long_workspaces,
+            channel=self.channel,
+            audio_analyzer=audio_analyzer,
+            status_store=self.status_store,
+        )
+        self.audio_worker = AudioWorker(
+            self.db,
+            self.storage,
+            self.workspaces,
+            audio_analyzer=audio_analyzer,
+            status_store=self.status_store,
+        )
+
         # Start consuming from queues
         await self._consume_queue(settings.queue_image_analysis, self._process_image_job)
         await self._consume_queue(settings.queue_video_analysis, self._process_video_job)
         await self._consume_queue(settings.queue_video_demo, self._process_demo_video_job)
+        await self._consume_queue(settings.queue_video_chunk, self._process_video_chunk_job)
+        await self._consume_queue(settings.queue_audio_analysis, self._process_audio_job)
+        await self._consume_queue(settings.queue_batch_analysis, self._process_batch_job)
+
+        # Hand straggling chunks of sharded jobs to other workers
+        self.straggler_task = asyncio.create_task(self._reissue_stragglers_loop())
 
         logger.info(f"ML Worker {settings.worker_id} started successfully")
 
@@ -69,12 +122,16 @@ class MLWorker:
         logger.info("Shutting down ML Worker...")
         self.running = False
 
+        if self.straggler_task:
+            self.straggler_task.cancel()
         if self.channel:
             await self.channel.close()
         if self.connection:
             await self.connection.close()
         if self.db:
             await self.db.disconnect()
+        if self.status_store:
+            await self.status_store.disconnect()
 
         logger.info("ML Worker shutdown complete")
 
@@ -107,7 +164,10 @@ class MLWorker:
 
                 # Run detection
                 await self._update_status(analysis_id, "processing", 40, "detecting")
-                result = await self.image_detector.detect(image_data, options)
+                profile = get_profile(options.get("quality"))
+                result = await self.image_detector.detect(
+                    image_data, profile.detector_options(options)
+                )
 
                 # Generate heatmap if requested
                 heatmap_url = None
@@ -156,6 +216,88 @@ class MLWorker:
         """Process a demo video analysis job with stricter constraints."""
         await self.video_worker.process_demo_job(message)
 
+    async def _process_audio_job(self, message: IncomingMessage):
+        """Process an audio analysis job."""
+        await self.audio_worker.process_job(message)
+
+    async def _process_video_chunk_job(self, message: IncomingMessage):
+        """Process one time-range chunk of a sharded video job."""
+        await self.video_worker.process_chunk_job(message)
+
+    async def _process_batch_job(self, message: IncomingMessage):
+        """
+        Dispatch a batch's items to the queues of their analysis types.
+
+        Each item already carries a complete single-analysis job, so the
+        regular consumers process it. The batch is marked processing only
+        after every item is published: a failure mid-dispatch requeues the
+        message and the next delivery re-publishes, rather than stranding
+        items as pending. Only a malformed message is dropped.
+        """
+        queues = {
+            "image": settings.queue_image_analysis,
+            "video": settings.queue_video_analysis,
+            "audio": settings.queue_audio_analysis,
+        }
+        async with message.process(requeue=True):
+            try:
+                batch = json.loads(message.body.decode())
+                batch_id = batch["batch_id"]
+                items = batch["items"]
+            except (ValueError, KeyError) as e:
+                logger.error(f"Dropping malformed batch job: {e}")
+                return
+
+            try:
+                status = await self.db.fetchval(
+                    "SELECT status FROM batch_analyses WHERE id = $1", batch_id
+                )
+                if status != "pending":
+                    logger.info(f"Skipping batch {batch_id}: already {status}")
+                    return
+
+                for job in items:
+                    queue_name = queues.get(job["type"])
+                    if queue_name is None:
+                        await self._update_status(
+                            job["analysis_id"],
+                            "failed",
+                            0,
+                            None,
+                            error_code="UNSUPPORTED_TYPE",
+                            error_message=f"{job['type']} analysis is not supported",
+                        )
+                        continue
+                    await self.channel.default_exchange.publish(
+                        aio_pika.Message(
+                            body=json.dumps(job).encode(),
+                            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                            priority=job.get("priority", 5),
+                        ),
+                        routing_key=queue_name,
+                    )
+
+                await self.db.execute(
+                    """
+                    UPDATE batch_analyses SET status = 'processing'
+                    WHERE id = $1 AND status = 'pending'
+                    """,
+                    batch_id,
+                )
+                logger.info(f"Dispatched batch {batch_id} ({len(items)} items)")
+            except Exception as e:
+                logger.error(f"Failed to dispatch batch {batch_id}, requeueing: {e}")
+                raise
+
+    async def _reissue_stragglers_loop(self):
+        """Periodically re-issue chunks stuck on slow or dead workers."""
+        while self.running:
+            try:
+                await self.video_worker.reissue_stragglers()
+            except Exception as e:
+                logger.error(f"Straggler sweep failed: {e}")
+            await asyncio.sleep(settings.video_chunk_sweep_interval_seconds)
+
     async def _update_status(
         self,
         analysis_id: str,
@@ -166,16 +308,8 @@ class MLWorker:
         error_message: Optional[str] = None,
     ):
         """Update analysis status in database."""
-        await self.db.execute(
-            """
-            UPDATE analyses
-            SET status = $2, progress = $3, current_stage = $4,
-                error_code = $5, error_message = $6,
-                processing_started_at = CASE WHEN $2 = 'processing' AND processing_started_at IS NULL THEN NOW() ELSE processing_started_at END,
-                processing_completed_at = CASE WHEN $2 IN ('completed', 'failed') THEN NOW() ELSE processing_completed_at END,
-                updated_at = NOW()
-            WHERE id = $1
-            """,
+        row = await self.db.fetchrow(
+            queries.UPDATE_ANALYSIS_STATUS,
             analysis_id,
             status,
             progress,
@@ -183,6 +317,7 @@ class MLWorker:
             error_code,
             error_message,
         )
+        await self.status_store.publish(row)
 
     async def _store_result(self, analysis_id: str, result: dict, heatmap_url: Optional[str]):
         """Store analysis result in database."""
@@ -0,0 +1,302 @@
+"""Worker-local, size-bounded disk cache for downloaded media."""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from uuid import uuid4
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MediaCache:
+    """
+    Content-addressed disk cache shared by all worker processes on a host.
+
+    Entries are keyed by a logical key (YouTube video ID + variant, or S3
+    bucket/key + ETag) hashed to a file name. Writers stage into a temp file
+    and atomically rename, so readers never observe partial entries. The
+    file mtime is the LRU clock; eviction runs under an exclusive flock so
+    concurrent processes don't double-evict.
+    """
+
+    # Staging files untouched this long were left by a killed process; live
+    # writers keep bumping the mtime as they copy
+    STALE_STAGING_SECONDS = 3600
+
+    FILL_POLL_SECONDS = 0.5
+
+    def __init__(self, root: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Cache directory. Defaults to settings.media_cache_dir.
+            max_bytes: Byte budget. Defaults to settings.media_cache_max_bytes.
+        """
+        self.root = root or settings.media_cache_dir
+        self.max_bytes = max_bytes or settings.media_cache_max_bytes
+        self.objects_dir = os.path.join(self.root, "objects")
+        self.staging_dir = os.path.join(self.root, "staging")
+        self.fill_locks_dir = os.path.join(self.root, "locks")
+        self.lock_path = os.path.join(self.root, ".lock")
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.staging_dir, exist_ok=True)
+        os.makedirs(self.fill_locks_dir, exist_ok=True)
+        self._sweep_staging()
+
+        # Metrics (per process)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_served = 0
+
+    @staticmethod
+    def video_key(video_id: str, variant: str = "") -> str:
+        """Build the cache key for a YouTube download."""
+        return f"youtube:{video_id}:{variant}"
+
+    @staticmethod
+    def object_key(bucket: str, key: str, etag: str) -> str:
+        """Build the cache key for an S3 object version."""
+        etag = etag.strip('"')
+        return f"s3:{bucket}/{key}:{etag}"
+
+    async def get_file(self, key: str, dest_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Materialize a cached file at dest_path.
+
+        The file is hard-linked when possible (falling back to a copy), so the
+        caller owns dest_path and may delete it independently of eviction.
+
+        Returns:
+            The entry metadata on a hit, None on a miss.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._get_file_sync, key, dest_path)
+
+    async def put_file(
+        self, key: str, src_path: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Add a file to the cache, leaving src_path in place."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._put_file_sync, key, src_path, metadata)
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Read a cached object into memory, or None on a miss."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._get_bytes_sync, key)
+
+    async def put_bytes(
+        self, key: str, data: bytes, metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Add an in-memory object to the cache."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._put_bytes_sync, key, data, metadata)
+
+    @asynccontextmanager
+    async def fill_lock(self, key: str) -> AsyncIterator[None]:
+        """
+        Hold a host-wide lock on filling a key.
+
+        Jobs that miss on the same key serialize here, so the first one
+        fetches the object and the rest find it cached when they get the
+        lock. The lock is a flock, released by the kernel if its holder dies.
+        """
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        lock_file = open(os.path.join(self.fill_locks_dir, digest), "a")
+        try:
+            # Poll rather than block, so waiters don't tie up executor threads
+            while True:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(self.FILL_POLL_SECONDS)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss metrics for this process."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "bytes_served": self.bytes_served,
+        }
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        """Return (data_path, metadata_path) for a key."""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        shard = os.path.join(self.objects_dir, digest[:2])
+        return os.path.join(shard, digest), os.path.join(shard, f"{digest}.json")
+
+    def _get_file_sync(self, key: str, dest_path: str) -> Optional[Dict[str, Any]]:
+        data_path, meta_path = self._paths(key)
+        try:
+            metadata = self._read_metadata(meta_path)
+            try:
+                os.link(data_path, dest_path)
+            except OSError as e:
+                if isinstance(e, FileNotFoundError):
+                    raise
+                shutil.copyfile(data_path, dest_path)
+            os.utime(data_path)
+        except FileNotFoundError:
+            self._record_miss(key)
+            return None
+
+        self._record_hit(key, os.path.getsize(dest_path))
+        return metadata
+
+    def _get_bytes_sync(self, key: str) -> Optional[bytes]:
+        data_path, _ = self._paths(key)
+        try:
+            with open(data_path, "rb") as f:
+                data = f.read()
+            os.utime(data_path)
+        except FileNotFoundError:
+            self._record_miss(key)
+            return None
+
+        self._record_hit(key, len(data))
+        return data
+
+    def _put_file_sync(
+        self, key: str, src_path: str, metadata: Optional[Dict[str, Any]]
+    ) -> None:
+        with self._staged() as staged_path:
+            try:
+                os.link(src_path, staged_path)
+            except OSError:
+                shutil.copyfile(src_path, staged_path)
+            self._commit(key, staged_path, metadata)
+
+    def _put_bytes_sync(
+        self, key: str, data: bytes, metadata: Optional[Dict[str, Any]]
+    ) -> None:
+        with self._staged() as staged_path:
+            with open(staged_path, "wb") as f:
+                f.write(data)
+            self._commit(key, staged_path, metadata)
+
+    @contextmanager
+    def _staged(self):
+        """Yield a unique staging path, removing it if it's never committed."""
+        staged_path = os.path.join(self.staging_dir, uuid4().hex)
+        try:
+            yield staged_path
+        finally:
+            if os.path.exists(staged_path):
+                os.remove(staged_path)
+
+    def _commit(
+        self, key: str, staged_path: str, metadata: Optional[Dict[str, Any]]
+    ) -> None:
+        """Atomically publish a staged file and enforce the byte budget."""
+        size = os.path.getsize(staged_path)
+        if size > self.max_bytes:
+            logger.info(f"Not caching {key}: {size} bytes exceeds cache budget")
+            return
+
+        data_path, meta_path = self._paths(key)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+
+        # Metadata goes first so a visible data file always has its sidecar
+        meta_tmp = f"{staged_path}.json"
+        with open(meta_tmp, "w") as f:
+            json.dump({"key": key, "metadata": metadata or {}}, f)
+        os.replace(meta_tmp, meta_path)
+        os.replace(staged_path, data_path)
+
+        self._evict(reserve_path=data_path)
+
+    def _evict(self, reserve_path: Optional[str] = None) -> None:
+        """Remove least recently used entries until under budget."""
+        with self._exclusive_lock():
+            entries = []
+            total = 0
+            for shard in os.scandir(self.objects_dir):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if entry.name.endswith(".json"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                if path == reserve_path:
+                    continue
+                for victim in (path, f"{path}.json"):
+                    try:
+                        os.remove(victim)
+                    except FileNotFoundError:
+                        pass
+                total -= size
+                self.evictions += 1
+
+    def _sweep_staging(self) -> None:
+        """Remove staging files abandoned by processes killed mid-write."""
+        cutoff = time.time() - self.STALE_STAGING_SECONDS
+        removed = 0
+        with self._exclusive_lock():
+            for entry in os.scandir(self.staging_dir):
+                try:
+                    if entry.stat().st_mtime >= cutoff:
+                        continue
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    continue
+                removed += 1
+        if removed:
+            logger.info(f"Removed {removed} stale media cache staging files")
+
+    @contextmanager
+    def _exclusive_lock(self):
+        """Hold an exclusive cross-process lock on the cache directory."""
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read_metadata(meta_path: str) -> Dict[str, Any]:
+        with open(meta_path) as f:
+            return json.load(f).get("metadata", {})
+
+    def _record_hit(self, key: str, size: int) -> None:
+        self.hits += 1
+        self.bytes_served += size
+        logger.info(f"Media cache hit: {key} ({size} bytes) {self.stats()}")
+
+    def _record_miss(self, key: str) -> None:
+        self.misses += 1
+        logger.info(f"Media cache miss: {key} {self.stats()}")
@@ -0,0 +1,56 @@
+# Registry of the SQL on hot paths, referenced by name.
+#
+# Every statement listed in PREPARED is prepared on each pooled connection
+# when it opens (see database.Connection), and calls passing the same
+# string run through it. Call sites must therefore use these constants
+# rather than keep their own copies of the SQL.
+# UPDATE_ANALYSIS_STATUS and UPDATE_ANALYSIS_FILE_INFO match the analysis
+# service's src/core/queries.py.
+
+# Args: analysis_id, status, progress, stage, error_code, error_message
+UPDATE_ANALYSIS_STATUS = """
+    UPDATE analyses
+    SET status = $2::analysis_status, progress = $3, current_stage = $4,
+        error_code = $5, error_message = $6,
+        processing_started_at = CASE WHEN $2 = 'processing' AND processing_started_at IS NULL THEN NOW() ELSE processing_started_at END,
+        processing_completed_at = CASE WHEN $2 IN ('completed', 'failed') THEN NOW() ELSE processing_completed_at END,
+        updated_at = NOW()
+    WHERE id = $1
+    RETURNING *
+"""
+
+# Args: analysis_id, file_name, file_size_bytes, file_mime_type,
+#       duration_seconds, resolution, fps
+UPDATE_ANALYSIS_FILE_INFO = """
+    UPDATE analyses
+    SET file_name = $2, file_size_bytes = $3, file_mime_type = $4,
+        duration_seconds = $5, resolution = $6, fps = $7,
+        updated_at = NOW()
+    WHERE id = $1
+    RETURNING *
+"""
+
+# Progress of a sharded job; leaves finished analyses alone.
+# Args: analysis_id, progress, current_stage
+UPDATE_CHUNK_PROGRESS = """
+    UPDATE analyses
+    SET progress = $2, current_stage = $3, updated_at = NOW()
+    WHERE id = $1 AND status = 'processing'
+    RETURNING *
+"""
+
+# Args: analysis_id
+INCREMENT_RETRY_COUNT = """
+    UPDATE analyses
+    SET retry_count = COALESCE(retry_count, 0) + 1, updated_at = NOW()
+    WHERE id = $1
+    RETURNING retry_count
+"""
+
+# Prepared on every pooled connection
+PREPARED = (
+    UPDATE_ANALYSIS_STATUS,
+    UPDATE_ANALYSIS_FILE_INFO,
+    UPDATE_CHUNK_PROGRESS,
+    INCREMENT_RETRY_COUNT,
+)
@@ -0,0 +1,119 @@
+"""Write side of the API's Redis read model of analysis status."""
+
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Must match STATUS_FIELDS in the analysis service's status_store
+STATUS_FIELDS = (
+    "id",
+    "user_id",
+    "type",
+    "status",
+    "progress",
+    "current_stage",
+    "error_code",
+    "error_message",
+    "file_name",
+    "file_size_bytes",
+    "file_mime_type",
+    "created_at",
+    "updated_at",
+    "processing_completed_at",
+    "processing_time_ms",
+)
+
+# KEYS: status, events
+# ARGV: version, row json, ttl seconds
+_PUBLISH = """
+local current = redis.call('HGET', KEYS[1], 'version')
+if current and tonumber(current) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'version', ARGV[1], 'row', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('PUBLISH', KEYS[2], ARGV[2])
+return 1
+"""
+
+
+def status_key(analysis_id: Any) -> str:
+    return f"analysis:{analysis_id}:status"
+
+
+def events_channel(analysis_id: Any) -> str:
+    return f"analysis:{analysis_id}:events"
+
+
+def status_row(row: Any) -> Dict[str, Any]:
+    """JSON-safe projection of an analyses row onto STATUS_FIELDS."""
+    view = {}
+    for field in STATUS_FIELDS:
+        value = row[field]
+        if isinstance(value, UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        view[field] = value
+    return view
+
+
+def row_version(row: Any) -> int:
+    """The row's updated_at in microseconds since the epoch."""
+    updated_at = row["updated_at"]
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return int(updated_at.timestamp() * 1_000_000)
+
+
+class StatusStore:
+    """
+    Publishes analyses rows to the status read model the API serves.
+
+    Workers publish the row each status, progress or file-info UPDATE
+    returns, so polling clients see progress without the API querying
+    Postgres, and streaming clients get it pushed over the analysis's
+    events channel. Publishing is best effort: the API rebuilds missing or
+    expired documents from Postgres, so Redis errors are only logged.
+    """
+
+    def __init__(self):
+        self.client: Optional[aioredis.Redis] = None
+        self._script = None
+
+    async def connect(self):
+        """Create the Redis client."""
+        self.client = aioredis.from_url(settings.redis_url, decode_responses=True)
+        self._script = self.client.register_script(_PUBLISH)
+        logger.info("Status store connected to Redis")
+
+    async def disconnect(self):
+        """Close the Redis client."""
+        if self.client:
+            await self.client.close()
+            logger.info("Status store connection closed")
+
+    async def publish(self, row: Any) -> None:
+        """Publish an analyses row (e.g. from UPDATE ... RETURNING *)."""
+        if row is None or self._script is None:
+            return
+        try:
+            await self._script(
+                keys=[status_key(row["id"]), events_channel(row["id"])],
+                args=[
+                    row_version(row),
+                    json.dumps(status_row(row)),
+                    settings.status_cache_ttl_seconds,
+                ],
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to publish status of analysis {row['id']}: {e}")
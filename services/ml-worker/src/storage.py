@@ -1,11 +1,14 @@
+import asyncio
 import io
 import logging
+import os
 from typing import Optional
 
 import boto3
 from botocore.config import Config as BotoConfig
 
 from src.config import settings
+from src.media_cache import MediaCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +16,8 @@ logger = logging.getLogger(__name__)
 class S3Storage:
     """S3-compatible storage client."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[MediaCache] = None):
+        self.cache = cache
         self.client = boto3.client(
             "s3",
             endpoint_url=settings.s3_endpoint,
@@ -24,14 +28,42 @@ class S3Storage:
         )
 
     async def download(self, bucket: str, key: str) -> bytes:
-        """Download a file from S3."""
+        """Download a file from S3, serving repeat fetches from the media cache."""
         try:
-            response = self.client.get_object(Bucket=bucket, Key=key)
-            return response["Body"].read()
+            if self.cache is None:
+                response = self.client.get_object(Bucket=bucket, Key=key)
+                return response["Body"].read()
+
+            # The ETag pins the object version, so a cached copy is never stale
+            head = self.client.head_object(Bucket=bucket, Key=key)
+            cache_key = MediaCache.object_key(bucket, key, head["ETag"])
+            data = await self.cache.get_bytes(cache_key)
+            if data is not None:
+                return data
+
+            response = self.client.get_object(Bucket=bucket, Key=key, IfMatch=head["ETag"])
+            data = response["Body"].read()
+            await self.cache.put_bytes(cache_key, data)
+            return data
         except Exception as e:
             logger.error(f"Failed to download {bucket}/{key}: {e}")
             raise
 
+    async def download_file(self, bucket: str, key: str, dest_path: str) -> int:
+        """
+        Stream a file from S3 to disk without holding it in memory.
+
+        Returns:
+            The number of bytes written.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self.client.download_file, bucket, key, dest_path)
+            return os.path.getsize(dest_path)
+        except Exception as e:
+            logger.error(f"Failed to download {bucket}/{key} to {dest_path}: {e}")
+            raise
+
     async def upload(
         self,
         bucket: str,
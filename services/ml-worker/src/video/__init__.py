@@ -2,5 +2,16 @@
 
 from src.video.downloader import VideoDownloader, DownloadError
 from src.video.frame_extractor import FrameExtractor
+from src.video.profiles import QualityProfile, get_profile
+from src.video.workspace import Workspace, WorkspaceManager, WorkspaceQuotaExceeded
 
-__all__ = ["VideoDownloader", "DownloadError", "FrameExtractor"]
+__all__ = [
+    "VideoDownloader",
+    "DownloadError",
+    "FrameExtractor",
+    "QualityProfile",
+    "get_profile",
+    "Workspace",
+    "WorkspaceManager",
+    "WorkspaceQuotaExceeded",
+]
@@ -1,26 +1,51 @@
 """YouTube video downloader using yt-dlp."""
 
 import asyncio
+import glob
 import logging
+import mimetypes
 import os
 import tempfile
-from dataclasses import dataclass
-from typing import Optional
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
 
+import cv2
 import yt_dlp
 
+from src.video.workspace import Workspace
+
 logger = logging.getLogger(__name__)
 
+# yt-dlp error text for videos that are gone or were never public. Anything
+# else (network errors, throttling, extractor breakage) may pass on retry.
+UNAVAILABLE_ERROR_MARKERS = (
+    "video unavailable",
+    "private video",
+    "has been removed",
+    "no longer available",
+    "is not available",
+    "account associated with this video has been terminated",
+    "members-only",
+    "unsupported url",
+)
+
 
 class DownloadError(Exception):
     """Raised when video download fails."""
 
-    def __init__(self, code: str, message: str):
+    def __init__(self, code: str, message: str, retryable: bool = False):
         self.code = code
         self.message = message
+        self.retryable = retryable
         super().__init__(message)
 
 
+class _SizeLimitExceeded(Exception):
+    """Raised from the yt-dlp progress hook to abort an oversized download."""
+
+
 @dataclass
 class VideoInfo:
     """Information about a downloaded video."""
@@ -32,6 +57,8 @@ class VideoInfo:
     file_size_bytes: int
     resolution: str
     fps: float
+    mime_type: str = "video/mp4"
+    timings: Dict[str, float] = field(default_factory=dict)
 
 
 class VideoDownloader:
@@ -42,19 +69,54 @@ class VideoDownloader:
     MAX_FILE_SIZE_BYTES = 500 * 1024 * 1024  # 500MB
     MAX_RESOLUTION = 720  # 720p
 
-    def __init__(self, temp_dir: Optional[str] = None):
+    # Minimum gap between download progress reports
+    PROGRESS_MIN_INTERVAL_SECONDS = 1.0
+
+    # Conservative stream bitrate used to size scratch reservations
+    BYTES_PER_SECOND_AT_720P = 1.5 * 1024 * 1024
+
+    def __init__(
+        self, temp_dir: Optional[str] = None, workspace: Optional[Workspace] = None
+    ):
         """
         Initialize the downloader.
 
         Args:
             temp_dir: Directory for temporary video files. Defaults to system temp.
+            workspace: Reserved scratch workspace to download into. Overrides
+                temp_dir and caps the file size at the reservation.
         """
         self.temp_dir = temp_dir or tempfile.gettempdir()
+        if workspace is not None:
+            self.temp_dir = workspace.path
+            self.MAX_FILE_SIZE_BYTES = min(self.MAX_FILE_SIZE_BYTES, workspace.reserved_bytes)
+
+    def estimate_download_bytes(
+        self,
+        max_seconds: Optional[float] = None,
+        max_resolution: Optional[int] = None,
+    ) -> int:
+        """
+        Estimate the scratch space a download needs, for workspace reservations.
+
+        Args:
+            max_seconds: Leading range that will be downloaded, if bounded.
+            max_resolution: Height cap for the stream. Defaults to MAX_RESOLUTION.
+
+        Returns:
+            An upper bound in bytes, never more than MAX_FILE_SIZE_BYTES.
+        """
+        seconds = min(max_seconds or self.MAX_DURATION_SECONDS, self.MAX_DURATION_SECONDS)
+        scale = ((max_resolution or self.MAX_RESOLUTION) / 720) ** 2
+        estimate = int(seconds * self.BYTES_PER_SECOND_AT_720P * scale)
+        return min(self.MAX_FILE_SIZE_BYTES, estimate)
 
     async def download(
         self,
         youtube_url: str,
         progress_callback: Optional[callable] = None,
+        max_seconds: Optional[float] = None,
+        max_resolution: Optional[int] = None,
     ) -> VideoInfo:
         """
         Download a YouTube video.
@@ -62,6 +124,9 @@ class VideoDownloader:
         Args:
             youtube_url: The YouTube URL to download.
             progress_callback: Optional callback for progress updates.
+            max_seconds: Only download the first N seconds of the video.
+            max_resolution: Height cap for the downloaded stream. Defaults to
+                MAX_RESOLUTION.
 
         Returns:
             VideoInfo with details about the downloaded video.
@@ -69,37 +134,42 @@ class VideoDownloader:
         Raises:
             DownloadError: If download fails.
         """
-        # First, get video info to check duration
-        info = await self._get_video_info(youtube_url)
+        loop = asyncio.get_running_loop()
+        ydl_opts = self._download_options(
+            loop, progress_callback, max_seconds, max_resolution
+        )
+        timings: Dict[str, float] = {}
 
-        # Check duration limit
-        duration = info.get("duration", 0)
-        if duration > self.MAX_DURATION_SECONDS:
-            if self.MAX_DURATION_SECONDS < 60:
-                limit_str = f"{self.MAX_DURATION_SECONDS} second"
-            else:
-                limit_str = f"{self.MAX_DURATION_SECONDS // 60} minute"
-            raise DownloadError(
-                code="VIDEO_TOO_LONG",
-                message=f"Video exceeds {limit_str} limit",
-            )
+        # A single YoutubeDL instance probes the video once; the same info
+        # dict then drives the download without a second extraction
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = await self._get_video_info(youtube_url, ydl)
 
-        # Generate output path
-        video_id = info.get("id", "unknown")
-        output_path = os.path.join(self.temp_dir, f"{video_id}.mp4")
+            # Check duration limit
+            duration = info.get("duration", 0)
+            self.check_duration(duration)
 
-        # Download the video
-        try:
-            await self._download_video(youtube_url, output_path, progress_callback)
-        except Exception as e:
-            logger.error(f"Download failed: {e}")
-            raise DownloadError(
-                code="DOWNLOAD_FAILED",
-                message="Failed to download. Please try again",
-            )
+            video_id = info.get("id", "unknown")
+
+            # Download the video; the container is whatever yt-dlp delivers
+            try:
+                started = time.monotonic()
+                output_path = await loop.run_in_executor(
+                    None, self._download_with_info, ydl, info
+                )
+                timings["download_ms"] = round((time.monotonic() - started) * 1000, 1)
+            except _SizeLimitExceeded:
+                self._cleanup_partial(video_id)
+                raise self._file_too_large()
+            except Exception as e:
+                logger.error(f"Download failed: {e}")
+                raise DownloadError(
+                    code="DOWNLOAD_FAILED",
+                    message="Failed to download. Please try again",
+                )
 
         # Verify file exists and check size
-        if not os.path.exists(output_path):
+        if not output_path or not os.path.exists(output_path):
             raise DownloadError(
                 code="DOWNLOAD_FAILED",
                 message="Failed to download. Please try again",
@@ -108,10 +178,19 @@ class VideoDownloader:
         file_size = os.path.getsize(output_path)
         if file_size > self.MAX_FILE_SIZE_BYTES:
             os.remove(output_path)
-            raise DownloadError(
-                code="FILE_TOO_LARGE",
-                message=f"Video file exceeds {self.MAX_FILE_SIZE_BYTES // (1024*1024)}MB limit",
-            )
+            raise self._file_too_large()
+
+        # Decode the delivered container directly; only stream-copy remux
+        # into mp4 when OpenCV cannot read it
+        started = time.monotonic()
+        output_path = await self._ensure_decodable(output_path)
+        timings["remux_ms"] = round((time.monotonic() - started) * 1000, 1)
+        file_size = os.path.getsize(output_path)
+        logger.info(
+            f"Downloaded {video_id} as {os.path.splitext(output_path)[1] or 'unknown'} "
+            f"({file_size} bytes): download {timings['download_ms']}ms, "
+            f"remux {timings['remux_ms']}ms"
+        )
 
         # Extract resolution and fps
         resolution = f"{info.get('height', 720)}p"
@@ -125,34 +204,45 @@ class VideoDownloader:
             file_size_bytes=file_size,
             resolution=resolution,
             fps=fps,
+            mime_type=mimetypes.guess_type(output_path)[0] or "video/mp4",
+            timings=timings,
         )
 
-    async def _get_video_info(self, url: str) -> dict:
-        """Get video info without downloading."""
-        ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-            "extract_flat": False,
-        }
+    def check_duration(self, duration: float) -> None:
+        """
+        Check a video duration against this downloader's limit.
 
-        def _extract():
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                return ydl.extract_info(url, download=False)
+        Raises:
+            DownloadError: If the video is too long.
+        """
+        if duration > self.MAX_DURATION_SECONDS:
+            if self.MAX_DURATION_SECONDS < 60:
+                limit_str = f"{self.MAX_DURATION_SECONDS} second"
+            else:
+                limit_str = f"{self.MAX_DURATION_SECONDS // 60} minute"
+            raise DownloadError(
+                code="VIDEO_TOO_LONG",
+                message=f"Video exceeds {limit_str} limit",
+            )
 
-        loop = asyncio.get_event_loop()
+    @staticmethod
+    def video_id_from_url(url: str) -> Optional[str]:
+        """Extract the video ID from a normalized YouTube watch URL."""
+        parsed = urlparse(url)
+        video_ids = parse_qs(parsed.query).get("v")
+        if video_ids:
+            return video_ids[0]
+        if parsed.netloc.endswith("youtu.be"):
+            return parsed.path.strip("/") or None
+        return None
+
+    async def _get_video_info(self, url: str, ydl: yt_dlp.YoutubeDL) -> dict:
+        """Get video info without downloading."""
+        loop = asyncio.get_running_loop()
         try:
-            info = await loop.run_in_executor(None, _extract)
+            info = await loop.run_in_executor(None, ydl.extract_info, url, False)
         except yt_dlp.utils.DownloadError as e:
-            error_msg = str(e).lower()
-            if "private" in error_msg or "unavailable" in error_msg:
-                raise DownloadError(
-                    code="VIDEO_UNAVAILABLE",
-                    message="This video is unavailable or private",
-                )
-            raise DownloadError(
-                code="VIDEO_UNAVAILABLE",
-                message="This video is unavailable or private",
-            )
+            raise self._probe_error(e)
 
         if not info:
             raise DownloadError(
@@ -162,49 +252,142 @@ class VideoDownloader:
 
         return info
 
-    async def _download_video(
+    def _download_options(
         self,
-        url: str,
-        output_path: str,
+        loop: asyncio.AbstractEventLoop,
         progress_callback: Optional[callable] = None,
-    ) -> None:
-        """Download video to the specified path."""
-        progress_hook = None
-        if progress_callback:
-            def progress_hook(d):
-                if d["status"] == "downloading":
-                    total = d.get("total_bytes") or d.get("total_bytes_estimate", 0)
-                    downloaded = d.get("downloaded_bytes", 0)
-                    if total > 0:
-                        progress = int((downloaded / total) * 100)
-                        # Run callback in async context if possible
-                        try:
-                            loop = asyncio.get_event_loop()
-                            if loop.is_running():
-                                asyncio.create_task(progress_callback(progress))
-                        except Exception:
-                            pass
+        max_seconds: Optional[float] = None,
+        max_resolution: Optional[int] = None,
+    ) -> dict:
+        """Build yt-dlp options for probing and downloading a video."""
+        max_bytes = self.MAX_FILE_SIZE_BYTES
+        height = max_resolution or self.MAX_RESOLUTION
+
+        reported = {"progress": None, "at": float("-inf")}
+
+        def progress_hook(d):
+            if d["status"] != "downloading":
+                return
+
+            total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
+            downloaded = d.get("downloaded_bytes") or 0
+
+            # Abort mid-stream as soon as the limit is known to be exceeded,
+            # rather than discovering it after the whole file is on disk.
+            # Ranged downloads report totals for the full stream, so only
+            # the bytes actually fetched count against them.
+            if downloaded > max_bytes or (not max_seconds and total > max_bytes):
+                raise _SizeLimitExceeded()
+
+            if progress_callback and total > 0:
+                progress = int((downloaded / total) * 100)
+                # yt-dlp calls this many times a second; each report is a DB
+                # write, so only report new percentages, at a bounded rate
+                now = time.monotonic()
+                if progress == reported["progress"] or (
+                    progress < 100
+                    and now - reported["at"] < self.PROGRESS_MIN_INTERVAL_SECONDS
+                ):
+                    return
+                reported.update(progress=progress, at=now)
+                # Hook runs in the executor thread; hand off to the event loop
+                asyncio.run_coroutine_threadsafe(progress_callback(progress), loop)
 
         ydl_opts = {
-            "format": f"best[height<={self.MAX_RESOLUTION}][ext=mp4]/best[height<={self.MAX_RESOLUTION}]/best[ext=mp4]/best",
-            "outtmpl": output_path,
+            "format": f"best[height<={height}][ext=mp4]/best[height<={height}]/best[ext=mp4]/best",
+            "outtmpl": os.path.join(self.temp_dir, "%(id)s.%(ext)s"),
             "quiet": True,
             "no_warnings": True,
             "socket_timeout": 30,
             "retries": 3,
-            "progress_hooks": [progress_hook] if progress_hook else [],
-            "postprocessors": [{
-                "key": "FFmpegVideoConvertor",
-                "preferedformat": "mp4",
-            }],
+            "progress_hooks": [progress_hook],
         }
 
-        def _download():
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+        if max_seconds:
+            # Fetch only the leading time range instead of the whole stream
+            ydl_opts["download_ranges"] = yt_dlp.utils.download_range_func(
+                None, [(0, max_seconds)]
+            )
+            ydl_opts["force_keyframes_at_cuts"] = False
+
+        return ydl_opts
+
+    @staticmethod
+    def _download_with_info(ydl: yt_dlp.YoutubeDL, info: dict) -> Optional[str]:
+        """Download from an already-extracted info dict and return the file path."""
+        result = ydl.process_ie_result(info, download=True)
+        downloads = (result or {}).get("requested_downloads") or []
+        if downloads and downloads[0].get("filepath"):
+            return downloads[0]["filepath"]
+        return ydl.prepare_filename(result) if result else None
+
+    async def _ensure_decodable(self, path: str) -> str:
+        """
+        Return a path OpenCV can decode, remuxing only if strictly needed.
+
+        The remux is a stream copy into an mp4 container; nothing is
+        re-encoded.
+        """
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, self._can_decode, path):
+            return path
+
+        remuxed_path = f"{os.path.splitext(path)[0]}.remux.mp4"
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-v", "error", "-i", path,
+            "-map", "0:v:0", "-map", "0:a?", "-c", "copy", remuxed_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0 or not os.path.exists(remuxed_path):
+            logger.error(f"Remux failed for {path}: {stderr.decode(errors='ignore')}")
+            self.cleanup(remuxed_path)
+            raise DownloadError(
+                code="DOWNLOAD_FAILED",
+                message="Failed to download. Please try again",
+            )
+
+        self.cleanup(path)
+        logger.info(f"Remuxed {path} to mp4 (stream copy)")
+        return remuxed_path
+
+    @staticmethod
+    def _can_decode(path: str) -> bool:
+        """Check whether OpenCV can open the file and decode a frame."""
+        cap = cv2.VideoCapture(path)
+        try:
+            return cap.isOpened() and cap.read()[0]
+        finally:
+            cap.release()
+
+    @staticmethod
+    def _probe_error(error: Exception) -> DownloadError:
+        """Classify a yt-dlp extraction error as definitive or retryable."""
+        text = str(error).lower()
+        if any(marker in text for marker in UNAVAILABLE_ERROR_MARKERS):
+            return DownloadError(
+                code="VIDEO_UNAVAILABLE",
+                message="This video is unavailable or private",
+            )
+        logger.warning(f"Video probe failed: {error}")
+        return DownloadError(
+            code="VIDEO_PROBE_FAILED",
+            message="Could not reach the video. Please try again",
+            retryable=True,
+        )
+
+    def _file_too_large(self) -> DownloadError:
+        """Build the error raised when a download exceeds the size limit."""
+        return DownloadError(
+            code="FILE_TOO_LARGE",
+            message=f"Video file exceeds {self.MAX_FILE_SIZE_BYTES // (1024*1024)}MB limit",
+        )
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _download)
+    def _cleanup_partial(self, video_id: str) -> None:
+        """Remove (possibly partial) download files after an abort."""
+        for path in glob.glob(os.path.join(glob.escape(self.temp_dir), f"{video_id}.*")):
+            self.cleanup(path)
 
     def cleanup(self, file_path: str) -> None:
         """Remove a downloaded video file."""
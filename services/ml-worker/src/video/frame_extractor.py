@@ -42,6 +42,10 @@ class FrameExtractor:
         video_path: str,
         max_frames: Optional[int] = None,
         progress_callback: Optional[callable] = None,
+        frames_per_second: Optional[float] = None,
+        max_dimension: Optional[int] = None,
+        start_seconds: float = 0.0,
+        end_seconds: Optional[float] = None,
     ) -> List[ExtractedFrame]:
         """
         Extract frames from a video file.
@@ -50,6 +54,10 @@ class FrameExtractor:
             video_path: Path to the video file.
             max_frames: Maximum number of frames to extract.
             progress_callback: Optional callback for progress updates.
+            frames_per_second: Override the sampling rate for this call.
+            max_dimension: Downscale frames to fit this size as they are decoded.
+            start_seconds: Seek to this position before extracting.
+            end_seconds: Stop at this position. Defaults to the end of the video.
 
         Returns:
             List of ExtractedFrame objects.
@@ -67,6 +75,10 @@ class FrameExtractor:
             video_path,
             max_frames,
             progress_callback,
+            frames_per_second or self.frames_per_second,
+            max_dimension,
+            start_seconds,
+            end_seconds,
         )
 
     def _extract_sync(
@@ -74,6 +86,10 @@ class FrameExtractor:
         video_path: str,
         max_frames: int,
         progress_callback: Optional[callable],
+        frames_per_second: float,
+        max_dimension: Optional[int],
+        start_seconds: float = 0.0,
+        end_seconds: Optional[float] = None,
     ) -> List[ExtractedFrame]:
         """Synchronous frame extraction."""
         if not os.path.exists(video_path):
@@ -95,23 +111,31 @@ class FrameExtractor:
 
             # Calculate frame interval
             # Extract frames_per_second frames per second of video
-            frame_interval = int(video_fps / self.frames_per_second)
+            frame_interval = int(video_fps / frames_per_second)
             if frame_interval < 1:
                 frame_interval = 1
 
+            # Restrict to the requested time range (containers may not report
+            # a frame count, so duration can't bound the loop by itself)
+            if end_seconds is None:
+                end_seconds = float("inf")
+            frame_number = 0
+            if start_seconds > 0:
+                cap.set(cv2.CAP_PROP_POS_MSEC, start_seconds * 1000)
+                frame_number = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+
             # Calculate total frames to extract
             frames_to_extract = min(
-                int(duration * self.frames_per_second),
+                int((min(duration, end_seconds) - start_seconds) * frames_per_second),
                 max_frames,
             )
 
             frames: List[ExtractedFrame] = []
-            frame_number = 0
             extracted_count = 0
 
             while True:
                 ret, frame = cap.read()
-                if not ret:
+                if not ret or frame_number / video_fps >= end_seconds:
                     break
 
                 # Check if we should extract this frame
@@ -122,7 +146,7 @@ class FrameExtractor:
                         ExtractedFrame(
                             timestamp=timestamp,
                             frame_number=frame_number,
-                            image=frame.copy(),
+                            image=self._scale_image(frame, max_dimension),
                         )
                     )
                     extracted_count += 1
@@ -171,6 +195,20 @@ class FrameExtractor:
         """Convert a frame from BGR to RGB format."""
         return cv2.cvtColor(frame.image, cv2.COLOR_BGR2RGB)
 
+    @staticmethod
+    def _scale_image(image: np.ndarray, max_dimension: Optional[int]) -> np.ndarray:
+        """Downscale a decoded frame to fit max_dimension, copying it either way."""
+        height, width = image.shape[:2]
+        if not max_dimension or max(height, width) <= max_dimension:
+            return image.copy()
+
+        scale = max_dimension / max(height, width)
+        return cv2.resize(
+            image,
+            (int(width * scale), int(height * scale)),
+            interpolation=cv2.INTER_AREA,
+        )
+
     def frame_to_bytes(
         self,
         frame: ExtractedFrame,
@@ -0,0 +1,188 @@
+"""Columnar per-frame analysis results."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Frames are persisted in fixed time windows so range queries only read the
+# rows they need
+FRAME_WINDOW_SECONDS = 60.0
+
+
+@dataclass
+class SuspiciousSegment:
+    """A segment of video with high AI probability."""
+
+    start: float
+    end: float
+    avg_ai_probability: float
+
+
+class FrameResults:
+    """
+    Per-frame AI probabilities stored as parallel float32 arrays.
+
+    Frames are appended in timestamp order into preallocated buffers;
+    aggregation and segment finding run vectorized over the filled prefix.
+    """
+
+    def __init__(self, capacity: int = 0):
+        """
+        Initialize an empty result set.
+
+        Args:
+            capacity: Expected number of frames, to avoid regrowing buffers.
+        """
+        self._timestamps = np.empty(max(capacity, 1), dtype=np.float32)
+        self._probabilities = np.empty(max(capacity, 1), dtype=np.float32)
+        self._size = 0
+
+    @classmethod
+    def from_arrays(
+        cls, timestamps: Iterable[float], ai_probabilities: Iterable[float]
+    ) -> "FrameResults":
+        """Build a result set from existing timestamp/probability sequences."""
+        timestamps = np.asarray(list(timestamps), dtype=np.float32)
+        ai_probabilities = np.asarray(list(ai_probabilities), dtype=np.float32)
+        results = cls(capacity=len(timestamps))
+        results._timestamps[: len(timestamps)] = timestamps
+        results._probabilities[: len(timestamps)] = ai_probabilities
+        results._size = len(timestamps)
+        return results
+
+    @classmethod
+    def from_windows(cls, rows: Iterable[Any]) -> "FrameResults":
+        """Rebuild a result set from stored window rows (see windows())."""
+        timestamps: List[float] = []
+        probabilities: List[float] = []
+        for row in rows:
+            timestamps.extend(row["timestamps"])
+            probabilities.extend(row["ai_probabilities"])
+        return cls.from_arrays(timestamps, probabilities)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[: self._size]
+
+    @property
+    def ai_probabilities(self) -> np.ndarray:
+        return self._probabilities[: self._size]
+
+    def append(self, timestamp: float, ai_probability: float) -> None:
+        """Add a frame result, growing the buffers if needed."""
+        if self._size == len(self._timestamps):
+            self._timestamps = np.resize(self._timestamps, self._size * 2)
+            self._probabilities = np.resize(self._probabilities, self._size * 2)
+        self._timestamps[self._size] = timestamp
+        self._probabilities[self._size] = ai_probability
+        self._size += 1
+
+    def extend(self, other: "FrameResults") -> None:
+        """Append another result set whose frames all follow this one's."""
+        needed = self._size + len(other)
+        if needed > len(self._timestamps):
+            capacity = max(needed, len(self._timestamps) * 2)
+            self._timestamps = np.resize(self._timestamps, capacity)
+            self._probabilities = np.resize(self._probabilities, capacity)
+        self._timestamps[self._size : needed] = other.timestamps
+        self._probabilities[self._size : needed] = other.ai_probabilities
+        self._size = needed
+
+    def mean_probability(self) -> float:
+        """Average AI probability, or 0.0 when empty."""
+        return float(self.ai_probabilities.mean(dtype=np.float64)) if self._size else 0.0
+
+    def max_probability(self) -> float:
+        """Maximum AI probability, or 0.0 when empty."""
+        return float(self.ai_probabilities.max()) if self._size else 0.0
+
+    def count_at_or_above(self, threshold: float) -> int:
+        """Number of frames with AI probability >= threshold."""
+        return int(np.count_nonzero(self.ai_probabilities >= threshold))
+
+    def find_segments(self, threshold: float, max_gap: float) -> List[SuspiciousSegment]:
+        """
+        Find runs of consecutive frames at or above threshold.
+
+        A run ends at the first frame below threshold, or when the time gap
+        between two consecutive suspicious frames exceeds max_gap.
+        """
+        timestamps = self.timestamps
+        probabilities = self.ai_probabilities
+
+        indices = np.flatnonzero(probabilities >= threshold)
+        if indices.size == 0:
+            return []
+
+        breaks = (np.diff(indices) != 1) | (np.diff(timestamps[indices]) > max_gap)
+        starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+        ends = np.concatenate((np.flatnonzero(breaks), [indices.size - 1]))
+
+        suspicious = probabilities[indices].astype(np.float64)
+        sums = np.add.reduceat(suspicious, starts)
+        counts = ends - starts + 1
+
+        return [
+            SuspiciousSegment(
+                start=float(timestamps[indices[s]]),
+                end=float(timestamps[indices[e]]),
+                avg_ai_probability=float(total / count),
+            )
+            for s, e, total, count in zip(starts, ends, sums, counts)
+        ]
+
+    def slice_time(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> "FrameResults":
+        """Return the frames with start <= timestamp <= end."""
+        timestamps = self.timestamps
+        lo = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+        hi = self._size if end is None else int(np.searchsorted(timestamps, end, side="right"))
+        return FrameResults.from_arrays(timestamps[lo:hi], self.ai_probabilities[lo:hi])
+
+    def windows(
+        self, window_seconds: float = FRAME_WINDOW_SECONDS
+    ) -> Iterator[Tuple[int, float, float, List[float], List[float]]]:
+        """
+        Split frames into fixed time windows for storage.
+
+        Yields:
+            (window_index, start_ts, end_ts, timestamps, ai_probabilities)
+            tuples matching the analysis_frame_results columns.
+        """
+        if not self._size:
+            return
+
+        timestamps = self.timestamps
+        probabilities = self.ai_probabilities
+        window_ids = (timestamps // window_seconds).astype(np.int64)
+        boundaries = np.flatnonzero(np.diff(window_ids)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [self._size]))
+
+        for s, e in zip(starts, ends):
+            yield (
+                int(window_ids[s]),
+                float(timestamps[s]),
+                float(timestamps[e - 1]),
+                timestamps[s:e].tolist(),
+                probabilities[s:e].tolist(),
+            )
+
+    def to_dicts(self) -> List[Dict[str, float]]:
+        """Per-frame dicts in the legacy video_analysis.frame_results shape."""
+        return [
+            {"timestamp": round(t, 3), "ai_probability": round(p, 3)}
+            for t, p in zip(self.timestamps.tolist(), self.ai_probabilities.tolist())
+        ]
+
+    def to_columns(self) -> Dict[str, List[float]]:
+        """Parallel timestamp/probability lists, rounded for API responses."""
+        return {
+            "timestamps": np.round(self.timestamps.astype(np.float64), 3).tolist(),
+            "ai_probabilities": np.round(self.ai_probabilities.astype(np.float64), 3).tolist(),
+        }
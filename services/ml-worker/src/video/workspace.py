@@ -0,0 +1,273 @@
+"""Per-job scratch workspaces with a host-wide byte quota."""
+
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import shutil
+import socket
+import tempfile
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional, Set
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+
+class WorkspaceQuotaExceeded(Exception):
+    """Raised when scratch space cannot be reserved in time."""
+
+    def __init__(self, code: str, message: str):
+        self.code = code
+        self.message = message
+        super().__init__(message)
+
+
+@dataclass
+class Workspace:
+    """A reserved scratch directory owned by a single job."""
+
+    name: str
+    path: str
+    reserved_bytes: int
+
+
+class WorkspaceManager:
+    """
+    Allocates per-job scratch directories under a shared root.
+
+    The root should live on tmpfs or another fast local path. Every
+    workspace holds a reservation (a small marker file recording its size
+    and owning instance) and admission sums the reservations under an
+    exclusive flock, so the quota holds across all worker processes on the
+    host.
+
+    Each process registers an instance file under the root and holds a
+    shared flock on it until it exits. PIDs are reused across restarts and
+    differ between PID namespaces sharing a volume, so liveness is decided
+    by that lock instead: a reservation whose instance file is missing or
+    unlocked belongs to a dead process. Such reservations are reclaimed on
+    startup and whenever admission is short of space.
+    """
+
+    POLL_INTERVAL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        quota_bytes: int = 2 * 1024 * 1024 * 1024,
+        wait_seconds: float = 60,
+    ):
+        """
+        Initialize the workspace manager.
+
+        Args:
+            root: Scratch directory. Defaults to a directory under system temp.
+            quota_bytes: Total bytes all workspaces under root may reserve.
+            wait_seconds: How long acquire() waits for space before rejecting.
+        """
+        self.root = root or os.path.join(tempfile.gettempdir(), "forensivision-scratch")
+        self.quota_bytes = quota_bytes
+        self.wait_seconds = wait_seconds
+        self.reservations_dir = os.path.join(self.root, ".reservations")
+        self.instances_dir = os.path.join(self.root, ".instances")
+        self.lock_path = os.path.join(self.root, ".lock")
+
+        # Registered lazily so a forked child gets an instance of its own
+        self._instance_id: Optional[str] = None
+        self._instance_pid: Optional[int] = None
+        self._instance_file = None
+
+        os.makedirs(self.reservations_dir, exist_ok=True)
+        os.makedirs(self.instances_dir, exist_ok=True)
+
+    @asynccontextmanager
+    async def workspace(
+        self, reserve_bytes: int, prefix: str = "job"
+    ) -> AsyncIterator[Workspace]:
+        """
+        Reserve a workspace for the duration of a block, then remove it.
+
+        Args:
+            reserve_bytes: Upper bound on what the job will write.
+            prefix: Directory name prefix, for debugging.
+
+        Raises:
+            WorkspaceQuotaExceeded: If space isn't available within wait_seconds.
+        """
+        workspace = await self.acquire(reserve_bytes, prefix)
+        try:
+            yield workspace
+        finally:
+            await self.release(workspace)
+
+    async def acquire(self, reserve_bytes: int, prefix: str = "job") -> Workspace:
+        """
+        Reserve a workspace, waiting for other jobs to free space if needed.
+
+        Raises:
+            WorkspaceQuotaExceeded: If space isn't available within wait_seconds.
+        """
+        if reserve_bytes > self.quota_bytes:
+            raise WorkspaceQuotaExceeded(
+                code="FILE_TOO_LARGE",
+                message="This video is too large to process",
+            )
+
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + self.wait_seconds
+        name = f"{prefix}-{uuid4().hex}"
+
+        while True:
+            workspace = await loop.run_in_executor(None, self._try_reserve, name, reserve_bytes)
+            if workspace is not None:
+                return workspace
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    f"Scratch quota exhausted: could not reserve {reserve_bytes} bytes "
+                    f"under {self.root} within {self.wait_seconds}s"
+                )
+                raise WorkspaceQuotaExceeded(
+                    code="SERVER_BUSY",
+                    message="Video processing is at capacity. Please try again shortly",
+                )
+            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+
+    async def release(self, workspace: Workspace) -> None:
+        """Remove a workspace directory and drop its reservation."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._remove, workspace.name)
+
+    def reclaim_orphans(self) -> int:
+        """
+        Remove workspaces whose owning process is gone.
+
+        Call on startup; a crashed worker otherwise leaks its reservation
+        and scratch files until the host restarts.
+
+        Returns:
+            Number of workspaces reclaimed.
+        """
+        with self._exclusive_lock():
+            reclaimed = self._reclaim_orphans_locked()
+        if reclaimed:
+            logger.info(f"Reclaimed {reclaimed} orphaned scratch workspace(s) under {self.root}")
+        return reclaimed
+
+    def reserved_bytes(self) -> int:
+        """Total bytes currently reserved by live workspaces."""
+        with self._exclusive_lock():
+            return sum(r["bytes"] for r in self._read_reservations().values())
+
+    def _try_reserve(self, name: str, reserve_bytes: int) -> Optional[Workspace]:
+        with self._exclusive_lock():
+            reservations = self._read_reservations()
+            in_use = sum(r["bytes"] for r in reservations.values())
+
+            if in_use + reserve_bytes > self.quota_bytes:
+                # Space held by crashed processes shouldn't block admission
+                if not self._reclaim_orphans_locked(reservations):
+                    return None
+                in_use = sum(r["bytes"] for r in self._read_reservations().values())
+                if in_use + reserve_bytes > self.quota_bytes:
+                    return None
+
+            path = os.path.join(self.root, name)
+            os.makedirs(path)
+            with open(self._reservation_path(name), "w") as f:
+                json.dump(
+                    {
+                        "instance": self._register_instance(),
+                        "pid": os.getpid(),
+                        "bytes": reserve_bytes,
+                    },
+                    f,
+                )
+
+        logger.debug(f"Reserved {reserve_bytes} bytes of scratch space for {name}")
+        return Workspace(name=name, path=path, reserved_bytes=reserve_bytes)
+
+    def _reclaim_orphans_locked(
+        self, reservations: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> int:
+        """Reclaim dead workspaces; the caller must hold the lock."""
+        if reservations is None:
+            reservations = self._read_reservations()
+
+        live = self._live_instances_locked()
+        reclaimed = 0
+        for name, reservation in reservations.items():
+            if reservation.get("instance") not in live:
+                self._remove(name)
+                reclaimed += 1
+
+        # Directories with no reservation were never fully created or lost it
+        for entry in os.scandir(self.root):
+            if entry.name.startswith(".") or entry.name in reservations:
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry.path, ignore_errors=True)
+                reclaimed += 1
+
+        return reclaimed
+
+    def _register_instance(self) -> str:
+        """Return this process's instance ID, registering it on first use."""
+        if self._instance_pid != os.getpid():
+            instance_id = f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:12]}"
+            instance_file = open(os.path.join(self.instances_dir, instance_id), "w")
+            fcntl.flock(instance_file, fcntl.LOCK_SH)
+            # Kept open (and locked) for the life of the process
+            self._instance_file = instance_file
+            self._instance_id = instance_id
+            self._instance_pid = os.getpid()
+        return self._instance_id
+
+    def _live_instances_locked(self) -> Set[str]:
+        """Find instances whose process still holds its lock, removing the rest."""
+        live = set()
+        for entry in os.scandir(self.instances_dir):
+            try:
+                with open(entry.path, "r") as instance_file:
+                    try:
+                        fcntl.flock(instance_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        live.add(entry.name)
+                        continue
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+        return live
+
+    def _read_reservations(self) -> Dict[str, Dict[str, Any]]:
+        reservations = {}
+        for entry in os.scandir(self.reservations_dir):
+            try:
+                with open(entry.path) as f:
+                    reservations[entry.name] = json.load(f)
+            except (FileNotFoundError, ValueError):
+                continue
+        return reservations
+
+    def _remove(self, name: str) -> None:
+        shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+        try:
+            os.remove(self._reservation_path(name))
+        except FileNotFoundError:
+            pass
+
+    def _reservation_path(self, name: str) -> str:
+        return os.path.join(self.reservations_dir, name)
+
+    @contextmanager
+    def _exclusive_lock(self):
+        """Hold an exclusive cross-process lock on the scratch root."""
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
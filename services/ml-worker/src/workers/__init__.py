@@ -1,5 +1,6 @@
 """Worker modules for processing different job types."""
 
+from src.workers.audio_worker import AudioWorker
 from src.workers.video_worker import VideoWorker
 
-__all__ = ["VideoWorker"]
+__all__ = ["AudioWorker", "VideoWorker"]
@@ -0,0 +1,190 @@
+"""Audio analysis worker for uploaded audio files."""
+
+import json
+import logging
+import os
+from typing import Optional
+
+from aio_pika import IncomingMessage
+
+from src import queries
+from src.audio.analyzer import AudioAnalyzer
+from src.audio.decoder import AudioDecodeError
+from src.config import settings
+from src.database import Database
+from src.status_store import StatusStore
+from src.storage import S3Storage
+from src.video.workspace import Workspace, WorkspaceManager, WorkspaceQuotaExceeded
+
+logger = logging.getLogger(__name__)
+
+
+class AudioWorker:
+    """Worker for processing audio analysis jobs from the queue."""
+
+    def __init__(
+        self,
+        db: Database,
+        storage: S3Storage,
+        workspaces: WorkspaceManager,
+        audio_analyzer: Optional[AudioAnalyzer] = None,
+        status_store: Optional[StatusStore] = None,
+    ):
+        """
+        Initialize the audio worker.
+
+        Args:
+            db: Database connection.
+            storage: S3 client for fetching uploads.
+            workspaces: Scratch space manager for downloaded files.
+            audio_analyzer: Chunked audio analyzer. Defaults to a new one.
+            status_store: Publishes status updates to the API's read model.
+        """
+        self.db = db
+        self.status_store = status_store or StatusStore()
+        self.storage = storage
+        self.workspaces = workspaces
+        self.audio_analyzer = audio_analyzer or AudioAnalyzer()
+
+    async def process_job(self, message: IncomingMessage) -> None:
+        """
+        Process an audio analysis job.
+
+        The upload is streamed to a scratch workspace and its audio track is
+        decoded and scored chunk by chunk, so memory use doesn't grow with
+        the file's duration.
+
+        Args:
+            message: The incoming RabbitMQ message.
+        """
+        async with message.process():
+            workspace: Optional[Workspace] = None
+
+            try:
+                job = json.loads(message.body.decode())
+                analysis_id = job["analysis_id"]
+                file_key = job["file_key"]
+
+                logger.info(f"Processing audio analysis job: {analysis_id}")
+
+                # Update status to downloading
+                await self._update_status(analysis_id, "processing", 5, "downloading")
+
+                workspace = await self.workspaces.acquire(
+                    settings.audio_max_file_bytes, prefix="audio"
+                )
+                path = os.path.join(workspace.path, os.path.basename(file_key) or "audio")
+                await self.storage.download_file(settings.s3_bucket_uploads, file_key, path)
+                if os.path.getsize(path) > settings.audio_max_file_bytes:
+                    raise AudioDecodeError(
+                        code="FILE_TOO_LARGE",
+                        message="This audio file is too large to process",
+                    )
+
+                # Analyze the audio track
+                await self._update_status(analysis_id, "processing", 20, "analyzing")
+                audio_analysis = await self.audio_analyzer.analyze(path)
+                if audio_analysis is None:
+                    raise AudioDecodeError(
+                        code="NO_AUDIO",
+                        message="The file has no audio track",
+                    )
+
+                # Store results
+                await self._update_status(analysis_id, "processing", 90, "storing_results")
+                await self._store_result(analysis_id, audio_analysis)
+
+                # Mark as completed
+                await self._update_status(analysis_id, "completed", 100, None)
+                logger.info(f"Completed audio analysis: {analysis_id}")
+
+            except (AudioDecodeError, WorkspaceQuotaExceeded) as e:
+                logger.error(f"Audio error for job: {e.code} - {e.message}")
+                await self._update_status(
+                    job.get("analysis_id"),
+                    "failed",
+                    0,
+                    None,
+                    error_code=e.code,
+                    error_message=e.message,
+                )
+            except Exception as e:
+                logger.error(f"Failed to process audio job: {e}", exc_info=True)
+                try:
+                    await self._update_status(
+                        job.get("analysis_id"),
+                        "failed",
+                        0,
+                        None,
+                        error_code="PROCESSING_ERROR",
+                        error_message=str(e),
+                    )
+                except Exception:
+                    pass
+            finally:
+                if workspace:
+                    await self.workspaces.release(workspace)
+
+    async def _store_result(self, analysis_id: str, audio_analysis: dict) -> None:
+        """Store the audio analysis result."""
+        verdict, confidence, risk_level = self.audio_analyzer.determine_verdict(audio_analysis)
+        segments = audio_analysis["suspicious_segments"]
+
+        summary = (
+            f"Analyzed {audio_analysis['windows_analyzed']} audio windows over "
+            f"{audio_analysis['duration_seconds']:.0f} seconds."
+        )
+        if segments:
+            summary += f" Found {len(segments)} segment(s) with elevated synthetic speech probability."
+
+        detections = [
+            {
+                "model": "audio_spectral_analyzer",
+                "verdict": verdict,
+                "confidence": confidence,
+                "details": {
+                    "windows_analyzed": audio_analysis["windows_analyzed"],
+                    "suspicious_segments": len(segments),
+                },
+            }
+        ]
+
+        await self.db.execute(
+            """
+            INSERT INTO analysis_results (
+                id, analysis_id, verdict, confidence, risk_level, summary,
+                detections, ensemble_score, audio_analysis, created_at
+            ) VALUES (
+                gen_random_uuid(), $1, $2, $3, $4, $5, $6, $7, $8, NOW()
+            )
+            """,
+            analysis_id,
+            verdict,
+            confidence,
+            risk_level,
+            summary,
+            json.dumps(detections),
+            confidence,
+            json.dumps(audio_analysis),
+        )
+
+    async def _update_status(
+        self,
+        analysis_id: str,
+        status: str,
+        progress: int,
+        stage: Optional[str],
+        error_code: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """Update analysis status in database."""
+        row = await self.db.fetchrow(
+            queries.UPDATE_ANALYSIS_STATUS,
+            analysis_id,
+            status,
+            progress,
+            stage,
+            error_code,
+            error_message,
+        )
+        await self.status_store.publish(row)
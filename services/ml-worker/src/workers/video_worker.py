@@ -3,20 +3,29 @@
 import asyncio
 import json
 import logging
+import math
 import os
-import shutil
-import tempfile
-from dataclasses import dataclass
-from typing import List, Optional
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
 
 import aio_pika
 from aio_pika import IncomingMessage
 
+from src import queries
+from src.audio.analyzer import AudioAnalyzer
 from src.config import settings
 from src.database import Database
 from src.detectors.image_detector import ImageDetector
+from src.media_cache import MediaCache
+from src.status_store import StatusStore
 from src.video.downloader import VideoDownloader, DownloadError, VideoInfo
+from src.video.face_tracker import FaceObservation, FaceTracker, FaceTrackResults
 from src.video.frame_extractor import FrameExtractor, ExtractedFrame
+from src.video.frame_results import FRAME_WINDOW_SECONDS, FrameResults, SuspiciousSegment
+from src.video.profiles import QualityProfile, get_profile
+from src.video.workspace import Workspace, WorkspaceManager, WorkspaceQuotaExceeded
 
 logger = logging.getLogger(__name__)
 
@@ -25,29 +34,27 @@ DEMO_MAX_DURATION = 20  # seconds
 DEMO_MAX_FRAMES = 20  # 1 fps for 20 seconds max
 
 
-@dataclass
-class FrameAnalysisResult:
-    """Result of analyzing a single frame."""
+class DemoVideoDownloader(VideoDownloader):
+    """Video downloader with demo-specific constraints."""
 
-    timestamp: float
-    ai_probability: float
-    verdict: str
-    confidence: float
+    MAX_DURATION_SECONDS = DEMO_MAX_DURATION
 
 
-@dataclass
-class SuspiciousSegment:
-    """A segment of video with high AI probability."""
+class LongVideoDownloader(VideoDownloader):
+    """Video downloader for checkpointed long-video jobs."""
 
-    start: float
-    end: float
-    avg_ai_probability: float
+    MAX_DURATION_SECONDS = settings.long_video_max_duration_seconds
+    MAX_FILE_SIZE_BYTES = settings.long_video_max_file_bytes
 
 
-class DemoVideoDownloader(VideoDownloader):
-    """Video downloader with demo-specific constraints."""
+@dataclass
+class LongVideoCheckpoint:
+    """Progress of a long-video job restored from analysis_checkpoints."""
 
-    MAX_DURATION_SECONDS = DEMO_MAX_DURATION
+    segments_completed: int
+    frame_results: FrameResults
+    face_results: FaceTrackResults
+    next_track_id: int = 1
 
 
 class VideoWorker:
@@ -56,11 +63,19 @@ class VideoWorker:
     # Thresholds
     SUSPICIOUS_THRESHOLD = 0.65  # AI probability threshold for suspicious frames
     SEGMENT_GAP_THRESHOLD = 3.0  # Max gap in seconds to merge suspicious frames
+    FACE_MARGIN = 0.2  # Context kept around each face crop, as a fraction of its size
+    CHUNK_TRACK_ID_STRIDE = 10000  # Face track IDs reserved per chunk of a sharded job
 
     def __init__(
         self,
         db: Database,
         image_detector: ImageDetector,
+        media_cache: Optional[MediaCache] = None,
+        workspaces: Optional[WorkspaceManager] = None,
+        long_workspaces: Optional[WorkspaceManager] = None,
+        channel: Optional[aio_pika.Channel] = None,
+        audio_analyzer: Optional[AudioAnalyzer] = None,
+        status_store: Optional[StatusStore] = None,
     ):
         """
         Initialize the video worker.
@@ -68,9 +83,33 @@ class VideoWorker:
         Args:
             db: Database connection.
             image_detector: Detector for analyzing frames.
+            media_cache: Optional worker-local cache for downloaded videos.
+            workspaces: Scratch space manager. Defaults to one built from settings.
+            long_workspaces: Disk-backed scratch space for long-video jobs.
+                Defaults to one built from settings.
+            channel: RabbitMQ channel for publishing chunk sub-jobs. Without
+                one, jobs always run whole on this worker.
+            audio_analyzer: Scores the audio track alongside frame analysis.
+                Defaults to a new AudioAnalyzer.
+            status_store: Publishes status updates to the API's read model.
+                Without a connected one, updates only reach Postgres.
         """
         self.db = db
+        self.status_store = status_store or StatusStore()
+        self.channel = channel
+        self.audio_analyzer = audio_analyzer or AudioAnalyzer()
         self.image_detector = image_detector
+        self.media_cache = media_cache
+        self.workspaces = workspaces or WorkspaceManager(
+            root=settings.scratch_dir,
+            quota_bytes=settings.scratch_quota_bytes,
+            wait_seconds=settings.scratch_wait_seconds,
+        )
+        self.long_workspaces = long_workspaces or WorkspaceManager(
+            root=settings.long_video_scratch_dir,
+            quota_bytes=settings.long_video_scratch_quota_bytes,
+            wait_seconds=settings.scratch_wait_seconds,
+        )
         self.downloader = VideoDownloader()
         self.demo_downloader = DemoVideoDownloader()
         self.frame_extractor = FrameExtractor(frames_per_second=1)
@@ -83,45 +122,110 @@ class VideoWorker:
             message: The incoming RabbitMQ message.
         """
         async with message.process():
-            video_path: Optional[str] = None
+            workspace: Optional[Workspace] = None
+            audio_task: Optional[asyncio.Task] = None
 
             try:
                 job = json.loads(message.body.decode())
                 analysis_id = job["analysis_id"]
                 file_key = job["file_key"]  # YouTube URL
                 options = job.get("options", {})
+                profile = get_profile(options.get("quality"))
 
-                logger.info(f"Processing video analysis job: {analysis_id}")
+                logger.info(
+                    f"Processing video analysis job: {analysis_id} (quality={profile.name})"
+                )
+
+                # A redelivered message means a worker died mid-job
+                if message.redelivered:
+                    retries = await self._increment_retry_count(analysis_id)
+                    if retries > settings.video_max_retries:
+                        logger.error(
+                            f"Giving up on {analysis_id} after {settings.video_max_retries} retries"
+                        )
+                        await self._update_status(
+                            analysis_id,
+                            "failed",
+                            0,
+                            None,
+                            error_code="RETRIES_EXHAUSTED",
+                            error_message="Video processing failed repeatedly",
+                        )
+                        return
+
+                if options.get("long_video"):
+                    await self._process_long_video(analysis_id, file_key, options, profile)
+                    logger.info(f"Completed long video analysis: {analysis_id}")
+                    return
 
                 # Update status to downloading
                 await self._update_status(analysis_id, "processing", 5, "downloading")
 
-                # Download video
-                video_info = await self._download_video(analysis_id, file_key)
+                # Reserve scratch space, waiting for other jobs if needed
+                # Set by the API for triage jobs, which only look at the opening
+                max_seconds = options.get("max_seconds")
+                workspace = await self.workspaces.acquire(
+                    self.downloader.estimate_download_bytes(max_seconds, profile.max_resolution),
+                    prefix="video",
+                )
+
+                # Download video (only the leading range for triage jobs)
+                video_info = await self._download_video(
+                    analysis_id, file_key, workspace, max_seconds, profile.max_resolution
+                )
                 video_path = video_info.file_path
 
                 # Update file info in database
                 await self._update_file_info(analysis_id, video_info)
 
+                # Long enough videos are split across the worker fleet; the
+                # download stays in the media cache for chunks on this host,
+                # and this worker scores the audio track while chunks run
+                if self._should_shard(video_info, options):
+                    audio_task = self._start_audio_analysis(video_info, options)
+                    audio_pending = await self._fan_out(
+                        analysis_id,
+                        file_key,
+                        options,
+                        profile,
+                        video_info,
+                        score_audio=audio_task is not None,
+                    )
+                    if audio_pending:
+                        audio_analysis = await self._finish_audio_analysis(analysis_id, audio_task)
+                        await self._complete_fan_out_audio(analysis_id, profile, audio_analysis)
+                    return
+
+                # Score the audio track while frames are extracted and analyzed
+                audio_task = self._start_audio_analysis(video_info, options)
+
                 # Extract frames
                 await self._update_status(analysis_id, "processing", 20, "extracting_frames")
-                frames = await self._extract_frames(analysis_id, video_path)
+                frames = await self._extract_frames(analysis_id, video_path, profile)
 
                 # Analyze frames
                 await self._update_status(analysis_id, "processing", 30, "analyzing")
-                frame_results = await self._analyze_frames(analysis_id, frames, options)
+                frame_results, face_results = await self._analyze_frames(
+                    analysis_id, frames, options, profile
+                )
+                audio_analysis = await self._finish_audio_analysis(analysis_id, audio_task)
 
                 # Aggregate results
                 await self._update_status(analysis_id, "processing", 90, "aggregating")
                 await self._aggregate_and_store_results(
-                    analysis_id, video_info, frame_results
+                    analysis_id,
+                    video_info,
+                    frame_results,
+                    face_results,
+                    profile,
+                    audio_analysis=audio_analysis,
                 )
 
                 # Mark as completed
                 await self._update_status(analysis_id, "completed", 100, None)
                 logger.info(f"Completed video analysis: {analysis_id}")
 
-            except DownloadError as e:
+            except (DownloadError, WorkspaceQuotaExceeded) as e:
                 logger.error(f"Download error for job: {e.code} - {e.message}")
                 await self._update_status(
                     job.get("analysis_id"),
@@ -145,9 +249,11 @@ class VideoWorker:
                 except Exception:
                     pass
             finally:
-                # Cleanup video file
-                if video_path:
-                    self.downloader.cleanup(video_path)
+                # Stop any audio decode still reading the file, then remove
+                # the downloaded video and release the reservation
+                await self._cancel_audio_analysis(audio_task)
+                if workspace:
+                    await self.workspaces.release(workspace)
 
     async def process_demo_job(self, message: IncomingMessage) -> None:
         """
@@ -162,49 +268,68 @@ class VideoWorker:
             message: The incoming RabbitMQ message.
         """
         async with message.process():
-            video_path: Optional[str] = None
-            temp_dir: Optional[str] = None
+            workspace: Optional[Workspace] = None
+            audio_task: Optional[asyncio.Task] = None
 
             try:
                 job = json.loads(message.body.decode())
                 analysis_id = job["analysis_id"]
                 file_key = job["file_key"]  # YouTube URL
                 options = job.get("options", {})
+                profile = get_profile(options.get("quality"))
 
                 logger.info(f"Processing demo video analysis job: {analysis_id}")
 
-                # Create isolated temp directory for demo
-                temp_dir = tempfile.mkdtemp(prefix="demo_video_")
+                # Reserve an isolated scratch workspace for the demo
+                workspace = await self.workspaces.acquire(
+                    self.demo_downloader.estimate_download_bytes(
+                        DEMO_MAX_DURATION, profile.max_resolution
+                    ),
+                    prefix="demo_video",
+                )
 
                 # Update status to downloading
                 await self._update_status(analysis_id, "processing", 5, "downloading")
 
                 # Download video with demo constraints (20s max)
-                video_info = await self._download_demo_video(analysis_id, file_key, temp_dir)
+                video_info = await self._download_demo_video(
+                    analysis_id, file_key, workspace, profile.max_resolution
+                )
                 video_path = video_info.file_path
 
                 # Update file info in database
                 await self._update_file_info(analysis_id, video_info)
 
+                # Score the audio track while frames are extracted and analyzed
+                audio_task = self._start_audio_analysis(video_info, options)
+
                 # Extract frames (1 fps, max 20 frames for demo)
                 await self._update_status(analysis_id, "processing", 20, "extracting")
-                frames = await self._extract_demo_frames(analysis_id, video_path)
+                frames = await self._extract_demo_frames(analysis_id, video_path, profile)
 
                 # Analyze frames
                 await self._update_status(analysis_id, "processing", 30, "analyzing")
-                frame_results = await self._analyze_frames(analysis_id, frames, options)
+                frame_results, face_results = await self._analyze_frames(
+                    analysis_id, frames, options, profile
+                )
+                audio_analysis = await self._finish_audio_analysis(analysis_id, audio_task)
 
                 # Aggregate results
                 await self._update_status(analysis_id, "processing", 90, "complete")
                 await self._aggregate_and_store_results(
-                    analysis_id, video_info, frame_results
+                    analysis_id,
+                    video_info,
+                    frame_results,
+                    face_results,
+                    profile,
+                    audio_analysis=audio_analysis,
                 )
 
                 # Mark as completed
                 await self._update_status(analysis_id, "completed", 100, None)
                 logger.info(f"Completed demo video analysis: {analysis_id}")
 
-            except DownloadError as e:
+            except (DownloadError, WorkspaceQuotaExceeded) as e:
                 logger.error(f"Demo download error for job: {e.code} - {e.message}")
                 await self._update_status(
                     job.get("analysis_id"),
@@ -228,20 +353,686 @@ class VideoWorker:
                 except Exception:
                     pass
             finally:
-                # Aggressive cleanup for demo - remove entire temp directory
-                if temp_dir and os.path.exists(temp_dir):
-                    try:
-                        shutil.rmtree(temp_dir)
-                        logger.info(f"Cleaned up demo temp directory: {temp_dir}")
-                    except Exception as e:
-                        logger.warning(f"Failed to cleanup demo temp dir {temp_dir}: {e}")
+                # Aggressive cleanup for demo - remove the entire workspace
+                await self._cancel_audio_analysis(audio_task)
+                if workspace:
+                    await self.workspaces.release(workspace)
+                    logger.info(f"Released demo workspace: {workspace.path}")
+
+    async def process_chunk_job(self, message: IncomingMessage) -> None:
+        """
+        Process one time-range chunk of a sharded video job.
+
+        Any worker may take any chunk. Results are committed together with
+        the chunk's completion and the join counter; the worker whose chunk
+        brings the counter to the total runs the final aggregation. Failed
+        chunks are re-published up to video_chunk_max_attempts times before
+        the whole analysis is failed.
+
+        Args:
+            message: The incoming RabbitMQ message.
+        """
+        async with message.process():
+            workspace: Optional[Workspace] = None
+
+            try:
+                job = json.loads(message.body.decode())
+                analysis_id = job["analysis_id"]
+                chunk_index = job["chunk_index"]
+                options = job.get("options", {})
+                profile = replace(get_profile(options.get("quality")), early_exit_min_frames=None)
+
+                attempts = await self._claim_chunk(analysis_id, chunk_index)
+                if attempts is None:
+                    # Finished by a speculative copy, or the analysis has failed
+                    logger.info(f"Skipping chunk {chunk_index} of {analysis_id}")
+                    return
+                if attempts > settings.video_chunk_max_attempts:
+                    await self._update_status(
+                        analysis_id,
+                        "failed",
+                        0,
+                        None,
+                        error_code="CHUNK_FAILED",
+                        error_message="Video processing failed repeatedly",
+                    )
+                    return
+
+                logger.info(
+                    f"Processing chunk {chunk_index} of {analysis_id} "
+                    f"({job['start_seconds']:.0f}-{job['end_seconds']:.0f}s, attempt {attempts})"
+                )
+
+                workspace = await self.workspaces.acquire(
+                    self.downloader.estimate_download_bytes(None, profile.max_resolution),
+                    prefix="video_chunk",
+                )
+                video_info = await self._fetch_video(
+                    VideoDownloader(workspace=workspace),
+                    job["file_key"],
+                    None,
+                    max_resolution=profile.max_resolution,
+                )
+                frames = await self.frame_extractor.extract(
+                    video_info.file_path,
+                    max_frames=job["max_frames"],
+                    frames_per_second=profile.frames_per_second,
+                    max_dimension=profile.decode_max_dimension,
+                    start_seconds=job["start_seconds"],
+                    end_seconds=job["end_seconds"],
+                )
+
+                # Chunks can't share a tracker, so each gets its own ID range
+                tracker = None
+                if options.get("face_roi", True):
+                    tracker = FaceTracker(
+                        first_track_id=chunk_index * self.CHUNK_TRACK_ID_STRIDE + 1
+                    )
+                chunk_results, face_results = await self._analyze_frames(
+                    analysis_id, frames, options, profile, tracker=tracker, progress_range=None
+                )
+                del frames
+
+                counts = await self._complete_chunk(
+                    analysis_id, chunk_index, chunk_results, face_results
+                )
+                if counts is None:
+                    logger.info(f"Chunk {chunk_index} of {analysis_id} was already completed")
+                    return
+
+                completed, total = counts
+                await self._update_chunk_progress(analysis_id, completed, total)
+                if completed == total:
+                    await self._finalize_fan_out(analysis_id, profile)
+
+            except Exception as e:
+                logger.error(f"Failed to process video chunk: {e}", exc_info=True)
+                try:
+                    await self._fail_chunk(job, e)
+                except Exception:
+                    pass
+            finally:
+                if workspace:
+                    await self.workspaces.release(workspace)
+
+    async def reissue_stragglers(self) -> None:
+        """
+        Re-publish chunks left unfinished past video_chunk_timeout_seconds.
+
+        A chunk stuck on a slow or dead worker is handed to another worker
+        while the original keeps running; whichever finishes first wins.
+        Also finalizes fan-outs whose last chunk completed but whose
+        aggregation never ran (the finalizing worker died).
+        """
+        rows = await self.db.fetch(
+            """
+            UPDATE analysis_chunks c
+            SET issued_at = NOW()
+            FROM analyses a
+            WHERE a.id = c.analysis_id AND a.status = 'processing'
+              AND c.status <> 'completed'
+              AND c.issued_at < NOW() - make_interval(secs => $1)
+              AND c.attempts < $2
+            RETURNING c.analysis_id, c.chunk_index, c.start_seconds, c.end_seconds,
+                      c.max_frames, a.file_key, a.options
+            """,
+            settings.video_chunk_timeout_seconds,
+            settings.video_chunk_max_attempts,
+        )
+        for row in rows:
+            logger.warning(f"Re-issuing straggling chunk {row['chunk_index']} of {row['analysis_id']}")
+            await self._publish_chunk(
+                self._chunk_job(row, row["file_key"], json.loads(row["options"] or "{}"))
+            )
+
+        # Candidates only; _finalize_fan_out claims each one atomically
+        orphaned = await self.db.fetch(
+            """
+            SELECT f.analysis_id, a.options
+            FROM analysis_fanouts f
+            JOIN analyses a ON a.id = f.analysis_id
+            WHERE a.status = 'processing'
+              AND f.completed_chunks = f.total_chunks AND NOT f.audio_pending
+              AND f.updated_at < NOW() - make_interval(secs => $1)
+              AND (f.finalized_at IS NULL
+                   OR f.finalized_at < NOW() - make_interval(secs => $1))
+            """,
+            settings.video_chunk_timeout_seconds,
+        )
+        for row in orphaned:
+            options = json.loads(row["options"] or "{}")
+            profile = replace(get_profile(options.get("quality")), early_exit_min_frames=None)
+            await self._finalize_fan_out(str(row["analysis_id"]), profile)
+
+    def _should_shard(self, video_info: VideoInfo, options: dict) -> bool:
+        """Check whether a job should be split into chunk sub-jobs."""
+        return (
+            self.channel is not None
+            and settings.video_sharding_enabled
+            and not options.get("max_seconds")
+            and video_info.duration_seconds >= settings.video_shard_min_seconds
+        )
+
+    async def _fan_out(
+        self,
+        analysis_id: str,
+        youtube_url: str,
+        options: dict,
+        profile: QualityProfile,
+        video_info: VideoInfo,
+        score_audio: bool = False,
+    ) -> bool:
+        """
+        Split a video job into time-range chunk sub-jobs.
+
+        The profile's frame budget is divided across chunks by duration.
+        Chunk rows and the join record are created idempotently, so a
+        redelivered coordinator message only re-publishes unfinished chunks.
+
+        Args:
+            score_audio: Whether the coordinator scores the audio track;
+                finalization then waits for _complete_fan_out_audio.
+
+        Returns:
+            True if the join is still waiting for the audio result.
+        """
+        chunk_seconds = self._whole_windows(settings.video_chunk_seconds)
+        duration = video_info.duration_seconds
+        total_chunks = max(1, math.ceil(duration / chunk_seconds))
+        frame_budget = min(profile.max_frames, int(duration * profile.frames_per_second))
+
+        chunks = []
+        for index in range(total_chunks):
+            start = index * chunk_seconds
+            end = min(duration, start + chunk_seconds)
+            max_frames = max(1, math.ceil(frame_budget * (end - start) / duration))
+            chunks.append((analysis_id, index, start, end, max_frames))
+
+        async with self.db.transaction() as conn:
+            await conn.execute(
+                """
+                INSERT INTO analysis_fanouts (
+                    analysis_id, total_chunks, video_info, audio_pending
+                ) VALUES ($1, $2, $3, $4)
+                ON CONFLICT (analysis_id) DO NOTHING
+                """,
+                analysis_id,
+                total_chunks,
+                json.dumps(asdict(video_info)),
+                score_audio,
+            )
+            audio_pending = await conn.fetchval(
+                "SELECT audio_pending FROM analysis_fanouts WHERE analysis_id = $1",
+                analysis_id,
+            )
+            await conn.executemany(
+                """
+                INSERT INTO analysis_chunks (
+                    analysis_id, chunk_index, start_seconds, end_seconds, max_frames
+                ) VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (analysis_id, chunk_index) DO NOTHING
+                """,
+                chunks,
+            )
+            pending = await conn.fetch(
+                """
+                UPDATE analysis_chunks SET issued_at = NOW()
+                WHERE analysis_id = $1 AND status <> 'completed'
+                RETURNING chunk_index, start_seconds, end_seconds, max_frames
+                """,
+                analysis_id,
+            )
+
+        await self._update_status(
+            analysis_id, "processing", 30, f"analyzing (0/{total_chunks} chunks)"
+        )
+        for row in pending:
+            await self._publish_chunk(self._chunk_job(row, youtube_url, options, analysis_id))
+
+        logger.info(f"Fanned out {analysis_id} into {total_chunks} chunks")
+        return audio_pending
+
+    async def _complete_fan_out_audio(
+        self, analysis_id: str, profile: QualityProfile, audio_analysis: Optional[dict]
+    ) -> None:
+        """Store the coordinator's audio result, finalizing if every chunk is in."""
+        row = await self.db.fetchrow(
+            """
+            UPDATE analysis_fanouts
+            SET audio_analysis = $2, audio_pending = FALSE, updated_at = NOW()
+            WHERE analysis_id = $1
+            RETURNING completed_chunks, total_chunks
+            """,
+            analysis_id,
+            json.dumps(audio_analysis) if audio_analysis is not None else None,
+        )
+        if row is not None and row["completed_chunks"] == row["total_chunks"]:
+            await self._finalize_fan_out(analysis_id, profile)
+
+    @staticmethod
+    def _chunk_job(
+        row: Any, youtube_url: str, options: dict, analysis_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a chunk message from an analysis_chunks row."""
+        return {
+            "analysis_id": analysis_id or str(row["analysis_id"]),
+            "file_key": youtube_url,
+            "options": options,
+            "chunk_index": row["chunk_index"],
+            "start_seconds": row["start_seconds"],
+            "end_seconds": row["end_seconds"],
+            "max_frames": row["max_frames"],
+        }
+
+    async def _publish_chunk(self, job: Dict[str, Any]) -> None:
+        """Publish a chunk sub-job for any worker to take."""
+        await self.channel.default_exchange.publish(
+            aio_pika.Message(
+                body=json.dumps(job).encode(),
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=settings.queue_video_chunk,
+        )
+
+    async def _claim_chunk(self, analysis_id: str, chunk_index: int) -> Optional[int]:
+        """
+        Mark a chunk as taken by this worker.
+
+        Returns:
+            The chunk's attempt count, or None if the chunk is already
+            completed or the analysis is no longer processing.
+        """
+        return await self.db.fetchval(
+            """
+            UPDATE analysis_chunks c
+            SET status = 'processing', attempts = c.attempts + 1, worker_id = $3
+            FROM analyses a
+            WHERE c.analysis_id = $1 AND c.chunk_index = $2 AND c.status <> 'completed'
+              AND a.id = c.analysis_id AND a.status = 'processing'
+            RETURNING c.attempts
+            """,
+            analysis_id,
+            chunk_index,
+            settings.worker_id,
+        )
+
+    async def _complete_chunk(
+        self,
+        analysis_id: str,
+        chunk_index: int,
+        chunk_results: FrameResults,
+        face_results: FaceTrackResults,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Commit a chunk's results and bump the join counter in one transaction.
+
+        Returns:
+            (completed_chunks, total_chunks) after this chunk, or None if
+            another copy of the chunk completed first.
+        """
+        async with self.db.transaction() as conn:
+            first = await conn.fetchval(
+                """
+                UPDATE analysis_chunks
+                SET status = 'completed', face_tracking = $3, completed_at = NOW()
+                WHERE analysis_id = $1 AND chunk_index = $2 AND status <> 'completed'
+                RETURNING chunk_index
+                """,
+                analysis_id,
+                chunk_index,
+                json.dumps(face_results.to_state()),
+            )
+            if first is None:
+                return None
+
+            await self._store_frame_windows(conn, analysis_id, chunk_results)
+            row = await conn.fetchrow(
+                """
+                UPDATE analysis_fanouts
+                SET completed_chunks = completed_chunks + 1, updated_at = NOW()
+                WHERE analysis_id = $1
+                RETURNING completed_chunks, total_chunks
+                """,
+                analysis_id,
+            )
+        return row["completed_chunks"], row["total_chunks"]
+
+    async def _fail_chunk(self, job: Dict[str, Any], error: Exception) -> None:
+        """
+        Re-publish a failed chunk, or fail the analysis once attempts run out.
+
+        Only the worker holding the latest claim does either. If a re-issued
+        copy has since claimed the chunk, that copy is left to finish.
+        """
+        analysis_id = job["analysis_id"]
+        attempts = await self.db.fetchval(
+            """
+            UPDATE analysis_chunks SET status = 'pending', issued_at = NOW()
+            WHERE analysis_id = $1 AND chunk_index = $2 AND status <> 'completed'
+              AND worker_id = $3
+            RETURNING attempts
+            """,
+            analysis_id,
+            job["chunk_index"],
+            settings.worker_id,
+        )
+        if attempts is None:
+            logger.info(
+                f"Not retrying chunk {job['chunk_index']} of {analysis_id}: "
+                "completed or claimed by another copy"
+            )
+            return
+
+        if attempts < settings.video_chunk_max_attempts:
+            logger.warning(f"Retrying chunk {job['chunk_index']} of {analysis_id}: {error}")
+            await self._publish_chunk(job)
+            return
+
+        code = getattr(error, "code", "PROCESSING_ERROR")
+        message = getattr(error, "message", str(error))
+        await self._update_status(
+            analysis_id, "failed", 0, None, error_code=code, error_message=message
+        )
+
+    async def _finalize_fan_out(self, analysis_id: str, profile: QualityProfile) -> None:
+        """
+        Merge every chunk's results and store the final analysis.
+
+        Waits for every chunk and for the coordinator's audio result. The
+        last of those to land and the straggler sweep can all get here, so
+        finalization is claimed first by stamping finalized_at. Only the
+        caller whose UPDATE returns the row aggregates. A claim older than
+        the chunk timeout on a still-processing analysis means the claiming
+        worker died, and it may be taken over.
+        """
+        fanout = await self.db.fetchrow(
+            """
+            UPDATE analysis_fanouts f
+            SET finalized_at = NOW()
+            FROM analyses a
+            WHERE f.analysis_id = $1 AND a.id = f.analysis_id AND a.status = 'processing'
+              AND f.completed_chunks = f.total_chunks AND NOT f.audio_pending
+              AND (f.finalized_at IS NULL
+                   OR f.finalized_at < NOW() - make_interval(secs => $2))
+            RETURNING f.video_info, f.audio_analysis
+            """,
+            analysis_id,
+            settings.video_chunk_timeout_seconds,
+        )
+        if fanout is None:
+            logger.info(f"Fan-out of {analysis_id} is already being finalized")
+            return
+
+        windows = await self.db.fetch(
+            """
+            SELECT timestamps, ai_probabilities FROM analysis_frame_results
+            WHERE analysis_id = $1
+            ORDER BY window_index
+            """,
+            analysis_id,
+        )
+        chunks = await self.db.fetch(
+            """
+            SELECT face_tracking FROM analysis_chunks
+            WHERE analysis_id = $1
+            ORDER BY chunk_index
+            """,
+            analysis_id,
+        )
+
+        face_results = FaceTrackResults()
+        for chunk in chunks:
+            if chunk["face_tracking"]:
+                face_results.merge(FaceTrackResults.from_state(json.loads(chunk["face_tracking"])))
+
+        await self._update_status(analysis_id, "processing", 90, "aggregating")
+        await self._aggregate_and_store_results(
+            analysis_id,
+            VideoInfo(**json.loads(fanout["video_info"])),
+            FrameResults.from_windows(windows),
+            face_results,
+            profile,
+            audio_analysis=(
+                json.loads(fanout["audio_analysis"]) if fanout["audio_analysis"] else None
+            ),
+        )
+
+        await self._update_status(analysis_id, "completed", 100, None)
+        logger.info(f"Completed sharded video analysis: {analysis_id} ({len(chunks)} chunks)")
+
+    async def _update_chunk_progress(self, analysis_id: str, completed: int, total: int) -> None:
+        """Report chunk progress without overwriting a finished analysis."""
+        row = await self.db.fetchrow(
+            queries.UPDATE_CHUNK_PROGRESS,
+            analysis_id,
+            30 + int(60 * completed / total),
+            f"analyzing ({completed}/{total} chunks)",
+        )
+        await self.status_store.publish(row)
+
+    async def _process_long_video(
+        self,
+        analysis_id: str,
+        youtube_url: str,
+        options: dict,
+        profile: QualityProfile,
+    ) -> None:
+        """
+        Analyze a long video in fixed timeline segments, checkpointing each one.
+
+        Each segment's frame windows are committed together with the
+        checkpoint row, so a redelivered job reloads the completed segments
+        and continues from the first unfinished one. Results merge into one
+        FrameResults as segments finish and are aggregated once at the end.
+        Every segment gets the profile's per-job frame budget, and early exit
+        is disabled since the opening minutes say little about the rest.
+        """
+        segment_seconds = self._whole_windows(settings.long_video_segment_seconds)
+        profile = replace(profile, early_exit_min_frames=None)
+        frames_per_segment = min(
+            profile.max_frames, max(1, int(segment_seconds * profile.frames_per_second))
+        )
+
+        await self._update_status(analysis_id, "processing", 5, "downloading")
+
+        reserve_bytes = LongVideoDownloader().estimate_download_bytes(
+            None, profile.max_resolution
+        )
+        async with self.long_workspaces.workspace(reserve_bytes, prefix="long_video") as workspace:
+            video_info = await self._download_long_video(
+                analysis_id, youtube_url, workspace, profile.max_resolution
+            )
+            await self._update_file_info(analysis_id, video_info)
+
+            total_segments = max(1, math.ceil(video_info.duration_seconds / segment_seconds))
+            checkpoint = await self._load_checkpoint(analysis_id)
+            if checkpoint.segments_completed:
+                logger.info(
+                    f"Resuming {analysis_id} at segment "
+                    f"{checkpoint.segments_completed + 1}/{total_segments}"
+                )
+
+            frame_results = checkpoint.frame_results
+            face_results = checkpoint.face_results
+            tracker = None
+            if options.get("face_roi", True):
+                tracker = FaceTracker(first_track_id=checkpoint.next_track_id)
+
+            for segment in range(checkpoint.segments_completed, total_segments):
+                # Progress is spread over segments in the 20-90% range
+                progress_start = 20 + int(70 * segment / total_segments)
+                progress_end = 20 + int(70 * (segment + 1) / total_segments)
+                await self._update_status(
+                    analysis_id,
+                    "processing",
+                    progress_start,
+                    f"extracting_frames (segment {segment + 1}/{total_segments})",
+                )
+
+                start = segment * segment_seconds
+                frames = await self.frame_extractor.extract(
+                    video_info.file_path,
+                    max_frames=frames_per_segment,
+                    frames_per_second=profile.frames_per_second,
+                    max_dimension=profile.decode_max_dimension,
+                    start_seconds=start,
+                    end_seconds=start + segment_seconds,
+                )
+                segment_results, _ = await self._analyze_frames(
+                    analysis_id,
+                    frames,
+                    options,
+                    profile,
+                    face_results=face_results,
+                    tracker=tracker,
+                    progress_range=(progress_start, progress_end),
+                )
+                del frames
+
+                frame_results.extend(segment_results)
+                await self._save_checkpoint(
+                    analysis_id, segment + 1, segment_results, face_results, tracker
+                )
+
+            await self._update_status(analysis_id, "processing", 90, "aggregating")
+            await self._aggregate_and_store_results(
+                analysis_id, video_info, frame_results, face_results, profile, checkpointed=True
+            )
+
+        await self._update_status(analysis_id, "completed", 100, None)
+
+    @staticmethod
+    def _whole_windows(seconds: float) -> float:
+        """Round a segment length to whole frame windows, so no window spans two segments."""
+        return max(1, round(seconds / FRAME_WINDOW_SECONDS)) * FRAME_WINDOW_SECONDS
+
+    async def _download_long_video(
+        self,
+        analysis_id: str,
+        youtube_url: str,
+        workspace: Workspace,
+        max_resolution: Optional[int] = None,
+    ) -> VideoInfo:
+        """Download a whole long video into a disk-backed workspace."""
+        async def progress_callback(progress: int):
+            # Map download progress to 5-20% range
+            mapped_progress = 5 + int(progress * 0.15)
+            await self._update_status(
+                analysis_id, "processing", mapped_progress, "downloading"
+            )
+
+        return await self._fetch_video(
+            LongVideoDownloader(workspace=workspace),
+            youtube_url,
+            progress_callback,
+            max_resolution=max_resolution,
+        )
+
+    async def _load_checkpoint(self, analysis_id: str) -> LongVideoCheckpoint:
+        """Reload the completed segments of an interrupted long-video job."""
+        row = await self.db.fetchrow(
+            """
+            SELECT segments_completed, state FROM analysis_checkpoints
+            WHERE analysis_id = $1
+            """,
+            analysis_id,
+        )
+        if row is None:
+            return LongVideoCheckpoint(0, FrameResults(), FaceTrackResults())
+
+        state = json.loads(row["state"])
+        windows = await self.db.fetch(
+            """
+            SELECT timestamps, ai_probabilities FROM analysis_frame_results
+            WHERE analysis_id = $1
+            ORDER BY window_index
+            """,
+            analysis_id,
+        )
+        return LongVideoCheckpoint(
+            segments_completed=row["segments_completed"],
+            frame_results=FrameResults.from_windows(windows),
+            face_results=FaceTrackResults.from_state(state.get("face_tracking", {})),
+            next_track_id=state.get("next_track_id", 1),
+        )
+
+    async def _save_checkpoint(
+        self,
+        analysis_id: str,
+        segments_completed: int,
+        segment_results: FrameResults,
+        face_results: FaceTrackResults,
+        tracker: Optional[FaceTracker],
+    ) -> None:
+        """Commit a finished segment's frame windows together with the checkpoint."""
+        state = {
+            "face_tracking": face_results.to_state(),
+            "next_track_id": tracker.next_track_id if tracker else 1,
+        }
+        async with self.db.transaction() as conn:
+            await self._store_frame_windows(conn, analysis_id, segment_results)
+            await conn.execute(
+                """
+                INSERT INTO analysis_checkpoints (analysis_id, segments_completed, state, updated_at)
+                VALUES ($1, $2, $3, NOW())
+                ON CONFLICT (analysis_id) DO UPDATE
+                SET segments_completed = EXCLUDED.segments_completed,
+                    state = EXCLUDED.state,
+                    updated_at = NOW()
+                """,
+                analysis_id,
+                segments_completed,
+                json.dumps(state),
+            )
+
+    async def _increment_retry_count(self, analysis_id: str) -> int:
+        """Record a redelivery of the job and return the new retry count."""
+        return await self.db.fetchval(
+            queries.INCREMENT_RETRY_COUNT,
+            analysis_id,
+        )
+
+    def _start_audio_analysis(
+        self, video_info: VideoInfo, options: dict
+    ) -> Optional[asyncio.Task]:
+        """Start scoring the video's audio track in the background."""
+        if not settings.audio_analysis_enabled or not options.get("audio", True):
+            return None
+        return asyncio.create_task(self.audio_analyzer.analyze(video_info.file_path))
+
+    async def _finish_audio_analysis(
+        self, analysis_id: str, audio_task: Optional[asyncio.Task]
+    ) -> Optional[dict]:
+        """Wait for the audio result; audio failures never fail the video job."""
+        if audio_task is None:
+            return None
+        try:
+            return await audio_task
+        except Exception as e:
+            logger.warning(f"Audio analysis failed for {analysis_id}: {e}")
+            return None
+
+    @staticmethod
+    async def _cancel_audio_analysis(audio_task: Optional[asyncio.Task]) -> None:
+        """Cancel an unfinished audio task and wait for its decoder to exit."""
+        if audio_task is None or audio_task.done():
+            return
+        audio_task.cancel()
+        try:
+            await audio_task
+        except BaseException:
+            pass
 
     async def _download_demo_video(
-        self, analysis_id: str, youtube_url: str, temp_dir: str
+        self,
+        analysis_id: str,
+        youtube_url: str,
+        workspace: Workspace,
+        max_resolution: Optional[int] = None,
     ) -> VideoInfo:
         """Download video with demo constraints (20s max)."""
-        # Create a downloader with demo-specific temp dir
-        demo_downloader = DemoVideoDownloader(temp_dir=temp_dir)
+        # Create a downloader bound to the demo's workspace
+        demo_downloader = DemoVideoDownloader(workspace=workspace)
 
         async def progress_callback(progress: int):
             # Map download progress to 5-20% range
@@ -250,10 +1041,16 @@ class VideoWorker:
                 analysis_id, "processing", mapped_progress, "downloading"
             )
 
-        return await demo_downloader.download(youtube_url, progress_callback)
+        return await self._fetch_video(
+            demo_downloader,
+            youtube_url,
+            progress_callback,
+            max_seconds=DEMO_MAX_DURATION,
+            max_resolution=max_resolution,
+        )
 
     async def _extract_demo_frames(
-        self, analysis_id: str, video_path: str
+        self, analysis_id: str, video_path: str, profile: QualityProfile
     ) -> List[ExtractedFrame]:
         """Extract frames with demo constraints (max 20 frames)."""
         async def progress_callback(progress: int):
@@ -265,12 +1062,21 @@ class VideoWorker:
 
         return await self.frame_extractor.extract(
             video_path,
-            max_frames=DEMO_MAX_FRAMES,
+            max_frames=min(DEMO_MAX_FRAMES, profile.max_frames),
             progress_callback=progress_callback,
+            frames_per_second=profile.frames_per_second,
+            max_dimension=profile.decode_max_dimension,
         )
 
-    async def _download_video(self, analysis_id: str, youtube_url: str) -> VideoInfo:
-        """Download the YouTube video."""
+    async def _download_video(
+        self,
+        analysis_id: str,
+        youtube_url: str,
+        workspace: Workspace,
+        max_seconds: Optional[float] = None,
+        max_resolution: Optional[int] = None,
+    ) -> VideoInfo:
+        """Download the YouTube video into the job's workspace."""
         async def progress_callback(progress: int):
             # Map download progress to 5-20% range
             mapped_progress = 5 + int(progress * 0.15)
@@ -278,10 +1084,75 @@ class VideoWorker:
                 analysis_id, "processing", mapped_progress, "downloading"
             )
 
-        return await self.downloader.download(youtube_url, progress_callback)
+        return await self._fetch_video(
+            VideoDownloader(workspace=workspace),
+            youtube_url,
+            progress_callback,
+            max_seconds=max_seconds,
+            max_resolution=max_resolution,
+        )
+
+    async def _fetch_video(
+        self,
+        downloader: VideoDownloader,
+        youtube_url: str,
+        progress_callback,
+        max_seconds: Optional[float] = None,
+        max_resolution: Optional[int] = None,
+    ) -> VideoInfo:
+        """Download a video, reusing the worker-local media cache when possible."""
+        max_resolution = max_resolution or downloader.MAX_RESOLUTION
+        video_id = VideoDownloader.video_id_from_url(youtube_url)
+        if self.media_cache is None or video_id is None:
+            return await downloader.download(
+                youtube_url,
+                progress_callback,
+                max_seconds=max_seconds,
+                max_resolution=max_resolution,
+            )
+
+        cache_key = MediaCache.video_key(
+            video_id, f"{max_resolution}p:{max_seconds or 'full'}"
+        )
+
+        # Each job gets its own link to the cached file, so cleanup and
+        # eviction never race with each other
+        started = time.monotonic()
+        dest_path = os.path.join(downloader.temp_dir, f"{video_id}-{uuid4().hex}")
+        metadata = await self.media_cache.get_file(cache_key, dest_path)
+        if metadata is None:
+            # Chunks of a sharded job land on the same hosts at once; only
+            # one of them downloads, the rest wait and link the cached file
+            async with self.media_cache.fill_lock(cache_key):
+                metadata = await self.media_cache.get_file(cache_key, dest_path)
+                if metadata is None:
+                    video_info = await downloader.download(
+                        youtube_url,
+                        progress_callback,
+                        max_seconds=max_seconds,
+                        max_resolution=max_resolution,
+                    )
+                    try:
+                        await self.media_cache.put_file(
+                            cache_key, video_info.file_path, asdict(video_info)
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to cache video {video_id}: {e}")
+                    return video_info
+
+        video_info = VideoInfo(**metadata)
+        video_info.file_path = dest_path
+        video_info.timings = {"cache_ms": round((time.monotonic() - started) * 1000, 1)}
+        try:
+            # The cached entry may come from a job with a looser limit
+            downloader.check_duration(video_info.duration_seconds)
+        except DownloadError:
+            downloader.cleanup(dest_path)
+            raise
+        return video_info
 
     async def _extract_frames(
-        self, analysis_id: str, video_path: str
+        self, analysis_id: str, video_path: str, profile: QualityProfile
     ) -> List[ExtractedFrame]:
         """Extract frames from the video."""
         async def progress_callback(progress: int):
@@ -293,8 +1164,10 @@ class VideoWorker:
 
         return await self.frame_extractor.extract(
             video_path,
-            max_frames=300,
+            max_frames=profile.max_frames,
             progress_callback=progress_callback,
+            frames_per_second=profile.frames_per_second,
+            max_dimension=profile.decode_max_dimension,
         )
 
     async def _analyze_frames(
@@ -302,40 +1175,105 @@ class VideoWorker:
         analysis_id: str,
         frames: List[ExtractedFrame],
         options: dict,
-    ) -> List[FrameAnalysisResult]:
-        """Analyze each frame for AI-generated content."""
-        results: List[FrameAnalysisResult] = []
+        profile: QualityProfile,
+        face_results: Optional[FaceTrackResults] = None,
+        tracker: Optional[FaceTracker] = None,
+        progress_range: Optional[Tuple[int, int]] = (30, 90),
+    ) -> Tuple[FrameResults, FaceTrackResults]:
+        """
+        Analyze each frame for AI-generated content.
+
+        Faces are detected on a subset of frames and tracked in between;
+        when a frame has faces, only the face crops go through the
+        detectors and the frame scores as its most suspicious face. Frames
+        without faces (or jobs with options["face_roi"] = False) are
+        analyzed whole.
+
+        Runs the profile's detector subset (unless the job names its own
+        models) and stops early once the profile considers the running
+        result decisive.
+
+        Segmented jobs pass the face accumulator and tracker that carry over
+        between segments, plus the progress range the segment covers. Chunk
+        sub-jobs pass progress_range=None and report progress per chunk.
+        """
+        results = FrameResults(capacity=len(frames))
+        if face_results is None:
+            face_results = FaceTrackResults()
+        if tracker is None and options.get("face_roi", True):
+            tracker = FaceTracker()
         total_frames = len(frames)
+        detector_options = profile.detector_options(options)
+        loop = asyncio.get_running_loop()
 
         for i, frame in enumerate(frames):
-            # Convert frame to bytes for detector
-            frame_bytes = self.frame_extractor.frame_to_bytes(frame, format="png")
-
-            # Run detection
-            detection_result = await self.image_detector.detect(frame_bytes, options)
+            # Locate faces (detection every few frames, tracking in between)
+            faces: List[FaceObservation] = []
+            if tracker is not None:
+                faces = await loop.run_in_executor(None, tracker.update, frame.image)
+
+            # Run detection on face crops, or the whole frame if none
+            ai_probability = await self._analyze_frame_regions(
+                frame, faces, detector_options, face_results
+            )
+            results.append(frame.timestamp, ai_probability)
 
-            # Extract AI probability from result
-            ai_probability = self._extract_ai_probability(detection_result)
+            # Update progress (30-90% range unless given)
+            if progress_range is not None:
+                progress_start, progress_end = progress_range
+                progress = progress_start + int(
+                    (i / total_frames) * (progress_end - progress_start)
+                )
+                await self._update_status(
+                    analysis_id,
+                    "processing",
+                    progress,
+                    f"analyzing ({i + 1}/{total_frames})",
+                )
 
-            results.append(
-                FrameAnalysisResult(
-                    timestamp=frame.timestamp,
-                    ai_probability=ai_probability,
-                    verdict=detection_result["verdict"],
-                    confidence=detection_result["confidence"],
+            if profile.should_exit_early(len(results), results.mean_probability()):
+                logger.info(
+                    f"Early exit for {analysis_id} after {i + 1}/{total_frames} frames"
                 )
-            )
+                break
 
-            # Update progress (30-90% range)
-            progress = 30 + int((i / total_frames) * 60)
-            await self._update_status(
-                analysis_id,
-                "processing",
-                progress,
-                f"analyzing ({i + 1}/{total_frames})",
+        return results, face_results
+
+    async def _analyze_frame_regions(
+        self,
+        frame: ExtractedFrame,
+        faces: List[FaceObservation],
+        detector_options: dict,
+        face_results: FaceTrackResults,
+    ) -> float:
+        """Score a frame from its face crops, falling back to the whole frame."""
+        frame_pixels = frame.image.shape[0] * frame.image.shape[1]
+
+        if not faces:
+            frame_bytes = self.frame_extractor.frame_to_bytes(frame, format="png")
+            detection_result = await self.image_detector.detect(frame_bytes, detector_options)
+            face_results.record_frame(frame_pixels, frame_pixels, had_faces=False)
+            return self._extract_ai_probability(detection_result)
+
+        probabilities = []
+        detector_pixels = 0
+        for face in faces:
+            region = face.box.expanded(self.FACE_MARGIN, frame.image.shape)
+            crop = ExtractedFrame(
+                timestamp=frame.timestamp,
+                frame_number=frame.frame_number,
+                image=region.crop(frame.image),
             )
+            crop_bytes = self.frame_extractor.frame_to_bytes(crop, format="png")
+            detection_result = await self.image_detector.detect(crop_bytes, detector_options)
+
+            ai_probability = self._extract_ai_probability(detection_result)
+            face_results.add(face.track_id, frame.timestamp, face.box, ai_probability)
+            probabilities.append(ai_probability)
+            detector_pixels += region.area
 
-        return results
+        face_results.record_frame(frame_pixels, detector_pixels, had_faces=True)
+        return max(probabilities)
 
     def _extract_ai_probability(self, detection_result: dict) -> float:
         """Extract AI probability from detection result."""
@@ -358,37 +1296,40 @@ class VideoWorker:
         self,
         analysis_id: str,
         video_info: VideoInfo,
-        frame_results: List[FrameAnalysisResult],
+        frame_results: FrameResults,
+        face_results: FaceTrackResults,
+        profile: QualityProfile,
+        checkpointed: bool = False,
+        audio_analysis: Optional[dict] = None,
     ) -> None:
-        """Aggregate frame results and store final analysis."""
+        """
+        Aggregate frame results and store final analysis.
+
+        Checkpointed (long-video) jobs also drop their checkpoint row.
+        """
         # Calculate average AI probability
-        if frame_results:
-            avg_ai_prob = sum(r.ai_probability for r in frame_results) / len(frame_results)
-            max_ai_prob = max(r.ai_probability for r in frame_results)
-        else:
-            avg_ai_prob = 0.0
-            max_ai_prob = 0.0
+        avg_ai_prob = frame_results.mean_probability()
+        max_ai_prob = frame_results.max_probability()
 
         # Find suspicious segments
-        suspicious_segments = self._find_suspicious_segments(frame_results)
+        suspicious_segments = frame_results.find_segments(
+            self.SUSPICIOUS_THRESHOLD, self.SEGMENT_GAP_THRESHOLD
+        )
 
         # Determine overall verdict
         verdict, confidence, risk_level = self._determine_verdict(
             avg_ai_prob, max_ai_prob, suspicious_segments
         )
 
-        # Build video analysis data
+        # Build video analysis data; per-frame results are stored columnar
+        # in analysis_frame_results rather than inline
         video_analysis = {
             "youtube_id": video_info.video_id,
             "youtube_title": video_info.title,
             "frames_analyzed": len(frame_results),
-            "frame_results": [
-                {
-                    "timestamp": r.timestamp,
-                    "ai_probability": round(r.ai_probability, 3),
-                }
-                for r in frame_results
-            ],
+            "quality": profile.name,
+            "face_roi": face_results.summary(len(frame_results)),
+            "timings": video_info.timings,
             "suspicious_segments": [
                 {
                     "start": seg.start,
@@ -403,6 +1344,11 @@ class VideoWorker:
         summary = self._generate_summary(
             video_info, frame_results, suspicious_segments, verdict
         )
+        if audio_analysis and audio_analysis["suspicious_segments"]:
+            summary += (
+                f" The audio track has {len(audio_analysis['suspicious_segments'])} "
+                "segment(s) with elevated synthetic speech probability."
+            )
 
         # Store result
         await self._store_result(
@@ -412,44 +1358,10 @@ class VideoWorker:
             risk_level=risk_level,
             summary=summary,
             video_analysis=video_analysis,
-        )
-
-    def _find_suspicious_segments(
-        self, frame_results: List[FrameAnalysisResult]
-    ) -> List[SuspiciousSegment]:
-        """Find contiguous segments with high AI probability."""
-        segments: List[SuspiciousSegment] = []
-        current_segment_frames: List[FrameAnalysisResult] = []
-
-        for result in frame_results:
-            if result.ai_probability >= self.SUSPICIOUS_THRESHOLD:
-                if current_segment_frames:
-                    # Check if this frame is close enough to continue the segment
-                    gap = result.timestamp - current_segment_frames[-1].timestamp
-                    if gap > self.SEGMENT_GAP_THRESHOLD:
-                        # Save current segment and start new one
-                        segments.append(self._create_segment(current_segment_frames))
-                        current_segment_frames = []
-                current_segment_frames.append(result)
-            else:
-                if current_segment_frames:
-                    segments.append(self._create_segment(current_segment_frames))
-                    current_segment_frames = []
-
-        # Don't forget the last segment
-        if current_segment_frames:
-            segments.append(self._create_segment(current_segment_frames))
-
-        return segments
-
-    def _create_segment(
-        self, frames: List[FrameAnalysisResult]
-    ) -> SuspiciousSegment:
-        """Create a suspicious segment from a list of frames."""
-        return SuspiciousSegment(
-            start=frames[0].timestamp,
-            end=frames[-1].timestamp,
-            avg_ai_probability=sum(f.ai_probability for f in frames) / len(frames),
+            frame_results=frame_results,
+            face_tracking=face_results.to_json(),
+            checkpointed=checkpointed,
+            audio_analysis=audio_analysis,
         )
 
     def _determine_verdict(
@@ -478,16 +1390,13 @@ class VideoWorker:
     def _generate_summary(
         self,
         video_info: VideoInfo,
-        frame_results: List[FrameAnalysisResult],
+        frame_results: FrameResults,
         suspicious_segments: List[SuspiciousSegment],
         verdict: str,
     ) -> str:
         """Generate a human-readable summary of the analysis."""
         total_frames = len(frame_results)
-        suspicious_frames = sum(
-            1 for r in frame_results if r.ai_probability >= self.SUSPICIOUS_THRESHOLD
-        )
-        avg_prob = sum(r.ai_probability for r in frame_results) / total_frames if total_frames else 0
+        suspicious_frames = frame_results.count_at_or_above(self.SUSPICIOUS_THRESHOLD)
 
         if verdict == "ai_generated":
             summary = f"This video shows strong indicators of AI-generated content. "
@@ -520,16 +1429,8 @@ class VideoWorker:
         error_message: Optional[str] = None,
     ) -> None:
         """Update analysis status in database."""
-        await self.db.execute(
-            """
-            UPDATE analyses
-            SET status = $2::analysis_status, progress = $3, current_stage = $4,
-                error_code = $5, error_message = $6,
-                processing_started_at = CASE WHEN $2 = 'processing' AND processing_started_at IS NULL THEN NOW() ELSE processing_started_at END,
-                processing_completed_at = CASE WHEN $2 IN ('completed', 'failed') THEN NOW() ELSE processing_completed_at END,
-                updated_at = NOW()
-            WHERE id = $1
-            """,
+        row = await self.db.fetchrow(
+            queries.UPDATE_ANALYSIS_STATUS,
             analysis_id,
             status,
             progress,
@@ -537,25 +1438,21 @@ class VideoWorker:
             error_code,
             error_message,
         )
+        await self.status_store.publish(row)
 
     async def _update_file_info(self, analysis_id: str, video_info: VideoInfo) -> None:
         """Update file information in database."""
-        await self.db.execute(
-            """
-            UPDATE analyses
-            SET file_name = $2, file_size_bytes = $3, file_mime_type = $4,
-                duration_seconds = $5, resolution = $6, fps = $7,
-                updated_at = NOW()
-            WHERE id = $1
-            """,
+        row = await self.db.fetchrow(
+            queries.UPDATE_ANALYSIS_FILE_INFO,
             analysis_id,
             video_info.title,
             video_info.file_size_bytes,
-            "video/mp4",
+            video_info.mime_type,
             video_info.duration_seconds,
             video_info.resolution,
             video_info.fps,
         )
+        await self.status_store.publish(row)
 
     async def _store_result(
         self,
@@ -565,8 +1462,12 @@ class VideoWorker:
         risk_level: str,
         summary: str,
         video_analysis: dict,
+        frame_results: FrameResults,
+        face_tracking: List[dict],
+        checkpointed: bool = False,
+        audio_analysis: Optional[dict] = None,
     ) -> None:
-        """Store analysis result in database."""
+        """Store analysis result and per-frame windows in one transaction."""
         # Build detections list (simplified for video)
         detections = [
             {
@@ -580,21 +1481,51 @@ class VideoWorker:
             }
         ]
 
-        await self.db.execute(
-            """
-            INSERT INTO analysis_results (
-                id, analysis_id, verdict, confidence, risk_level, summary,
-                detections, ensemble_score, video_analysis, created_at
-            ) VALUES (
-                gen_random_uuid(), $1, $2, $3, $4, $5, $6, $7, $8, NOW()
+        async with self.db.transaction() as conn:
+            await self._store_frame_windows(conn, analysis_id, frame_results)
+            await conn.execute(
+                """
+                INSERT INTO analysis_results (
+                    id, analysis_id, verdict, confidence, risk_level, summary,
+                    detections, ensemble_score, video_analysis, face_tracking,
+                    audio_analysis, created_at
+                ) VALUES (
+                    gen_random_uuid(), $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, NOW()
+                )
+                """,
+                analysis_id,
+                verdict,
+                confidence,
+                risk_level,
+                summary,
+                json.dumps(detections),
+                confidence,
+                json.dumps(video_analysis),
+                json.dumps(face_tracking),
+                json.dumps(audio_analysis) if audio_analysis is not None else None,
             )
+            if checkpointed:
+                await conn.execute(
+                    "DELETE FROM analysis_checkpoints WHERE analysis_id = $1",
+                    analysis_id,
+                )
+
+    async def _store_frame_windows(
+        self, conn, analysis_id: str, frame_results: FrameResults
+    ) -> None:
+        """Upsert per-frame results as fixed time windows on an open connection."""
+        await conn.executemany(
+            """
+            INSERT INTO analysis_frame_results (
+                analysis_id, window_index, start_ts, end_ts, timestamps, ai_probabilities
+            ) VALUES ($1, $2, $3, $4, $5, $6)
+            ON CONFLICT (analysis_id, window_index) DO UPDATE
+            SET start_ts = EXCLUDED.start_ts, end_ts = EXCLUDED.end_ts,
+                timestamps = EXCLUDED.timestamps,
+                ai_probabilities = EXCLUDED.ai_probabilities
             """,
-            analysis_id,
-            verdict,
-            confidence,
-            risk_level,
-            summary,
-            json.dumps(detections),
-            confidence,
-            json.dumps(video_analysis),
+            [
+                (analysis_id, *window)
+                for window in frame_results.windows(FRAME_WINDOW_SECONDS)
+            ],
         )
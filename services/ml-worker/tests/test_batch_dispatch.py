@@ -0,0 +1,125 @@
+"""Tests for dispatching batch messages to the per-type queues."""
+
+import json
+
+import pytest
+from aio_pika.message import ProcessContext
+
+from src.config import settings
+from src.main import MLWorker
+
+BATCH_ID = "batch-1"
+
+
+class FakeMessage:
+    """Acks and rejects the way aio_pika's IncomingMessage.process() does."""
+
+    def __init__(self, body):
+        self.body = json.dumps(body).encode()
+        self.redelivered = False
+        self.processed = False
+        self.acked = False
+        self.requeued = None
+
+    def process(self, requeue=False, reject_on_redelivered=False, ignore_processed=False):
+        return ProcessContext(
+            self,
+            requeue=requeue,
+            reject_on_redelivered=reject_on_redelivered,
+            ignore_processed=ignore_processed,
+        )
+
+    async def ack(self):
+        self.processed = self.acked = True
+
+    async def reject(self, requeue=False):
+        self.processed = True
+        self.requeued = requeue
+
+
+class FakeDatabase:
+    def __init__(self, status="pending"):
+        self.status = status
+
+    async def fetchval(self, query, *args):
+        return self.status
+
+    async def execute(self, query, *args):
+        self.status = "processing"
+
+
+class FakeExchange:
+    def __init__(self, fail_after=None):
+        self.published = []
+        self.fail_after = fail_after
+
+    async def publish(self, message, routing_key):
+        if self.fail_after is not None and len(self.published) >= self.fail_after:
+            raise ConnectionError("channel closed")
+        self.published.append((routing_key, json.loads(message.body), message.priority))
+
+
+class FakeChannel:
+    def __init__(self, exchange):
+        self.default_exchange = exchange
+
+
+def batch_message(*types):
+    items = [
+        {"analysis_id": f"a{i}", "type": type_, "file_key": f"k{i}", "priority": 3}
+        for i, type_ in enumerate(types)
+    ]
+    return FakeMessage({"batch_id": BATCH_ID, "items": items})
+
+
+@pytest.fixture
+def worker():
+    worker = MLWorker()
+    worker.db = FakeDatabase()
+    worker.channel = FakeChannel(FakeExchange())
+    return worker
+
+
+async def test_publishes_each_item_then_marks_processing(worker):
+    message = batch_message("image", "video")
+
+    await worker._process_batch_job(message)
+
+    published = worker.channel.default_exchange.published
+    assert [(queue, job["analysis_id"], priority) for queue, job, priority in published] == [
+        (settings.queue_image_analysis, "a0", 3),
+        (settings.queue_video_analysis, "a1", 3),
+    ]
+    assert worker.db.status == "processing"
+    assert message.acked
+
+
+async def test_skips_batches_already_dispatched(worker):
+    worker.db.status = "processing"
+    message = batch_message("image")
+
+    await worker._process_batch_job(message)
+
+    assert worker.channel.default_exchange.published == []
+    assert message.acked
+
+
+async def test_publish_failure_requeues_the_message(worker):
+    worker.channel = FakeChannel(FakeExchange(fail_after=1))
+    message = batch_message("image", "video")
+
+    with pytest.raises(ConnectionError):
+        await worker._process_batch_job(message)
+
+    assert message.requeued is True
+    assert not message.acked
+    assert worker.db.status == "pending"
+
+
+async def test_malformed_message_is_dropped(worker):
+    message = FakeMessage({"items": []})
+
+    await worker._process_batch_job(message)
+
+    assert message.acked
+    assert worker.channel.default_exchange.published == []
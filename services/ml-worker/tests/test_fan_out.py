@@ -0,0 +1,164 @@
+"""Tests for sharded video jobs: chunk retries and the final join."""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+from src.config import settings
+from src.video.downloader import VideoInfo
+from src.video.profiles import get_profile
+from src.video.workspace import WorkspaceManager
+from src.workers.video_worker import VideoWorker
+
+ANALYSIS_ID = "analysis-1"
+AUDIO = {"synthetic_probability": 0.8, "suspicious_segments": [{"start": 0, "end": 4}]}
+
+
+class FakeDatabase:
+    """Answers the fan-out queries from canned rows."""
+
+    def __init__(self, claim=None, counts=None):
+        self.claim = claim
+        self.counts = counts
+        self.audio_stored = None
+        self.chunk_owner = settings.worker_id
+        self.chunk_attempts = 1
+
+    async def fetchval(self, query, *args):
+        if "SET status = 'pending'" in query:
+            return self.chunk_attempts if args[2] == self.chunk_owner else None
+        return None
+
+    async def fetchrow(self, query, *args):
+        if "SET finalized_at" in query:
+            return self.claim
+        if "SET audio_analysis" in query:
+            self.audio_stored = args[1]
+            return self.counts
+        return {"id": args[0]}
+
+    async def fetch(self, query, *args):
+        return []
+
+
+class FakeStatusStore:
+    async def publish(self, row):
+        pass
+
+
+def video_info():
+    return VideoInfo(
+        video_id="abc",
+        title="Test",
+        duration_seconds=180,
+        file_path="/tmp/video.mp4",
+        file_size_bytes=1000,
+        resolution="640x360",
+        fps=30,
+    )
+
+
+@pytest.fixture
+def worker(tmp_path):
+    workspaces = WorkspaceManager(root=str(tmp_path), quota_bytes=1, wait_seconds=0)
+    return VideoWorker(
+        FakeDatabase(),
+        image_detector=None,
+        workspaces=workspaces,
+        long_workspaces=workspaces,
+        audio_analyzer=object(),
+        status_store=FakeStatusStore(),
+    )
+
+
+@pytest.fixture
+def finalized(worker, monkeypatch):
+    calls = []
+
+    async def finalize(analysis_id, profile):
+        calls.append(analysis_id)
+
+    monkeypatch.setattr(worker, "_finalize_fan_out", finalize)
+    return calls
+
+
+async def test_audio_result_finalizes_once_every_chunk_is_in(worker, finalized):
+    worker.db.counts = {"completed_chunks": 3, "total_chunks": 3}
+
+    await worker._complete_fan_out_audio(ANALYSIS_ID, get_profile(None), AUDIO)
+
+    assert json.loads(worker.db.audio_stored) == AUDIO
+    assert finalized == [ANALYSIS_ID]
+
+
+async def test_audio_result_leaves_finalizing_to_the_last_chunk(worker, finalized):
+    worker.db.counts = {"completed_chunks": 1, "total_chunks": 3}
+
+    await worker._complete_fan_out_audio(ANALYSIS_ID, get_profile(None), None)
+
+    assert worker.db.audio_stored is None
+    assert finalized == []
+
+
+@pytest.fixture
+def aggregated(worker, monkeypatch):
+    calls = []
+
+    async def aggregate(analysis_id, video_info, frame_results, face_results, profile, **kwargs):
+        calls.append((analysis_id, kwargs.get("audio_analysis")))
+
+    monkeypatch.setattr(worker, "_aggregate_and_store_results", aggregate)
+    return calls
+
+
+async def test_finalize_passes_the_stored_audio_result(worker, aggregated):
+    worker.db.claim = {
+        "video_info": json.dumps(asdict(video_info())),
+        "audio_analysis": json.dumps(AUDIO),
+    }
+
+    await worker._finalize_fan_out(ANALYSIS_ID, get_profile(None))
+
+    assert aggregated == [(ANALYSIS_ID, AUDIO)]
+
+
+async def test_finalize_without_audio(worker, aggregated):
+    worker.db.claim = {"video_info": json.dumps(asdict(video_info())), "audio_analysis": None}
+
+    await worker._finalize_fan_out(ANALYSIS_ID, get_profile(None))
+
+    assert aggregated == [(ANALYSIS_ID, None)]
+
+
+async def test_finalize_skips_when_another_worker_claimed_it(worker, aggregated):
+    await worker._finalize_fan_out(ANALYSIS_ID, get_profile(None))
+
+    assert aggregated == []
+
+
+@pytest.fixture
+def published(worker, monkeypatch):
+    jobs = []
+
+    async def publish_chunk(job):
+        jobs.append(job)
+
+    monkeypatch.setattr(worker, "_publish_chunk", publish_chunk)
+    return jobs
+
+
+async def test_failed_chunk_is_republished_by_its_owner(worker, published):
+    job = {"analysis_id": ANALYSIS_ID, "chunk_index": 2}
+
+    await worker._fail_chunk(job, RuntimeError("decode failed"))
+
+    assert published == [job]
+
+
+async def test_failed_chunk_is_left_to_a_newer_copy(worker, published):
+    worker.db.chunk_owner = "other-worker"
+
+    await worker._fail_chunk({"analysis_id": ANALYSIS_ID, "chunk_index": 2}, RuntimeError())
+
+    assert published == []
@@ -0,0 +1,114 @@
+"""Tests for media cache eviction, staging cleanup and fill locking."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.media_cache import MediaCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MediaCache(root=str(tmp_path), max_bytes=100)
+
+
+def set_last_used(cache, key, when):
+    data_path, _ = cache._paths(key)
+    os.utime(data_path, (when, when))
+
+
+async def test_round_trip(cache, tmp_path):
+    await cache.put_bytes("a", b"x" * 10, {"fps": 30})
+    source = tmp_path / "video.mp4"
+    source.write_bytes(b"y" * 20)
+    await cache.put_file("b", str(source), {"duration_seconds": 12})
+
+    dest = tmp_path / "copy.mp4"
+    assert await cache.get_bytes("a") == b"x" * 10
+    assert await cache.get_file("b", str(dest)) == {"duration_seconds": 12}
+    assert dest.read_bytes() == b"y" * 20
+    assert await cache.get_bytes("missing") is None
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+async def test_evicts_least_recently_used_over_budget(cache):
+    await cache.put_bytes("a", b"a" * 40)
+    await cache.put_bytes("b", b"b" * 40)
+    set_last_used(cache, "a", 1000)
+    set_last_used(cache, "b", 2000)
+
+    # Reading a makes b the least recently used
+    assert await cache.get_bytes("a") is not None
+    await cache.put_bytes("c", b"c" * 40)
+
+    assert await cache.get_bytes("b") is None
+    assert await cache.get_bytes("a") is not None
+    assert await cache.get_bytes("c") is not None
+    assert cache.evictions == 1
+
+
+async def test_eviction_removes_metadata_sidecar(cache):
+    await cache.put_bytes("a", b"a" * 60, {"fps": 30})
+    set_last_used(cache, "a", 1000)
+
+    await cache.put_bytes("b", b"b" * 60)
+
+    _, meta_path = cache._paths("a")
+    assert not os.path.exists(meta_path)
+
+
+async def test_new_entry_is_never_the_victim(cache):
+    await cache.put_bytes("a", b"a" * 60)
+    set_last_used(cache, "a", time.time() + 3600)
+
+    await cache.put_bytes("b", b"b" * 90)
+
+    assert await cache.get_bytes("b") is not None
+    assert await cache.get_bytes("a") is None
+
+
+async def test_entries_larger_than_the_budget_are_not_cached(cache):
+    await cache.put_bytes("big", b"x" * 101)
+
+    assert await cache.get_bytes("big") is None
+    assert os.listdir(cache.staging_dir) == []
+
+
+def test_construction_sweeps_stale_staging_files(cache):
+    stale = os.path.join(cache.staging_dir, "stale")
+    fresh = os.path.join(cache.staging_dir, "fresh")
+    for path in (stale, fresh):
+        with open(path, "wb") as f:
+            f.write(b"partial")
+    old = time.time() - MediaCache.STALE_STAGING_SECONDS - 60
+    os.utime(stale, (old, old))
+
+    MediaCache(root=cache.root, max_bytes=cache.max_bytes)
+
+    assert os.listdir(cache.staging_dir) == ["fresh"]
+
+
+async def test_fill_lock_serializes_fills_of_one_key(cache):
+    events = []
+
+    async def fill(name):
+        async with cache.fill_lock("video"):
+            events.append(f"{name} start")
+            await asyncio.sleep(0.05)
+            events.append(f"{name} end")
+
+    await asyncio.gather(fill("first"), fill("second"))
+
+    assert events == ["first start", "first end", "second start", "second end"]
+
+
+async def test_fill_locks_of_different_keys_are_independent(cache):
+    async with cache.fill_lock("one"):
+        await asyncio.wait_for(_enter(cache, "two"), timeout=1)
+
+
+async def _enter(cache, key):
+    async with cache.fill_lock(key):
+        pass